@@ -0,0 +1,172 @@
+from __future__ import unicode_literals
+
+
+class ResponseCache(object):
+    """
+    A cache of the responses selected for input statements.
+
+    Entries are keyed by the normalized text of the input statement and the
+    storage adapter's base query. The least recently used entry is discarded
+    when the cache is full, and entries expire after a fixed number of seconds.
+
+    The cache is registered as an index with the storage adapter. An entry is
+    discarded when a statement is saved in response to one of the statements
+    that the input was matched to, when its response is saved, or when any
+    of these statements is removed. A statement that is saved for the first
+    time can become a closer match to a cached input, so a time to live
+    should be set if responses need to reflect every change.
+
+    :param max_size: The greatest number of entries that are kept.
+    :type max_size: int
+
+    :param ttl: The number of seconds before an entry expires.
+                By default, entries do not expire.
+    :type ttl: float
+    """
+
+    def __init__(self, max_size=1000, ttl=None):
+        import threading
+        from collections import OrderedDict
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.lock = threading.RLock()
+
+        # Each key and its (expiry time, value, dependencies), from the least recently used
+        self.entries = OrderedDict()
+
+        # The keys of the entries that depend on each (kind, statement text) pair
+        self.dependents = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_key(self, statement, base_query=None):
+        """
+        Return the key for an input statement and a base query.
+        Case and repeated whitespace in the text of the statement are ignored.
+        """
+        import json
+
+        text = ' '.join(statement.text.split()).lower()
+
+        if base_query is None:
+            return (text, None, )
+
+        query = base_query.value() if hasattr(base_query, 'value') else base_query
+
+        return (text, json.dumps(query, sort_keys=True, default=str), )
+
+    def get(self, key):
+        """
+        Return the value cached for the key, or None if
+        no value is cached or the value has expired.
+        """
+        import time
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and entry[0] is not None and entry[0] <= time.time():
+                self._discard(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+            # Mark the entry as the most recently used
+            del self.entries[key]
+            self.entries[key] = entry
+
+            return entry[1]
+
+    def set(self, key, value, matched_texts=(), response_texts=()):
+        """
+        Cache a value for the key.
+
+        :param matched_texts: The text of the statements that the input was matched to.
+                              The value is discarded when a statement is saved in
+                              response to one of them.
+
+        :param response_texts: The text of the statements in the value. The value is
+                               discarded when one of them is saved.
+        """
+        import time
+
+        expiry_time = None
+        if self.ttl is not None:
+            expiry_time = time.time() + self.ttl
+
+        dependencies = set(('match', text, ) for text in matched_texts)
+        dependencies.update(('response', text, ) for text in response_texts)
+
+        with self.lock:
+            self._discard(key)
+
+            self.entries[key] = (expiry_time, value, dependencies, )
+
+            for dependency in dependencies:
+                self.dependents.setdefault(dependency, set()).add(key)
+
+            while len(self.entries) > self.max_size:
+                self._discard(next(iter(self.entries)))
+
+    def _discard(self, key):
+        entry = self.entries.pop(key, None)
+
+        if entry is not None:
+            for dependency in entry[2]:
+                keys = self.dependents.get(dependency)
+
+                if keys is not None:
+                    keys.discard(key)
+
+                    if not keys:
+                        del self.dependents[dependency]
+
+    def invalidate(self, dependencies):
+        """
+        Discard every entry that has any of the (kind, statement text) dependencies.
+        """
+        with self.lock:
+            for dependency in dependencies:
+                for key in list(self.dependents.get(dependency, ())):
+                    self._discard(key)
+
+    def clear(self):
+        """
+        Discard every entry. The hit and miss counts are kept.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.dependents = {}
+
+    def statement_updated(self, statement):
+        """
+        Called by the storage adapter when a statement has been saved.
+        """
+        dependencies = [('response', statement.text, )]
+        dependencies.extend(
+            ('match', response.text, ) for response in statement.in_response_to
+        )
+
+        self.invalidate(dependencies)
+
+    def statement_removed(self, statement_text):
+        """
+        Called by the storage adapter when a statement has been removed.
+        """
+        self.invalidate([('match', statement_text, ), ('response', statement_text, )])
+
+    def statements_cleared(self):
+        """
+        Called by the storage adapter when every statement has been removed.
+        """
+        self.clear()
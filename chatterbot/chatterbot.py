@@ -66,6 +66,30 @@ class ChatBot(object):
         self.default_session = self.conversation_sessions.new()
 
         self.logger = kwargs.get('logger', logging.getLogger(__name__))
+
+        # Save learned responses in the background if write behind is enabled
+        self.write_queue = None
+        if kwargs.get('write_behind', False):
+            from .queues import WriteBehindQueue
+
+            self.write_queue = WriteBehindQueue(
+                self.storage,
+                batch_size=kwargs.get('write_batch_size', 100),
+                flush_interval=kwargs.get('write_flush_interval', 1),
+                logger=self.logger
+            )
+
+        # Reuse the responses selected for repeated input if the response cache is enabled
+        self.response_cache = None
+        if kwargs.get('response_cache_size'):
+            from .cache import ResponseCache
+
+            self.response_cache = ResponseCache(
+                max_size=kwargs.get('response_cache_size'),
+                ttl=kwargs.get('response_cache_ttl')
+            )
+            self.storage.add_index(self.response_cache)
+
         self.initialize()
 
     def initialize(self):
@@ -114,16 +138,100 @@ class ChatBot(object):
             session = self.conversation_sessions.get_default()
             session_id = str(session.uuid)
 
-        self.storage.generate_base_query(self, session_id)
+        from .logic import MatchContext
 
-        # Select a response to the input statement
-        confidence, response = self.logic.process(input_statement)
+        # The base query of the session is kept on the context, so that
+        # responses generated at the same time do not use each other's query
+        context = MatchContext()
+
+        with context.activate():
+            self.storage.generate_base_query(self, session_id)
+            confidence, response = self.select_response(input_statement, context)
 
         return input_statement, response, confidence
 
-    def learn_response(self, statement, previous_statement):
+    def select_response(self, input_statement, context=None):
         """
-        Learn that the statement provided is a valid response.
+        Return the confidence and the response selected by the logic adapters
+        for the input statement, using the response cache if it is enabled.
+        """
+        from .logic import MatchContext
+
+        if context is None:
+            context = MatchContext()
+
+        if self.response_cache is None:
+            # Select a response to the input statement
+            return self.logic.process(input_statement, context)
+
+        with context.activate():
+            key = self.response_cache.get_key(input_statement, self.storage.base_query)
+
+        cached = self.response_cache.get(key)
+
+        if cached is not None:
+            return cached
+
+        confidence, response = self.logic.process(input_statement, context)
+
+        # A response with no confidence may have been selected at random, and
+        # adapters that are not deterministic may select another response
+        if confidence > 0 and context.deterministic:
+            self.response_cache.set(
+                key, (confidence, response, ),
+                matched_texts=context.matched_texts,
+                response_texts=[response.text]
+            )
+
+        return confidence, response
+
+    def aget_response(self, input_item, session_id=None):
+        """
+        Return an asyncio future for the bot's response to the input.
+
+        The input adapter and the logic adapters are run in the event loop's default
+        executor, because they read from the storage adapter and may compare the input
+        to every known statement. The learned response is saved with the storage
+        adapter's :code:`aupdate` method.
+
+        :param input_item: An input value.
+        :returns: A future for the response to the input.
+        :rtype: asyncio.Future
+        """
+        from .utils import chain_future
+
+        if not session_id:
+            session_id = str(self.default_session.uuid)
+
+        def generate():
+            input_statement = self.input.process_input_statement(input_item)
+
+            return self.generate_response(input_statement, session_id)
+
+        def learn(result):
+            statement, response, confidence = result
+
+            # Learn that the user's input was a valid response to the chat bot's previous output
+            previous_statement = self.conversation_sessions.get(
+                session_id
+            ).conversation.get_last_response_statement()
+
+            def respond(saved_statement):
+                self.conversation_sessions.update(session_id, (statement, response, ))
+
+                # Process the response output with the output adapter
+                return self.output.process_response(response, confidence, session_id)
+
+            return chain_future(self.alearn_response(statement, previous_statement), respond)
+
+        return chain_future(
+            self.storage.run_async(generate),
+            learn
+        )
+
+    def add_previous_response(self, statement, previous_statement):
+        """
+        Add the previous statement as a response to the statement.
         """
         from .conversation import Response
 
@@ -136,8 +244,44 @@ class ChatBot(object):
                 previous_statement.text
             ))
 
+    def learn_response(self, statement, previous_statement):
+        """
+        Learn that the statement provided is a valid response.
+        """
+        self.add_previous_response(statement, previous_statement)
+
         # Update the database after selecting a response
-        self.storage.update(statement)
+        if self.write_queue is not None:
+            self.write_queue.put(statement)
+        else:
+            self.storage.update(statement)
+
+    def alearn_response(self, statement, previous_statement):
+        """
+        Learn that the statement provided is a valid response, and return
+        an asyncio future that is done when the statement has been saved.
+        """
+        import asyncio
+
+        self.add_previous_response(statement, previous_statement)
+
+        if self.write_queue is None:
+            return self.storage.aupdate(statement)
+
+        # The write behind queue saves the statement in its own thread
+        self.write_queue.put(statement)
+
+        result = asyncio.Future(loop=asyncio.get_event_loop())
+        result.set_result(statement)
+
+        return result
+
+    def flush(self):
+        """
+        Save any learned responses that are waiting to be saved.
+        """
+        if self.write_queue is not None:
+            self.write_queue.flush()
 
     def set_trainer(self, training_class, **kwargs):
         """
@@ -3,10 +3,123 @@
 """
 This module contains various text-comparison algorithms
 designed to compare one statement to another.
+
+Each comparison can be called with two statements, and also provides a
+:code:`compare_many` method that compares one statement to a list of
+other statements. Work that only depends on the first statement is done
+once for the whole list rather than once for each pair.
 """
+import sys
+
+
+class Comparator(object):
+    """
+    A base class for statement comparisons.
+    Subclasses must implement the :code:`compare` method.
+
+    Comparisons that need to process the text of each statement, such as
+    by tokenizing it, can implement :code:`compute_features`. The features
+    of each known statement are cached by text, and are computed as statements
+    are saved when the comparison is registered with a storage adapter.
+    The features of input statements are not cached, so the cache does
+    not grow with each new input.
+    """
+
+    # Set to True in subclasses that implement compute_features
+    precompute_features = False
+
+    def __init__(self):
+        self.features = {}
+
+    def __call__(self, statement, other_statement):
+        return self.compare(statement, other_statement)
+
+    def __getstate__(self):
+        """
+        Return the state of the comparison without any cached values,
+        so that only its settings are sent to other processes.
+        """
+        state = self.__dict__.copy()
+        state['features'] = {}
+        return state
+
+    def compute_features(self, text):
+        """
+        Return the features of a string of text that are used to compare it.
+        """
+        return text
+
+    def get_features(self, statement):
+        """
+        Return the features of a statement, computing
+        them if they have not already been cached.
+        """
+        features = self.features.get(statement.text)
+
+        if features is None:
+            features = self.compute_features(statement.text)
+            self.features[statement.text] = features
+
+        return features
+
+    def get_input_features(self, statement):
+        """
+        Return the features of an input statement. The features are computed
+        without being cached unless the statement is a known statement.
+        """
+        features = self.features.get(statement.text)
+
+        if features is None:
+            features = self.compute_features(statement.text)
+
+        return features
+
+    def statement_updated(self, statement):
+        """
+        Called by the storage adapter when a statement has been saved.
+        The features of the statement and each of its responses are computed
+        now so that they do not need to be computed when it is compared.
+        """
+        if self.precompute_features:
+            from chatterbot.conversation import Statement
+
+            self.get_features(statement)
+
+            for response in statement.in_response_to:
+                self.get_features(Statement(response.text))
+
+    def statement_removed(self, statement_text):
+        """
+        Called by the storage adapter when a statement has been removed.
+        """
+        self.features.pop(statement_text, None)
+
+    def statements_cleared(self):
+        """
+        Called by the storage adapter when every statement has been removed.
+        """
+        self.features = {}
+
+    def compare(self, statement, other_statement):
+        """
+        Return the similarity of two statements as a value between 0 and 1.
+        """
+        return 0
+
+    def compare_many(self, statement, other_statements):
+        """
+        Return a list of the similarity between the statement
+        and each statement in the list of other statements.
+
+        :rtype: list
+        """
+        return [
+            self.compare(statement, other_statement)
+            for other_statement in other_statements
+        ]
 
 
-def levenshtein_distance(statement, other_statement):
+class LevenshteinDistance(Comparator):
     """
     Compare two statements based on the Levenshtein distance
     of each statement's text.
@@ -18,41 +131,98 @@ def levenshtein_distance(statement, other_statement):
     :return: The percent of similarity between the text of the statements.
     :rtype: float
     """
-    import sys
 
-    # Use python-Levenshtein if available
-    try:
-        from Levenshtein.StringMatcher import StringMatcher as SequenceMatcher
-    except ImportError:
-        from difflib import SequenceMatcher
+    def __init__(self):
+        super(LevenshteinDistance, self).__init__()
+
+        # Use python-Levenshtein if available
+        try:
+            from Levenshtein.StringMatcher import StringMatcher as SequenceMatcher
+        except ImportError:
+            from difflib import SequenceMatcher
+
+        self.SequenceMatcher = SequenceMatcher
+
+    def get_text(self, statement):
+        """
+        Return the lowercase version of the text of a statement.
+        """
+        if sys.version_info[0] < 3:
+            return unicode(statement.text.lower())
 
-    PYTHON = sys.version_info[0]
+        return str(statement.text.lower())
+
+    def compare(self, statement, other_statement):
+        return self.compare_many(statement, [other_statement])[0]
+
+    def compare_many(self, statement, other_statements):
+        # Return 0 if the statement has a falsy text value
+        if not statement.text:
+            return [0] * len(other_statements)
+
+        similarity = self.SequenceMatcher(None, self.get_text(statement), '')
+
+        results = []
+        for other_statement in other_statements:
+            if not other_statement.text:
+                results.append(0)
+                continue
+
+            similarity.set_seq2(self.get_text(other_statement))
+
+            # Calculate a decimal percent of the similarity
+            results.append(int(round(100 * similarity.ratio())) / 100.0)
+
+        return results
+
+    def upper_bound(self, statement, other_statement):
+        """
+        See :code:`levenshtein_upper_bound`.
+        """
+        return levenshtein_upper_bound(statement, other_statement)
+
+
+def levenshtein_upper_bound(statement, other_statement):
+    """
+    Return the greatest value that :code:`levenshtein_distance` could
+    return for two statements without computing the distance itself.
 
-    # Return 0 if either statement has a falsy text value
-    if not statement.text or not statement.text:
+    The number of matching characters between the two strings can be
+    no greater than the number of characters that the strings have in
+    common, which in turn can be no greater than the length of the
+    shorter string.
+
+    :return: The maximum possible percent of similarity between the text of the statements.
+    :rtype: float
+    """
+    from collections import Counter
+
+    if not statement.text or not other_statement.text:
         return 0
 
-    # Get the lowercase version of both strings
-    if PYTHON < 3:
-        statement_text = unicode(statement.text.lower())
-        other_statement_text = unicode(other_statement.text.lower())
-    else:
-        statement_text = str(statement.text.lower())
-        other_statement_text = str(other_statement.text.lower())
+    statement_text = statement.text.lower()
+    other_statement_text = other_statement.text.lower()
 
-    similarity = SequenceMatcher(
-        None,
-        statement_text,
-        other_statement_text
-    )
+    common = Counter(statement_text) & Counter(other_statement_text)
+    total_length = len(statement_text) + len(other_statement_text)
 
-    # Calculate a decimal percent of the similarity
-    percent = int(round(100 * similarity.ratio())) / 100.0
+    bound = 2.0 * sum(common.values()) / total_length
 
-    return percent
+    return int(round(100 * bound)) / 100.0
 
 
-def synset_distance(statement, other_statement):
+def length_ratio_bound(length, other_length):
+    """
+    Return the greatest similarity ratio possible
+    between two strings with the given lengths.
+    """
+    if not length or not other_length:
+        return 0
+
+    return 2.0 * min(length, other_length) / (length + other_length)
+
+
+class SynsetDistance(Comparator):
     """
     Calculate the similarity of two statements.
     This is based on the total maximum synset similarity between each word in each sentence.
@@ -67,34 +237,56 @@ def synset_distance(statement, other_statement):
     .. _wordnet: http://www.nltk.org/howto/wordnet.html
     .. _NLTK: http://www.nltk.org/
     """
-    from nltk.corpus import wordnet
-    from nltk import word_tokenize
-    from chatterbot import utils
-    import itertools
 
-    tokens1 = word_tokenize(statement.text.lower())
-    tokens2 = word_tokenize(other_statement.text.lower())
+    precompute_features = True
+
+    def __init__(self):
+        super(SynsetDistance, self).__init__()
 
-    # Remove all stop words from the list of word tokens
-    tokens1 = utils.remove_stopwords(tokens1, language='english')
-    tokens2 = utils.remove_stopwords(tokens2, language='english')
+        # The synsets of each word that has been compared
+        self.synsets = {}
 
-    # The maximum possible similarity is an exact match
-    # Because path_similarity returns a value between 0 and 1,
-    # max_possible_similarity is the number of words in the longer
-    # of the two input statements.
-    max_possible_similarity = max(
-        len(statement.text.split()),
-        len(other_statement.text.split())
-    )
+    def __getstate__(self):
+        state = super(SynsetDistance, self).__getstate__()
+        state['synsets'] = {}
+        return state
 
-    max_similarity = 0.0
+    def compute_features(self, text):
+        """
+        Return the set of word tokens in the text that are not
+        stop words, and the number of words in the text.
+        """
+        from nltk import word_tokenize
+        from chatterbot import utils
 
-    # Get the highest matching value for each possible combination of words
-    for combination in itertools.product(*[tokens1, tokens2]):
+        tokens = word_tokenize(text.lower())
 
-        synset1 = wordnet.synsets(combination[0])
-        synset2 = wordnet.synsets(combination[1])
+        # Remove all stop words from the list of word tokens
+        tokens = utils.remove_stopwords(tokens, language='english')
+
+        return tokens, len(text.split())
+
+    def get_synsets(self, token):
+        """
+        Return the wordnet synsets for a word token.
+        """
+        from nltk.corpus import wordnet
+
+        if token not in self.synsets:
+            self.synsets[token] = wordnet.synsets(token)
+
+        return self.synsets[token]
+
+    def get_token_similarity(self, token, other_token):
+        """
+        Return the highest path similarity between the synsets of two word tokens.
+        """
+        import itertools
+
+        max_similarity = 0.0
+
+        synset1 = self.get_synsets(token)
+        synset2 = self.get_synsets(other_token)
 
         if synset1 and synset2:
 
@@ -105,13 +297,49 @@ def synset_distance(statement, other_statement):
                 if similarity and (similarity > max_similarity):
                     max_similarity = similarity
 
-    if max_possible_similarity == 0:
-        return 0
+        return max_similarity
+
+    def compare(self, statement, other_statement):
+        return self.compare_many(statement, [other_statement])[0]
+
+    def compare_many(self, statement, other_statements):
+        import itertools
+
+        tokens1, word_count = self.get_input_features(statement)
 
-    return max_similarity / max_possible_similarity
+        # The similarity of each pair of tokens, which often
+        # occur in more than one of the other statements
+        token_similarities = {}
 
+        results = []
+        for other_statement in other_statements:
+            tokens2, other_word_count = self.get_features(other_statement)
 
-def sentiment_comparison(statement, other_statement):
+            # The maximum possible similarity is an exact match
+            # Because path_similarity returns a value between 0 and 1,
+            # max_possible_similarity is the number of words in the longer
+            # of the two input statements.
+            max_possible_similarity = max(word_count, other_word_count)
+
+            max_similarity = 0.0
+
+            # Get the highest matching value for each possible combination of words
+            for combination in itertools.product(*[tokens1, tokens2]):
+                if combination not in token_similarities:
+                    token_similarities[combination] = self.get_token_similarity(*combination)
+
+                if token_similarities[combination] > max_similarity:
+                    max_similarity = token_similarities[combination]
+
+            if max_possible_similarity == 0:
+                results.append(0)
+            else:
+                results.append(max_similarity / max_possible_similarity)
+
+        return results
+
+
+class SentimentComparison(Comparator):
     """
     Calculate the similarity of two statements based on the closeness of
     the sentiment value calculated for each statement.
@@ -119,36 +347,64 @@ def sentiment_comparison(statement, other_statement):
     :return: The percent of similarity between the sentiment value.
     :rtype: float
     """
-    from nltk.sentiment.vader import SentimentIntensityAnalyzer
-
-    sentiment_analyzer = SentimentIntensityAnalyzer()
-    statement_polarity = sentiment_analyzer.polarity_scores(statement.text.lower())
-    statement2_polarity = sentiment_analyzer.polarity_scores(other_statement.text.lower())
-
-    statement_greatest_polarity = 'neu'
-    statement_greatest_score = -1
-    for polarity in sorted(statement_polarity):
-        if statement_polarity[polarity] > statement_greatest_score:
-            statement_greatest_polarity = polarity
-            statement_greatest_score = statement_polarity[polarity]
-
-    statement2_greatest_polarity = 'neu'
-    statement2_greatest_score = -1
-    for polarity in sorted(statement2_polarity):
-        if statement2_polarity[polarity] > statement2_greatest_score:
-            statement2_greatest_polarity = polarity
-            statement2_greatest_score = statement2_polarity[polarity]
-
-    # Check if the polarity if of a different type
-    if statement_greatest_polarity != statement2_greatest_polarity:
-        return 0
 
-    values = [statement_greatest_score, statement2_greatest_score]
-    difference = max(values) - min(values)
+    precompute_features = True
+
+    def __init__(self):
+        super(SentimentComparison, self).__init__()
+        self.sentiment_analyzer = None
+
+    def __getstate__(self):
+        state = super(SentimentComparison, self).__getstate__()
+        state['sentiment_analyzer'] = None
+        return state
+
+    def compute_features(self, text):
+        """
+        Return the polarity with the greatest score for
+        the text, and the value of that score.
+        """
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+        # The analyzer loads its lexicon when it is created, so it is only created once
+        if self.sentiment_analyzer is None:
+            self.sentiment_analyzer = SentimentIntensityAnalyzer()
+
+        polarity_scores = self.sentiment_analyzer.polarity_scores(text.lower())
+
+        greatest_polarity = 'neu'
+        greatest_score = -1
+        for polarity in sorted(polarity_scores):
+            if polarity_scores[polarity] > greatest_score:
+                greatest_polarity = polarity
+                greatest_score = polarity_scores[polarity]
+
+        return greatest_polarity, greatest_score
+
+    def compare(self, statement, other_statement):
+        return self.compare_many(statement, [other_statement])[0]
+
+    def compare_many(self, statement, other_statements):
+        statement_greatest_polarity, statement_greatest_score = self.get_input_features(statement)
+
+        results = []
+        for other_statement in other_statements:
+            statement2_greatest_polarity, statement2_greatest_score = self.get_features(other_statement)
+
+            # Check if the polarity if of a different type
+            if statement_greatest_polarity != statement2_greatest_polarity:
+                results.append(0)
+                continue
+
+            values = [statement_greatest_score, statement2_greatest_score]
+            difference = max(values) - min(values)
+
+            results.append(1.0 - difference)
+
+        return results
 
-    return 1.0 - difference
 
-def jaccard_similarity(statement, other_statement, threshold=0.5):
+class JaccardSimilarity(Comparator):
     """
     Calculates the similarity of two statements based on the Jaccard index.
 
@@ -173,42 +429,88 @@ def jaccard_similarity(statement, other_statement, threshold=0.5):
 
     .. _`Jaccard similarity index`: https://en.wikipedia.org/wiki/Jaccard_index
     """
-    from nltk.corpus import wordnet
-    import nltk
-    import string
-
-    a = statement.text.lower()
-    b = other_statement.text.lower()
-
-    # Get default English stopwords and extend with punctuation
-    stopwords = nltk.corpus.stopwords.words('english')
-    stopwords.extend(string.punctuation)
-    stopwords.append('')
-    lemmatizer = nltk.stem.wordnet.WordNetLemmatizer()
-
-    def get_wordnet_pos(pos_tag):
-        if pos_tag[1].startswith('J'):
-            return (pos_tag[0], wordnet.ADJ)
-        elif pos_tag[1].startswith('V'):
-            return (pos_tag[0], wordnet.VERB)
-        elif pos_tag[1].startswith('N'):
-            return (pos_tag[0], wordnet.NOUN)
-        elif pos_tag[1].startswith('R'):
-            return (pos_tag[0], wordnet.ADV)
-        else:
-            return (pos_tag[0], wordnet.NOUN)
-
-    ratio = 0
-    pos_a = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(a)))
-    pos_b = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(b)))
-    lemmae_a = [lemmatizer.lemmatize(token.strip(string.punctuation), pos) for token, pos in pos_a \
-                    if pos == wordnet.NOUN and token.strip(string.punctuation) not in stopwords]
-    lemmae_b = [lemmatizer.lemmatize(token.strip(string.punctuation), pos) for token, pos in pos_b \
-                    if pos == wordnet.NOUN and token.strip(string.punctuation) not in stopwords]
-
-    # Calculate Jaccard similarity
-    try:
-        ratio = len(set(lemmae_a).intersection(lemmae_b)) / float(len(set(lemmae_a).union(lemmae_b)))
-    except Exception as e:
-        print('Error', e)
-    return ratio >= threshold
+
+    precompute_features = True
+
+    def __init__(self, threshold=0.5):
+        super(JaccardSimilarity, self).__init__()
+        self.threshold = threshold
+        self.stopwords = None
+        self.lemmatizer = None
+
+    def __getstate__(self):
+        state = super(JaccardSimilarity, self).__getstate__()
+        state['stopwords'] = None
+        state['lemmatizer'] = None
+        return state
+
+    def __call__(self, statement, other_statement, threshold=None):
+        return self.compare_many(statement, [other_statement], threshold=threshold)[0]
+
+    def compute_features(self, text):
+        """
+        Return the set of lemmas of the nouns in the text that are not stop words.
+        """
+        from nltk.corpus import wordnet
+        import nltk
+        import string
+
+        if self.stopwords is None:
+            # Get default English stopwords and extend with punctuation
+            self.stopwords = nltk.corpus.stopwords.words('english')
+            self.stopwords.extend(string.punctuation)
+            self.stopwords.append('')
+            self.lemmatizer = nltk.stem.wordnet.WordNetLemmatizer()
+
+        def get_wordnet_pos(pos_tag):
+            if pos_tag[1].startswith('J'):
+                return (pos_tag[0], wordnet.ADJ)
+            elif pos_tag[1].startswith('V'):
+                return (pos_tag[0], wordnet.VERB)
+            elif pos_tag[1].startswith('N'):
+                return (pos_tag[0], wordnet.NOUN)
+            elif pos_tag[1].startswith('R'):
+                return (pos_tag[0], wordnet.ADV)
+            else:
+                return (pos_tag[0], wordnet.NOUN)
+
+        pos = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(text.lower())))
+
+        return set([
+            self.lemmatizer.lemmatize(token.strip(string.punctuation), pos) for token, pos in pos
+            if pos == wordnet.NOUN and token.strip(string.punctuation) not in self.stopwords
+        ])
+
+    def compare(self, statement, other_statement):
+        return self.compare_many(statement, [other_statement])[0]
+
+    def compare_many(self, statement, other_statements, threshold=None):
+        if threshold is None:
+            threshold = self.threshold
+
+        lemmae_a = self.get_input_features(statement)
+
+        results = []
+        for other_statement in other_statements:
+            lemmae_b = self.get_features(other_statement)
+
+            ratio = 0
+
+            # Calculate Jaccard similarity
+            try:
+                ratio = len(lemmae_a.intersection(lemmae_b)) / float(len(lemmae_a.union(lemmae_b)))
+            except Exception as e:
+                print('Error', e)
+
+            results.append(ratio >= threshold)
+
+        return results
+
+
+levenshtein_distance = LevenshteinDistance()
+
+synset_distance = SynsetDistance()
+
+sentiment_comparison = SentimentComparison()
+
+jaccard_similarity = JaccardSimilarity()
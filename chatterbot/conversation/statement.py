@@ -15,6 +15,9 @@ class Statement(object):
 
         self.extra_data.update(kwargs)
 
+        # The values of the statement when it was last saved to the database
+        self.saved_state = None
+
     def __str__(self):
         return self.text
 
@@ -107,6 +110,99 @@ class Statement(object):
 
         return 0
 
+    def mark_saved(self):
+        """
+        Record the current values of the statement as the values that are
+        saved in the database. Storage adapters call this method when a
+        statement is read from or saved to the database, so that changes
+        made to the statement after that can be found.
+        """
+        from copy import deepcopy
+        from collections import OrderedDict
+
+        self.saved_state = (
+            self.text,
+            deepcopy(self.extra_data),
+            OrderedDict(
+                (response.text, response.occurrence, ) for response in self.in_response_to
+            ),
+        )
+
+    def has_changes(self):
+        """
+        Check if the statement has changed since it was last saved.
+
+        :returns: True if the statement has not been saved, or if its text,
+                  extra data or responses have changed since it was saved.
+        :rtype: bool
+        """
+        if self.saved_state is None:
+            return True
+
+        text, extra_data, occurrences = self.saved_state
+
+        if self.text != text or self.extra_data != extra_data:
+            return True
+
+        if len(self.in_response_to) != len(occurrences):
+            return True
+
+        for response in self.in_response_to:
+            if occurrences.get(response.text) != response.occurrence:
+                return True
+
+        return False
+
+    def get_changes(self):
+        """
+        Find the changes made to the statement since it was last saved,
+        so that a storage adapter can save only the values that changed.
+
+        The dictionary contains:
+
+            - extra_data = True if the extra data has changed
+            - added_responses = The responses that have been added
+            - removed_responses = The text of the responses that have been removed
+            - occurrence_changes = A list of (response, difference) tuples for
+              each response with a changed occurrence count
+
+        :returns: A dictionary of changes, or None if the statement has not
+                  been saved or its text has changed.
+        :rtype: dict
+        """
+        if self.saved_state is None:
+            return None
+
+        text, extra_data, occurrences = self.saved_state
+
+        if self.text != text:
+            return None
+
+        changes = {
+            'extra_data': self.extra_data != extra_data,
+            'added_responses': [],
+            'removed_responses': [],
+            'occurrence_changes': []
+        }
+
+        response_texts = set()
+
+        for response in self.in_response_to:
+            response_texts.add(response.text)
+
+            if response.text not in occurrences:
+                changes['added_responses'].append(response)
+            elif response.occurrence != occurrences[response.text]:
+                changes['occurrence_changes'].append(
+                    (response, response.occurrence - occurrences[response.text], )
+                )
+
+        for response_text in occurrences:
+            if response_text not in response_texts:
+                changes['removed_responses'].append(response_text)
+
+        return changes
+
     def serialize(self):
         """
         :returns: A dictionary representation of the statement object.
@@ -0,0 +1,826 @@
+"""
+Statement indexes narrow down the set of known statements that a logic
+adapter needs to compare an input statement against.
+
+An index contains the statements that have known responses. It is built
+from the storage adapter the first time it is used and is then kept up to
+date by the storage adapter as statements are updated and removed.
+"""
+import re
+from collections import Counter, defaultdict
+
+
+def tokenize(text):
+    """
+    Split a string of text into a list of lowercase word tokens.
+    """
+    return re.findall(r'\w+', text.lower(), re.UNICODE)
+
+
+def shingles(text, size=1):
+    """
+    Return the set of word shingles of the given size in a string of text.
+    Text with fewer words than the shingle size is a single shingle.
+    """
+    tokens = tokenize(text)
+
+    if len(tokens) <= size:
+        return set([' '.join(tokens)]) if tokens else set()
+
+    return set(
+        ' '.join(tokens[index:index + size]) for index in range(len(tokens) - size + 1)
+    )
+
+
+def trigrams(text):
+    """
+    Return the set of lowercase character trigrams in a string of text.
+    """
+    padded_text = '  {} '.format(text.lower())
+
+    return set(
+        padded_text[index:index + 3] for index in range(len(padded_text) - 2)
+    )
+
+
+class ResponseLinks(object):
+    """
+    The texts of the statements that each statement is in response to, and
+    of the statements that are in response to each statement. An index uses
+    these to find the statements that no longer have a known response.
+
+    :param statement_list: Every statement in the database.
+    :type statement_list: list
+    """
+
+    def __init__(self, statement_list=()):
+        self.in_response_to = {}
+        self.responses = {}
+
+        for statement in statement_list:
+            self.update(statement)
+
+    def update(self, statement):
+        """
+        Record the responses of a saved statement, and return the texts
+        of the statements that are no longer in response to any statement.
+        """
+        response_texts = set(response.text for response in statement.in_response_to)
+        previous_response_texts = self.in_response_to.pop(statement.text, set())
+
+        for response_text in response_texts - previous_response_texts:
+            self.responses.setdefault(response_text, set()).add(statement.text)
+
+        if response_texts:
+            self.in_response_to[statement.text] = response_texts
+
+        return self.forget(statement.text, previous_response_texts - response_texts)
+
+    def remove(self, statement_text):
+        """
+        Forget a removed statement, and return the texts of the statements
+        that are no longer in response to any statement.
+        """
+        for response_statement_text in self.responses.pop(statement_text, ()):
+            response_texts = self.in_response_to.get(response_statement_text)
+
+            if response_texts is not None:
+                response_texts.discard(statement_text)
+
+        return self.forget(statement_text, self.in_response_to.pop(statement_text, ()))
+
+    def forget(self, statement_text, response_texts):
+        """
+        Forget that a statement is in response to each of the statements, and
+        return the texts of the statements that no other statement is in response to.
+        """
+        unanswered_texts = []
+
+        for response_text in response_texts:
+            statement_texts = self.responses.get(response_text)
+
+            if statement_texts is not None:
+                statement_texts.discard(statement_text)
+
+                if not statement_texts:
+                    del self.responses[response_text]
+                    unanswered_texts.append(response_text)
+
+        return unanswered_texts
+
+
+class StatementIndex(object):
+    """
+    A base index from which all other statement indexes should be subclassed.
+    """
+
+    def __init__(self, **kwargs):
+        import threading
+
+        # Guards the index while it is searched in one thread and
+        # updated by the storage adapter in another
+        self.lock = threading.RLock()
+
+        # Known statements with responses, keyed by their text
+        self.statements = {}
+
+        # The order in which each statement was added to the index
+        self.positions = {}
+        self.next_position = 0
+
+        self.response_links = ResponseLinks()
+
+        self.storage = None
+        self.built = False
+
+    def __len__(self):
+        return len(self.statements)
+
+    def __contains__(self, statement_text):
+        return statement_text in self.statements
+
+    def build(self, storage):
+        """
+        Populate the index with the statements from the storage adapter
+        that have known responses, and register the index so that the
+        storage adapter keeps it up to date.
+        """
+        with self.lock:
+            self.clear()
+            self.storage = storage
+
+            self.response_links = ResponseLinks(storage.filter())
+
+            for statement in storage.get_response_statements():
+                self.add(statement)
+
+            storage.add_index(self)
+            self.built = True
+
+    def clear(self):
+        """
+        Remove all statements from the index.
+        """
+        with self.lock:
+            self.statements = {}
+            self.positions = {}
+            self.next_position = 0
+            self.response_links = ResponseLinks()
+
+    def get_parameters(self):
+        """
+        Return the settings that change the contents of the index.
+        A saved index is only loaded if its parameters are the same.
+        """
+        return ()
+
+    def save(self, file_path):
+        """
+        Save the contents of the index to a file.
+        """
+        import os
+        import pickle
+
+        data = self.__dict__.copy()
+        del data['storage']
+        del data['built']
+        del data['lock']
+
+        data['class'] = self.__class__.__name__
+        data['parameters'] = self.get_parameters()
+        data['statement_count'] = self.storage.count() if self.storage else None
+
+        temporary_file_path = file_path + '.tmp'
+        with self.lock, open(temporary_file_path, 'wb') as index_file:
+
+            # Only the text is saved, statements are loaded from storage when needed
+            data['statements'] = dict.fromkeys(self.statements)
+
+            pickle.dump(data, index_file, protocol=2)
+
+        # Replace the previous file only once the new one is complete
+        getattr(os, 'replace', os.rename)(temporary_file_path, file_path)
+
+    def load(self, file_path, storage):
+        """
+        Load the contents of the index from a file and register the index
+        with the storage adapter. An index is not loaded if it was saved
+        with different parameters or when the number of statements in the
+        database has changed since it was saved.
+
+        :returns: True if the index was loaded.
+        :rtype: bool
+        """
+        import os
+        import pickle
+
+        if not os.path.exists(file_path):
+            return False
+
+        with open(file_path, 'rb') as index_file:
+            data = pickle.load(index_file)
+
+        if data.pop('class') != self.__class__.__name__:
+            return False
+
+        if data.pop('parameters') != self.get_parameters():
+            return False
+
+        if data.pop('statement_count') != storage.count():
+            return False
+
+        with self.lock:
+            self.__dict__.update(data)
+            self.storage = storage
+
+            storage.add_index(self)
+            self.built = True
+
+        return True
+
+    def add(self, statement):
+        """
+        Add a statement to the index.
+        """
+        with self.lock:
+            if statement.text not in self.statements:
+                self.index_text(statement.text)
+                self.add_position(statement.text)
+
+            self.statements[statement.text] = statement
+
+    def remove(self, statement_text):
+        """
+        Remove the statement with the given text from the index.
+        """
+        with self.lock:
+            if statement_text in self.statements:
+                del self.statements[statement_text]
+                self.positions.pop(statement_text, None)
+                self.unindex_text(statement_text)
+
+    def add_position(self, statement_text):
+        self.positions[statement_text] = self.next_position
+        self.next_position += 1
+
+    def get_position(self, statement):
+        """
+        Return the order in which the statement was added to the index.
+        Statements are added in the order the storage adapter returns them
+        when the index is built, and new statements are added after them.
+        """
+        return self.positions.get(statement.text, self.next_position)
+
+    def index_text(self, statement_text):
+        """
+        Override this method to add the text of a statement to the index.
+        """
+        pass
+
+    def unindex_text(self, statement_text):
+        """
+        Override this method to remove the text of a statement from the index.
+        """
+        pass
+
+    def get_statement(self, statement_text):
+        """
+        Return the indexed statement with the given text.
+
+        Statements that were added to the index as a response to a saved
+        statement are only loaded from the storage adapter once they are needed.
+        """
+        from chatterbot.conversation import Statement
+
+        with self.lock:
+            statement = self.statements.get(statement_text)
+
+            if statement is None:
+                if self.storage:
+                    statement = self.storage.find(statement_text)
+
+                if statement is None:
+                    statement = Statement(statement_text)
+
+                self.statements[statement_text] = statement
+
+            return statement
+
+    def get_statements(self):
+        """
+        Return a list of every statement in the index.
+        """
+        with self.lock:
+            return [self.get_statement(text) for text in self.statements]
+
+    def candidates(self, statement):
+        """
+        Return a list of indexed statements that may be a close match
+        to the given statement. By default, every statement is returned.
+        """
+        return self.get_statements()
+
+    def statement_updated(self, statement):
+        """
+        Called by the storage adapter when a statement has been saved.
+        """
+        with self.lock:
+            if not self.built:
+                return
+
+            # Statements that the saved statement was the last response to
+            for statement_text in self.response_links.update(statement):
+                self.remove(statement_text)
+
+            if statement.text in self.statements:
+                self.statements[statement.text] = statement
+
+            # Every statement in the response list now has a known response
+            for response in statement.in_response_to:
+                if response.text not in self.statements:
+                    self.index_text(response.text)
+                    self.add_position(response.text)
+                    self.statements[response.text] = None
+
+    def statement_removed(self, statement_text):
+        """
+        Called by the storage adapter when a statement has been removed.
+        """
+        with self.lock:
+            if self.built:
+                self.remove(statement_text)
+
+                for response_text in self.response_links.remove(statement_text):
+                    self.remove(response_text)
+
+    def statements_cleared(self):
+        """
+        Called by the storage adapter when every statement has been removed.
+        """
+        with self.lock:
+            self.clear()
+
+
+class TokenIndex(StatementIndex):
+    """
+    An inverted index that maps each word token to the statements
+    that contain it. Candidates are the statements which share the
+    greatest number of tokens with the input statement.
+
+    :keyword index_candidate_limit: The maximum number of candidates to return.
+                                    All statements sharing a token with the
+                                    input are returned when this is None.
+    :type index_candidate_limit: int
+    """
+
+    def __init__(self, **kwargs):
+        super(TokenIndex, self).__init__(**kwargs)
+        self.candidate_limit = kwargs.get('index_candidate_limit', 100)
+        self.tokens = defaultdict(set)
+
+    def clear(self):
+        super(TokenIndex, self).clear()
+        self.tokens = defaultdict(set)
+
+    def index_text(self, statement_text):
+        for token in set(tokenize(statement_text)):
+            self.tokens[token].add(statement_text)
+
+    def unindex_text(self, statement_text):
+        for token in set(tokenize(statement_text)):
+            texts = self.tokens.get(token)
+            if texts is not None:
+                texts.discard(statement_text)
+                if not texts:
+                    del self.tokens[token]
+
+    def candidates(self, statement):
+        with self.lock:
+            shared_token_counts = Counter()
+
+            for token in set(tokenize(statement.text)):
+                shared_token_counts.update(self.tokens.get(token, ()))
+
+            return [
+                self.get_statement(text)
+                for text, count in shared_token_counts.most_common(self.candidate_limit)
+            ]
+
+
+class TrigramIndex(StatementIndex):
+    """
+    An index of the character trigrams and the length of each statement,
+    intended for use with the :code:`levenshtein_distance` comparison function.
+
+    Candidates are the statements which share the greatest number of
+    trigrams with the input statement. Because a close match may not share
+    any trigrams with the input, the remaining statements are then selected
+    by the greatest similarity that is possible given their length.
+
+    :keyword index_candidate_limit: The maximum number of statements sharing
+                                    trigrams with the input to return as candidates.
+    :type index_candidate_limit: int
+    """
+
+    def __init__(self, **kwargs):
+        super(TrigramIndex, self).__init__(**kwargs)
+        self.candidate_limit = kwargs.get('index_candidate_limit', 100)
+        self.trigrams = defaultdict(set)
+        self.lengths = defaultdict(set)
+
+    def clear(self):
+        super(TrigramIndex, self).clear()
+        self.trigrams = defaultdict(set)
+        self.lengths = defaultdict(set)
+
+    def index_text(self, statement_text):
+        for trigram in trigrams(statement_text):
+            self.trigrams[trigram].add(statement_text)
+
+        self.lengths[len(statement_text.lower())].add(statement_text)
+
+    def unindex_text(self, statement_text):
+        for trigram in trigrams(statement_text):
+            texts = self.trigrams.get(trigram)
+            if texts is not None:
+                texts.discard(statement_text)
+                if not texts:
+                    del self.trigrams[trigram]
+
+        length = len(statement_text.lower())
+        self.lengths[length].discard(statement_text)
+        if not self.lengths[length]:
+            del self.lengths[length]
+
+    def candidates(self, statement):
+        with self.lock:
+            shared_trigram_counts = Counter()
+
+            for trigram in trigrams(statement.text):
+                shared_trigram_counts.update(self.trigrams.get(trigram, ()))
+
+            return [
+                self.get_statement(text)
+                for text, count in shared_trigram_counts.most_common(self.candidate_limit)
+            ]
+
+    def bounded_candidates(self, statement, min_confidence, exclude=None):
+        """
+        Return the statements that could have a similarity of at least
+        the minimum confidence based on the length of their text, ordered
+        from the greatest possible similarity to the least.
+
+        :param exclude: Statements that have already been compared.
+        :type exclude: list
+        """
+        from chatterbot.comparisons import length_ratio_bound
+
+        with self.lock:
+            excluded_texts = set(s.text for s in exclude or [])
+            length = len(statement.text.lower())
+
+            bounds = []
+            for other_length in self.lengths:
+                bound = length_ratio_bound(length, other_length)
+
+                # Round the same way as the comparison function
+                if int(round(100 * bound)) / 100.0 >= min_confidence:
+                    bounds.append((bound, other_length, ))
+
+            results = []
+            for bound, other_length in sorted(bounds, reverse=True):
+                for text in self.lengths[other_length]:
+                    if text not in excluded_texts:
+                        results.append(self.get_statement(text))
+
+            return results
+
+
+class MinHashIndex(StatementIndex):
+    """
+    A locality-sensitive hashing index of the MinHash signature
+    of the word shingles in each statement.
+
+    Each signature is divided into bands of rows, and statements that have
+    the same values for every row of at least one band are candidates.
+    Using more bands finds more of the similar statements, while using
+    more rows per band returns fewer candidates that are less similar.
+
+    :keyword minhash_bands: The number of bands in each signature. Defaults to 16.
+    :type minhash_bands: int
+
+    :keyword minhash_rows: The number of rows in each band. Defaults to 4.
+    :type minhash_rows: int
+
+    :keyword minhash_shingle_size: The number of words in each shingle. Defaults to 1.
+    :type minhash_shingle_size: int
+
+    :keyword index_candidate_limit: The maximum number of candidates to return.
+    :type index_candidate_limit: int
+    """
+
+    # A Mersenne prime that keeps the hash products within 64 bits
+    PRIME = (1 << 31) - 1
+
+    def __init__(self, **kwargs):
+        super(MinHashIndex, self).__init__(**kwargs)
+        import numpy
+
+        self.bands = kwargs.get('minhash_bands', 16)
+        self.rows = kwargs.get('minhash_rows', 4)
+        self.shingle_size = kwargs.get('minhash_shingle_size', 1)
+        self.seed = kwargs.get('minhash_seed', 0)
+        self.candidate_limit = kwargs.get('index_candidate_limit', 100)
+
+        # The coefficients of the hash function for each row of the signature
+        random_state = numpy.random.RandomState(self.seed)
+        size = self.bands * self.rows
+        self.coefficients = random_state.randint(1, self.PRIME, size=size).astype(numpy.int64)
+        self.offsets = random_state.randint(0, self.PRIME, size=size).astype(numpy.int64)
+
+        self.buckets = defaultdict(set)
+
+    def get_parameters(self):
+        return (self.bands, self.rows, self.shingle_size, self.seed, )
+
+    def clear(self):
+        super(MinHashIndex, self).clear()
+        self.buckets = defaultdict(set)
+
+    def get_signature(self, text):
+        """
+        Return the MinHash signature of a string of text as a list of integers.
+        """
+        import numpy
+        import zlib
+
+        text_shingles = shingles(text, self.shingle_size)
+
+        if not text_shingles:
+            return []
+
+        # crc32 is used because the built in string hash varies between processes
+        shingle_hashes = numpy.array([
+            (zlib.crc32(shingle.encode('utf-8')) & 0xffffffff) % self.PRIME
+            for shingle in text_shingles
+        ], dtype=numpy.int64)
+
+        hashes = (
+            numpy.outer(self.coefficients, shingle_hashes) + self.offsets[:, None]
+        ) % self.PRIME
+
+        return hashes.min(axis=1).tolist()
+
+    def get_band_keys(self, text):
+        """
+        Return a key for each band of the signature of a string of text.
+        """
+        signature = self.get_signature(text)
+
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]), )
+            for band in range(self.bands if signature else 0)
+        ]
+
+    def index_text(self, statement_text):
+        for key in self.get_band_keys(statement_text):
+            self.buckets[key].add(statement_text)
+
+    def unindex_text(self, statement_text):
+        for key in self.get_band_keys(statement_text):
+            texts = self.buckets.get(key)
+            if texts is not None:
+                texts.discard(statement_text)
+                if not texts:
+                    del self.buckets[key]
+
+    def candidates(self, statement):
+        with self.lock:
+            shared_band_counts = Counter()
+
+            for key in self.get_band_keys(statement.text):
+                shared_band_counts.update(self.buckets.get(key, ()))
+
+            return [
+                self.get_statement(text)
+                for text, count in shared_band_counts.most_common(self.candidate_limit)
+            ]
+
+
+class TfidfIndex(StatementIndex):
+    """
+    A sparse matrix of the TF-IDF weight of each word in each statement.
+
+    An input statement is compared to every indexed statement at once using
+    the cosine similarity of their TF-IDF vectors, which is calculated with
+    a single sparse matrix-vector product. New statements are appended to
+    the matrix as they are saved, and the weights are recalculated the next
+    time the index is searched. The rows of removed statements are left in
+    the matrix until enough of them have been removed to rebuild it.
+
+    :keyword index_candidate_limit: The number of most similar statements to
+                                    return as candidates.
+    :type index_candidate_limit: int
+
+    :keyword index_compaction_fraction: The fraction of the rows in the matrix that
+                                        can belong to removed statements before the
+                                        matrix is rebuilt without them. Defaults to 0.25.
+    :type index_compaction_fraction: float
+    """
+
+    def __init__(self, **kwargs):
+        super(TfidfIndex, self).__init__(**kwargs)
+        self.candidate_limit = kwargs.get('index_candidate_limit', 100)
+        self.compaction_fraction = kwargs.get('index_compaction_fraction', 0.25)
+        self.clear()
+
+    def clear(self):
+        super(TfidfIndex, self).clear()
+
+        # The column of the matrix for each word
+        self.vocabulary = {}
+        self.document_frequencies = []
+
+        # The text of the statement in each row, or None if it has been removed
+        self.row_texts = []
+        self.rows = {}
+        self.removed_rows = []
+
+        # The matrix is stored as arrays of row, column and term frequency values
+        self.matrix = None
+        self.pending_entries = []
+
+        self.weights = None
+        self.row_norms = None
+
+    def index_text(self, statement_text):
+        row = len(self.row_texts)
+        self.row_texts.append(statement_text)
+        self.rows[statement_text] = row
+
+        for token, count in Counter(tokenize(statement_text)).items():
+            if token not in self.vocabulary:
+                self.vocabulary[token] = len(self.vocabulary)
+                self.document_frequencies.append(0)
+
+            column = self.vocabulary[token]
+            self.document_frequencies[column] += 1
+            self.pending_entries.append((row, column, count, ))
+
+        self.weights = None
+
+    def unindex_text(self, statement_text):
+        row = self.rows.pop(statement_text)
+        self.row_texts[row] = None
+        self.removed_rows.append(row)
+
+        for token in set(tokenize(statement_text)):
+            self.document_frequencies[self.vocabulary[token]] -= 1
+
+        self.weights = None
+
+        if len(self.removed_rows) > self.compaction_fraction * len(self.row_texts):
+            self.compact()
+
+    def compact(self):
+        """
+        Rebuild the matrix without the rows of removed statements.
+        The remaining statements keep their order.
+        """
+        import numpy
+
+        matrix = self.get_matrix()
+
+        live_rows = [row for row, text in enumerate(self.row_texts) if text is not None]
+
+        # The new row of each previous row, or -1 if the row is removed
+        new_rows = numpy.full(len(self.row_texts), -1, dtype=numpy.int64)
+        new_rows[live_rows] = numpy.arange(len(live_rows))
+
+        entry_rows = new_rows[matrix[:, 0].astype(numpy.int64)]
+        matrix = matrix[entry_rows >= 0]
+        matrix[:, 0] = entry_rows[entry_rows >= 0]
+
+        self.matrix = matrix if len(matrix) else None
+        self.row_texts = [self.row_texts[row] for row in live_rows]
+        self.rows = dict((text, row) for row, text in enumerate(self.row_texts))
+        self.removed_rows = []
+
+        self.weights = None
+
+    def get_matrix(self):
+        """
+        Return the row, column and term frequency arrays of the matrix,
+        including any entries that have been added since it was last used.
+        """
+        import numpy
+
+        if self.pending_entries:
+            entries = numpy.array(self.pending_entries, dtype=numpy.float64).reshape(-1, 3)
+            self.pending_entries = []
+
+            if self.matrix is not None:
+                entries = numpy.concatenate([self.matrix, entries])
+
+            self.matrix = entries
+
+        if self.matrix is None:
+            return numpy.zeros((0, 3))
+
+        return self.matrix
+
+    def get_idf(self):
+        """
+        Return the smoothed inverse document frequency of each word.
+        """
+        import numpy
+
+        document_count = len(self.rows)
+        document_frequencies = numpy.array(self.document_frequencies, dtype=numpy.float64)
+
+        return numpy.log((1.0 + document_count) / (1.0 + document_frequencies)) + 1.0
+
+    def update_weights(self):
+        """
+        Calculate the TF-IDF weight of each entry in the matrix
+        and the norm of each row.
+        """
+        import numpy
+
+        matrix = self.get_matrix()
+        rows = matrix[:, 0].astype(numpy.int64)
+        columns = matrix[:, 1].astype(numpy.int64)
+
+        self.weights = matrix[:, 2] * self.get_idf()[columns]
+        self.row_norms = numpy.sqrt(numpy.bincount(
+            rows, weights=self.weights ** 2, minlength=len(self.row_texts)
+        ))
+
+    def get_scores(self, statement):
+        """
+        Return an array of the cosine similarity between
+        the statement and the statement in each row.
+        """
+        import numpy
+
+        if self.weights is None or self.pending_entries:
+            self.update_weights()
+
+        idf = self.get_idf()
+        query = numpy.zeros(len(self.vocabulary))
+
+        for token, count in Counter(tokenize(statement.text)).items():
+            column = self.vocabulary.get(token)
+            if column is not None:
+                query[column] = count * idf[column]
+
+        query_norm = numpy.sqrt(numpy.dot(query, query))
+        scores = numpy.zeros(len(self.row_texts))
+
+        if query_norm == 0 or not len(self.weights):
+            return scores
+
+        matrix = self.get_matrix()
+        rows = matrix[:, 0].astype(numpy.int64)
+        columns = matrix[:, 1].astype(numpy.int64)
+
+        # The sparse matrix-vector product of the matrix and the query vector
+        products = numpy.bincount(
+            rows, weights=self.weights * query[columns], minlength=len(self.row_texts)
+        )
+
+        nonzero = self.row_norms > 0
+        scores[nonzero] = products[nonzero] / (self.row_norms[nonzero] * query_norm)
+        scores[self.removed_rows] = 0
+
+        return scores
+
+    def get_top_k(self, statement, k):
+        """
+        Return a list of up to k (confidence, statement) pairs for the indexed
+        statements that are the most similar to the given statement, ordered
+        from the most to the least similar. Statements with no words in
+        common with the given statement are not included.
+        """
+        import numpy
+
+        with self.lock:
+            scores = self.get_scores(statement)
+            k = min(k, len(scores))
+
+            if k < 1:
+                return []
+
+            top_rows = numpy.argpartition(-scores, k - 1)[:k]
+            top_rows = top_rows[numpy.argsort(-scores[top_rows], kind='mergesort')]
+
+            return [
+                (min(1.0, float(scores[row])), self.get_statement(self.row_texts[row]), )
+                for row in top_rows
+                if scores[row] > 0
+            ]
+
+    def candidates(self, statement):
+        return [
+            match for confidence, match in self.get_top_k(statement, self.candidate_limit)
+        ]
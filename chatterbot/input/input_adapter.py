@@ -21,7 +21,11 @@ class InputAdapter(Adapter):
         input_statement = self.process_input(*args, **kwargs)
         self.logger.info('Recieved input statement: {}'.format(input_statement.text))
 
-        existing_statement = self.chatbot.storage.find(input_statement.text)
+        # Include any changes to the statement that have not been saved yet
+        if self.chatbot.write_queue is not None:
+            existing_statement = self.chatbot.write_queue.find(input_statement.text)
+        else:
+            existing_statement = self.chatbot.storage.find(input_statement.text)
 
         if existing_statement:
             self.logger.info('"{}" is a known statement'.format(input_statement.text))
@@ -4,7 +4,9 @@ from .best_match import BestMatch
 from .closest_match import ClosestMatchAdapter
 from .closest_meaning import ClosestMeaningAdapter
 from .low_confidence import LowConfidenceAdapter
+from .match_context import MatchContext
 from .mathematical_evaluation import MathematicalEvaluation
+from .minhash_match import MinHashMatch
 from .multi_adapter import MultiLogicAdapter
 from .no_knowledge_adapter import NoKnowledgeAdapter
 from .sentiment_adapter import SentimentAdapter
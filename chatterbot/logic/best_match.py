@@ -1,13 +1,109 @@
 from __future__ import unicode_literals
+import itertools
+from chatterbot.utils import import_module
 from .logic_adapter import LogicAdapter
+from .match_context import MatchContext
 
 
 class BestMatch(LogicAdapter):
     """
     A logic adater that returns a response based on known responses to the
     closest matches to the input statement.
+
+    :keyword statement_index: The import path of a statement index, such as
+                              :code:`chatterbot.indexes.TokenIndex`. When set,
+                              only the candidates returned by the index are compared
+                              to the input statement.
+    :type statement_index: str
+
+    :keyword index_fallback_threshold: If no indexed candidate has a confidence greater
+                                       than this value, every known statement is compared
+                                       to the input instead. Set to None to never fall back.
+                                       Defaults to 0.
+    :type index_fallback_threshold: float
+
+    :keyword vectorized_comparison: If True, the confidence of each match is the similarity
+                                    calculated by the statement index for every statement at
+                                    once, instead of the comparison function. The
+                                    :code:`chatterbot.indexes.TfidfIndex` is used unless
+                                    another index that supports this is specified.
+    :type vectorized_comparison: bool
+
+    :keyword match_count: The number of closest matches to find for each input
+                          statement. Defaults to 1.
+    :type match_count: int
+
+    :keyword match_tolerance: Responses to every one of the closest matches with a
+                              confidence within this distance of the closest match are
+                              considered when selecting a response. Defaults to 0.
+    :type match_tolerance: float
+
+    :keyword parallel_comparison: If True, statements are compared to the input statement
+                                  in a pool of worker processes when every known statement
+                                  is compared. The comparison function must be possible to pickle.
+    :type parallel_comparison: bool
+
+    :keyword parallel_worker_count: The number of worker processes. Defaults to the number of CPUs.
+    :type parallel_worker_count: int
+
+    :keyword parallel_min_statements: The number of known statements required before the
+                                      worker processes are used. Defaults to 10000.
+    :type parallel_min_statements: int
     """
 
+    # Every known statement may be compared to the input statement
+    process_cost = 10
+
+    deterministic = True
+
+    def __init__(self, **kwargs):
+        super(BestMatch, self).__init__(**kwargs)
+
+        self.vectorized_comparison = kwargs.get('vectorized_comparison', False)
+
+        default_index = None
+        if self.vectorized_comparison:
+            default_index = 'chatterbot.indexes.TfidfIndex'
+
+        self.statement_index = kwargs.get('statement_index', default_index)
+
+        if isinstance(self.statement_index, str):
+            self.statement_index = import_module(self.statement_index)(**kwargs)
+
+        if self.vectorized_comparison and not hasattr(self.statement_index, 'get_top_k'):
+            raise self.InvalidIndexException(
+                'The {} statement index cannot be used with vectorized_comparison '
+                'because it does not have a get_top_k method.'.format(
+                    type(self.statement_index).__name__
+                )
+            )
+
+        self.index_fallback_threshold = kwargs.get('index_fallback_threshold', 0)
+
+        self.match_count = kwargs.get('match_count', 1)
+        self.match_tolerance = kwargs.get('match_tolerance', 0)
+
+        self.statement_shards = None
+        if kwargs.get('parallel_comparison', False):
+            from chatterbot.parallel import StatementShards
+
+            self.statement_shards = StatementShards(
+                self.compare_statements,
+                worker_count=kwargs.get('parallel_worker_count')
+            )
+
+        self.parallel_min_statements = kwargs.get('parallel_min_statements', 10000)
+
+    def set_chatbot(self, chatbot):
+        """
+        Register the comparison function with the chat bot's storage adapter if
+        it computes the features of each statement as the statement is saved.
+        """
+        super(BestMatch, self).set_chatbot(chatbot)
+
+        if getattr(self.compare_statements, 'precompute_features', False):
+            chatbot.storage.add_index(self.compare_statements)
+
     @property
     def has_storage(self):
         """
@@ -20,7 +116,123 @@ class BestMatch(LogicAdapter):
         Takes a statement string and a list of statement strings.
         Returns the closest matching statement from the list.
         """
-        statement_list = self.chatbot.storage.get_response_statements()
+        matches = self.get_top_k(input_statement, 1)
+
+        if matches:
+            return matches[0]
+
+        return 0, input_statement
+
+    def get_match_key(self):
+        """
+        Return a value that is the same for every adapter that
+        finds the same closest matches to an input statement.
+        """
+        return (
+            self.chatbot.storage,
+            self.compare_statements,
+            self.statement_index,
+            self.vectorized_comparison,
+            self.index_fallback_threshold,
+        )
+
+    def get_top_k(self, input_statement, k):
+        """
+        Return a list of up to k (confidence, statement) pairs for the known
+        statements that most closely match the input statement, ordered from
+        the closest match. Statements with a confidence of zero are not included.
+
+        When a match context is active, the matches are shared with the other
+        adapters that find matches in the same way, so the known statements
+        are only compared to the input statement once.
+        """
+        context = MatchContext.get_active()
+
+        if context is None:
+            return self.compute_top_k(input_statement, k)
+
+        key = ('top_k', input_statement.text, ) + self.get_match_key()
+
+        matches_k, matches = context.get(
+            key, lambda: (k, self.compute_top_k(input_statement, k), )
+        )
+
+        # More matches are needed than were found for another adapter
+        if matches_k < k and len(matches) == matches_k:
+            matches = self.compute_top_k(input_statement, k)
+            context.set(key, (k, matches, ))
+
+        matches = matches[:k]
+        context.add_matches(matches)
+
+        return matches
+
+    def compute_top_k(self, input_statement, k):
+        """
+        Find the k closest matches to the input statement. See :code:`get_top_k`.
+        """
+        if self.statement_index is not None:
+            if not self.statement_index.built:
+                self.statement_index.build(self.chatbot.storage)
+
+            if self.vectorized_comparison and len(self.statement_index):
+                return self.statement_index.get_top_k(input_statement, k)
+
+            candidates = self.statement_index.candidates(input_statement)
+
+            # Some indexes can select every other statement that could be a
+            # closer match, which makes falling back to a full scan unnecessary
+            if self.can_bound_candidates:
+
+                # Statements with the same confidence are ranked in the order
+                # they were indexed, the same as when every statement is compared
+                position = self.statement_index.get_position
+
+                matches = self.get_closest_matches(
+                    input_statement, candidates, k, position=position
+                )
+                min_confidence = matches[-1][0] if len(matches) == k else 0
+                remaining_candidates = self.statement_index.bounded_candidates(
+                    input_statement, min_confidence, exclude=candidates
+                )
+                return self.get_closest_matches(
+                    input_statement, remaining_candidates, k, matches=matches, position=position
+                )
+
+            matches = self.get_closest_matches(input_statement, candidates, k)
+
+            max_confidence = matches[0][0] if matches else 0
+
+            threshold = self.index_fallback_threshold
+            if threshold is None or max_confidence > threshold:
+                return matches
+
+            self.logger.info(
+                'No close match found in {} indexed candidates. '.format(len(candidates)) +
+                'Comparing all known statements.'
+            )
+
+        # The worker processes keep their statements up to date once they are started
+        if self.statement_shards is not None and self.statement_shards.built:
+            if len(self.statement_shards):
+                return self.statement_shards.get_top_k(input_statement, k)
+
+        if self.statement_shards is not None:
+            statement_list = self.chatbot.storage.get_response_statements()
+
+            if len(statement_list) >= self.parallel_min_statements:
+                self.statement_shards.build(self.chatbot.storage, statement_list)
+                return self.statement_shards.get_top_k(input_statement, k)
+        else:
+            # Statements are compared as they are read, without holding all of them
+            statement_list = self.chatbot.storage.iter_response_statements()
+
+            first_statement = next(statement_list, None)
+
+            if first_statement is not None:
+                statement_list = itertools.chain([first_statement], statement_list)
+            else:
+                statement_list = []
 
         if not statement_list:
             if self.has_storage:
@@ -29,22 +241,32 @@ class BestMatch(LogicAdapter):
                     'No statements have known responses. ' +
                     'Choosing a random response to return.'
                 )
-                return 0, self.chatbot.storage.get_random()
+                return [(0, self.chatbot.storage.get_random(), )]
             else:
                 raise self.EmptyDatasetException()
 
-        closest_match = input_statement
-        max_confidence = 0
+        return self.get_closest_matches(input_statement, statement_list, k)
 
-        # Find the closest matching known statement
-        for statement in statement_list:
-            confidence = self.compare_statements(input_statement, statement)
-
-            if confidence > max_confidence:
-                max_confidence = confidence
-                closest_match = statement
+    @property
+    def can_bound_candidates(self):
+        """
+        Return true if both the statement index and the comparison function
+        can determine the greatest possible confidence of a statement.
+        """
+        return hasattr(self.statement_index, 'bounded_candidates') and hasattr(
+            self.compare_statements, 'upper_bound'
+        )
 
-        return max_confidence, closest_match
+    def get_closest_matches(self, input_statement, statement_list, k, matches=None, position=None):
+        """
+        Return a list of up to k (confidence, statement) pairs for the statements
+        in the list that most closely match the input statement, ordered from the
+        closest match.
+        """
+        return closest_matches(
+            self.compare_statements, input_statement, statement_list, k,
+            matches=matches, position=position
+        )
 
     def can_process(self, statement):
         """
@@ -55,8 +277,13 @@ class BestMatch(LogicAdapter):
 
     def process(self, input_statement):
 
-        # Select the closest match to the input statement
-        confidence, closest_match = self.get(input_statement)
+        # Select the closest matches to the input statement
+        matches = self.get_top_k(input_statement, self.match_count)
+
+        if not matches:
+            matches = [(0, input_statement, )]
+
+        confidence, closest_match = matches[0]
         self.logger.info('Using "{}" as a close match to "{}"'.format(
             input_statement.text, closest_match.text
         ))
@@ -64,10 +291,21 @@ class BestMatch(LogicAdapter):
         # Save any updates made to the statement by the logic adapter
         self.chatbot.storage.update(closest_match)
 
-        # Get all statements that are in response to the closest match
-        response_list = self.chatbot.storage.filter(
-            in_response_to__contains=closest_match.text
-        )
+        # Matches that are nearly as close as the closest match
+        close_matches = [
+            statement for match_confidence, statement in matches
+            if confidence - match_confidence <= self.match_tolerance
+        ]
+
+        # Get all statements that are in response to the closest matches
+        if len(close_matches) > 1:
+            response_list = self.chatbot.storage.filter(
+                in_response_to__contains=[statement.text for statement in close_matches]
+            )
+        else:
+            response_list = self.chatbot.storage.filter(
+                in_response_to__contains=closest_match.text
+            )
 
         if response_list:
             self.logger.info(
@@ -89,3 +327,107 @@ class BestMatch(LogicAdapter):
             confidence = 0
 
         return confidence, response
+
+    class InvalidIndexException(Exception):
+        """
+        Exception raised when the statement index does
+        not support the way the adapter is configured.
+        """
+        pass
+
+
+def closest_matches(compare_statements, input_statement, statement_list, k, matches=None,
+                    position=None, batch_size=100):
+    """
+    Return a list of up to k (confidence, statement) pairs for the statements
+    in the list that most closely match the input statement, ordered from the
+    closest match. When statements have the same confidence, the statement
+    that comes first is ranked higher.
+
+    The k closest matches are kept in a heap, so the list is never sorted.
+    The search ends early if k exact matches have been found.
+
+    If the comparison function has an :code:`upper_bound` attribute,
+    statements that cannot have a greater confidence than the current
+    k closest matches are skipped without being compared. If the comparison
+    function has a :code:`compare_many` method, the remaining statements are
+    compared to the input in batches, so that only one batch of statements
+    is held at a time.
+
+    :param matches: A list of matches that have already been found.
+    :type matches: list
+
+    :param position: A function that returns the position of a statement.
+                     When given, statements with the same confidence are ranked
+                     by their position instead of the order they are found in.
+    :type position: function
+
+    :param batch_size: The number of statements that are compared in each call
+                       to :code:`compare_many`.
+    :type batch_size: int
+    """
+    import heapq
+
+    upper_bound = getattr(compare_statements, 'upper_bound', None)
+    compare_many = getattr(compare_statements, 'compare_many', None)
+
+    def get_rank(statement, order):
+        return (-position(statement) if position else 0, -order, )
+
+    # The heap is ordered by confidence, then by the position of the
+    # statement, then by the order the statement was found in
+    heap = []
+    for order, match in enumerate(matches or []):
+        heapq.heappush(heap, (match[0], ) + get_rank(match[1], order) + (match[1], ))
+
+    offset = len(heap)
+
+    def get_lowest(rank):
+        # The confidence and rank that a statement must exceed to be a match
+        return heap[0][:3] if len(heap) == k else (0, ) + rank
+
+    # Statements that are waiting to be compared, with their rank
+    batch = []
+
+    def compare_batch():
+        if compare_many:
+            confidences = compare_many(input_statement, [statement for rank, statement in batch])
+        else:
+            confidences = [compare_statements(input_statement, statement) for rank, statement in batch]
+
+        for (rank, statement), confidence in zip(batch, confidences):
+            if (confidence, ) + rank > get_lowest(rank):
+                if len(heap) < k:
+                    heapq.heappush(heap, (confidence, ) + rank + (statement, ))
+                else:
+                    heapq.heapreplace(heap, (confidence, ) + rank + (statement, ))
+
+        del batch[:]
+
+    if not compare_many:
+        batch_size = 1
+
+    # Find the closest matching known statements
+    for index, statement in enumerate(statement_list):
+        rank = get_rank(statement, offset + index)
+        lowest = get_lowest(rank)
+
+        # No other statement can be a closer match than an exact match,
+        # unless it has an earlier position
+        if lowest[0] >= 1 and position is None:
+            break
+
+        if upper_bound and (upper_bound(input_statement, statement), ) + rank <= lowest:
+            continue
+
+        batch.append((rank, statement, ))
+
+        if len(batch) == batch_size:
+            compare_batch()
+
+    if batch:
+        compare_batch()
+
+    return [
+        (match[0], match[3], ) for match in sorted(heap, key=lambda match: match[:3], reverse=True)
+    ]
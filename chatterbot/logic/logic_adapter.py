@@ -7,12 +7,37 @@ class LogicAdapter(Adapter):
     """
     This is an abstract class that represents the interface
     that all logic adapters should implement.
+
+    :keyword process_timeout: The number of seconds that the adapter has to
+                              return a response when logic adapters are run
+                              in parallel, measured from when the logic adapters
+                              are started. Overrides the timeout set for
+                              every logic adapter.
+    :type process_timeout: float
+
+    :keyword process_cost: The relative cost of processing a statement with the
+                           adapter. When logic adapters stop at a confidence
+                           threshold, adapters with a lower cost are run first.
+                           Overrides the cost declared by the adapter class.
+    :type process_cost: float
+
+    :keyword deterministic: If True, the adapter always selects the same response to the
+                            same input while the known statements do not change, so the
+                            chat bot's response cache can be used for its responses.
+                            Overrides the value declared by the adapter class.
+    :type deterministic: bool
     """
 
+    # The relative cost of processing a statement with this adapter
+    process_cost = 1
+
+    # Whether the response to an input only depends on the known statements
+    deterministic = False
+
     def __init__(self, **kwargs):
         super(LogicAdapter, self).__init__(**kwargs)
         from chatterbot.comparisons import levenshtein_distance
-        from chatterbot.response_selection import get_first_response
+        from chatterbot.response_selection import get_first_response, get_random_response
 
         if 'tie_breaking_method' in kwargs:
             raise DeprecationWarning(
@@ -45,6 +70,15 @@ class LogicAdapter(Adapter):
             get_first_response
         )
 
+        self.process_timeout = kwargs.get('process_timeout')
+        self.process_cost = kwargs.get('process_cost', self.process_cost)
+
+        # A response that is selected at random may differ each time
+        self.deterministic = kwargs.get(
+            'deterministic',
+            self.deterministic and self.select_response is not get_random_response
+        )
+
     def can_process(self, statement):
         """
         A preliminary check that is called to determine if a
@@ -0,0 +1,99 @@
+from __future__ import unicode_literals
+import threading
+
+
+class MatchContext(object):
+    """
+    Results shared by the logic adapters that process the same input statement.
+
+    The MultiLogicAdapter creates a context for each input statement and
+    activates it while each logic adapter processes the statement. A logic
+    adapter can store the result of expensive work, such as finding the
+    closest matches to the input, under a key that describes how the result
+    was computed. Other adapters that would compute the result the same way
+    reuse it rather than computing it again.
+    """
+
+    # The context that is active in each thread
+    _active = threading.local()
+
+    def __init__(self):
+        self.values = {}
+        self.lock = threading.Lock()
+
+        # The text of every known statement that the input was matched to
+        self.matched_texts = set()
+
+        # A lock for each key, so a value is only computed once
+        self.key_locks = {}
+
+        # The storage adapter's base query for the input statement
+        self.base_query = None
+
+        # False once a logic adapter that may select a different
+        # response to the same input has processed the statement
+        self.deterministic = True
+
+    @classmethod
+    def get_active(cls):
+        """
+        Return the context that is active in the current thread,
+        or None if no context is active.
+        """
+        return getattr(cls._active, 'context', None)
+
+    def activate(self):
+        """
+        Return a context manager that makes this the active
+        context in the current thread while it is entered.
+        """
+        return _ActiveContext(self)
+
+    def get(self, key, compute):
+        """
+        Return the value stored under the key. If no value is stored, the
+        value is computed by calling the compute function and stored. When
+        several threads get the same key, the value is only computed once.
+        """
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key not in self.values:
+                self.values[key] = compute()
+
+            return self.values[key]
+
+    def find(self, key):
+        """
+        Return the value stored under the key, or None.
+        """
+        return self.values.get(key)
+
+    def add_matches(self, matches):
+        """
+        Record the (confidence, statement) pairs that the input was matched to.
+        """
+        with self.lock:
+            self.matched_texts.update(statement.text for confidence, statement in matches)
+
+    def set(self, key, value):
+        """
+        Store a value under the key.
+        """
+        self.values[key] = value
+
+
+class _ActiveContext(object):
+
+    def __init__(self, context):
+        self.context = context
+        self.previous_context = None
+
+    def __enter__(self):
+        self.previous_context = MatchContext.get_active()
+        MatchContext._active.context = self.context
+        return self.context
+
+    def __exit__(self, *args):
+        MatchContext._active.context = self.previous_context
@@ -24,6 +24,8 @@ class MathematicalEvaluation(LogicAdapter):
     """
     functions = ['log', 'sqrt']
 
+    deterministic = True
+
     def __init__(self, **kwargs):
         super(MathematicalEvaluation, self).__init__(**kwargs)
 
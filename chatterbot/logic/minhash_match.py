@@ -0,0 +1,60 @@
+from __future__ import unicode_literals
+from chatterbot.indexes import MinHashIndex
+from .best_match import BestMatch
+
+
+class MinHashMatch(BestMatch):
+    """
+    A logic adapter that uses a locality-sensitive hashing index to select
+    the known statements that are likely to be similar to the input. Only
+    these candidates are compared to the input statement, so the time taken
+    to find a close match does not grow with the size of the database.
+
+    The accuracy and speed of the index can be tuned using the
+    :code:`minhash_bands` and :code:`minhash_rows` parameters
+    of :code:`chatterbot.indexes.MinHashIndex`.
+
+    :keyword minhash_index_path: The path of a file to save the index to. If the file
+                                 exists when the adapter is first used, the index is
+                                 loaded from the file instead of being rebuilt.
+    :type minhash_index_path: str
+    """
+
+    def __init__(self, **kwargs):
+        super(MinHashMatch, self).__init__(**kwargs)
+
+        self.statement_index = MinHashIndex(**kwargs)
+        self.index_path = kwargs.get('minhash_index_path')
+
+        # Never fall back to comparing every statement unless specified
+        self.index_fallback_threshold = kwargs.get('index_fallback_threshold')
+
+    def load_index(self):
+        """
+        Load the index from the index file, or build it from
+        the storage adapter if it can not be loaded.
+        """
+        storage = self.chatbot.storage
+
+        if self.index_path and self.statement_index.load(self.index_path, storage):
+            self.logger.info('Loaded statement index from {}'.format(self.index_path))
+            return
+
+        self.logger.info('Building statement index')
+        self.statement_index.build(storage)
+
+        self.save_index()
+
+    def save_index(self):
+        """
+        Save the index so that it can be loaded by other processes.
+        This should be called after the chat bot has been trained.
+        """
+        if self.index_path and self.statement_index.built:
+            self.statement_index.save(self.index_path)
+
+    def compute_top_k(self, input_statement, k):
+        if not self.statement_index.built:
+            self.load_index()
+
+        return super(MinHashMatch, self).compute_top_k(input_statement, k)
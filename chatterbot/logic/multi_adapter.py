@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 from collections import Counter
 from chatterbot import utils
 from .logic_adapter import LogicAdapter
+from .match_context import MatchContext
 
 
 class MultiLogicAdapter(LogicAdapter):
@@ -10,6 +11,32 @@ class MultiLogicAdapter(LogicAdapter):
     adapters. It has methods that allow ChatterBot to add an
     adapter, set the chat bot, and process an input statement
     to get a response.
+
+    :keyword logic_adapter_workers: The number of threads used to run the logic
+                                    adapters at the same time. By default, each
+                                    logic adapter is run after the previous one.
+    :type logic_adapter_workers: int
+
+    :keyword logic_adapter_timeout: The number of seconds that the logic adapters have
+                                    to return a response when they are run in parallel.
+                                    Every adapter has the same deadline, which is measured
+                                    from when the adapters are started, so an adapter that
+                                    waits for a free worker has less time to run. Responses
+                                    returned later are not used. By default, every
+                                    response is waited for.
+    :type logic_adapter_timeout: float
+
+    :keyword short_circuit_confidence: When set, logic adapters are run in order of their
+                                       process cost, and no more adapters are run once a
+                                       response has a confidence of at least this value.
+                                       By default, every logic adapter is run.
+    :type short_circuit_confidence: float
+
+    :keyword logic_adapter_voting: If True, a response returned by more than one logic
+                                   adapter is selected over a response with a greater
+                                   confidence. Defaults to True, unless
+                                   short_circuit_confidence is set.
+    :type logic_adapter_voting: bool
     """
 
     def __init__(self, **kwargs):
@@ -21,41 +48,74 @@ class MultiLogicAdapter(LogicAdapter):
         # Requied logic adapters that must always be present
         self.system_adapters = []
 
-    def process(self, statement):
+        self.timeout = kwargs.get('logic_adapter_timeout')
+
+        self.short_circuit_confidence = kwargs.get('short_circuit_confidence')
+        self.voting = kwargs.get(
+            'logic_adapter_voting', self.short_circuit_confidence is None
+        )
+
+        self.executor = None
+        worker_count = kwargs.get('logic_adapter_workers')
+
+        if worker_count:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.executor = ThreadPoolExecutor(max_workers=worker_count)
+
+    def process(self, statement, context=None):
         """
         Returns the outout of a selection of logic adapters
         for a given input statement.
 
         :param statement: The input statement to be processed.
+
+        :param context: The results shared by the logic adapters while they process
+                        the statement. A new context is used if one is not provided.
+        :type context: MatchContext
         """
+        if context is None:
+            context = MatchContext()
+
+        adapters = self.get_adapters()
+
+        # Run the adapters that cost the least first
+        if self.short_circuit_confidence is not None:
+            adapters = sorted(adapters, key=lambda adapter: adapter.process_cost)
+
+        if self.executor is None:
+            outputs = (
+                self.process_adapter(adapter, statement, context) for adapter in adapters
+            )
+        else:
+            outputs = self.process_parallel(adapters, statement, context)
+
         results = []
         result = None
         max_confidence = -1
+        short_circuited = False
 
-        for adapter in self.get_adapters():
-            if adapter.can_process(statement):
-                confidence, output = adapter.process(statement)
+        for output in outputs:
+            if output is not None:
+                confidence, output = output
                 results.append((confidence, output, ))
 
-                self.logger.info(
-                    '{} selected "{}" as a response with a confidence of {}'.format(
-                        str(adapter.__class__), output.text, confidence
-                    )
-                )
-
                 if confidence > max_confidence:
                     result = output
                     max_confidence = confidence
-            else:
-                self.logger.info(
-                    'Not processing the statement using {}'.format(
-                        str(adapter.__class__)
-                    )
-                )
+
+                if self.short_circuit_confidence is not None and (
+                    confidence >= self.short_circuit_confidence
+                ):
+                    short_circuited = True
+                    break
+
+        # Stop any adapters that have not been run
+        outputs.close()
 
         # If multiple adapters agree on the same statement,
         # then that statement is more likely to be the correct response
-        if len(results) >= 3:
+        if self.voting and not short_circuited and len(results) >= 3:
             statements = [s[1] for s in results]
             count = Counter(statements)
             most_common = count.most_common()
@@ -65,6 +125,84 @@ class MultiLogicAdapter(LogicAdapter):
 
         return max_confidence, result
 
+    def process_adapter(self, adapter, statement, context=None):
+        """
+        Returns the confidence and response of a logic adapter for the input
+        statement, or None if the adapter cannot process the statement.
+        The context is active while the adapter processes the statement.
+        """
+        if context is None:
+            context = MatchContext()
+
+        with context.activate():
+            if not adapter.can_process(statement):
+                self.logger.info(
+                    'Not processing the statement using {}'.format(
+                        str(adapter.__class__)
+                    )
+                )
+                return None
+
+            if not adapter.deterministic:
+                context.deterministic = False
+
+            confidence, output = adapter.process(statement)
+
+        self.logger.info(
+            '{} selected "{}" as a response with a confidence of {}'.format(
+                str(adapter.__class__), output.text, confidence
+            )
+        )
+
+        return confidence, output
+
+    def process_parallel(self, adapters, statement, context):
+        """
+        Run the logic adapters on the thread pool and yield the output of each
+        adapter, in the order of the adapters. The output of an adapter that does
+        not finish before its deadline is None. The deadline of each adapter is its
+        timeout after the adapters are started. Adapters that have not started
+        are cancelled when the generator is closed.
+        """
+        import time
+        from concurrent.futures import wait
+
+        start_time = time.time()
+
+        futures = [
+            self.executor.submit(self.process_adapter, adapter, statement, context)
+            for adapter in adapters
+        ]
+
+        try:
+            for adapter, future in zip(adapters, futures):
+                timeout = adapter.process_timeout
+                if timeout is None:
+                    timeout = self.timeout
+
+                remaining_time = None
+                if timeout is not None:
+                    remaining_time = max(start_time + timeout - time.time(), 0)
+
+                done, not_done = wait([future], timeout=remaining_time)
+
+                if done:
+                    output = future.result()
+                else:
+                    future.cancel()
+                    output = None
+
+                    self.logger.warning(
+                        '{} did not return a response within {} seconds'.format(
+                            str(adapter.__class__), timeout
+                        )
+                    )
+
+                yield output
+        finally:
+            for future in futures:
+                future.cancel()
+
     def get_greatest_confidence(self, statement, options):
         """
         Returns the greatest confidence value for a statement that occurs
@@ -10,6 +10,10 @@ class NoKnowledgeAdapter(LogicAdapter):
     to be given the highest priority.
     """
 
+    process_cost = 0
+
+    deterministic = True
+
     def process(self, statement):
         """
         If there are no known responses in the database,
@@ -7,6 +7,10 @@ class SpecificResponseAdapter(LogicAdapter):
     Return a specific response to a specific input.
     """
 
+    process_cost = 0
+
+    deterministic = True
+
     def __init__(self, **kwargs):
         super(SpecificResponseAdapter, self).__init__(**kwargs)
         from chatterbot.conversation import Statement
@@ -0,0 +1,239 @@
+"""
+Statement comparisons that are spread across several worker processes.
+
+Each worker process holds one shard of the known statements, so the
+statements are only sent to the workers once. Only the input statement
+is sent to the workers when the statements are compared.
+"""
+
+# The shards of statements held by the current worker process
+_shards = {}
+
+
+def _load_shard(shard_id, compare_statements, statements):
+    """
+    Store a shard of statements in the current worker process.
+    """
+    from collections import OrderedDict
+
+    _shards[shard_id] = (compare_statements, OrderedDict(), )
+    _add_to_shard(shard_id, statements)
+
+
+def _add_to_shard(shard_id, statements):
+    """
+    Add statements to a shard held by the current worker process.
+    """
+    compare_statements, shard = _shards[shard_id]
+
+    for statement in statements:
+        shard[statement.text] = statement
+
+        # Compute the features of each statement now rather than for each request
+        if getattr(compare_statements, 'precompute_features', False):
+            compare_statements.get_features(statement)
+
+
+def _remove_from_shard(shard_id, statement_text):
+    """
+    Remove a statement from a shard held by the current worker process.
+    """
+    compare_statements, shard = _shards[shard_id]
+
+    shard.pop(statement_text, None)
+
+    if hasattr(compare_statements, 'statement_removed'):
+        compare_statements.statement_removed(statement_text)
+
+
+def _compare_shard(shard_id, input_statement, k):
+    """
+    Return the k closest matches to the input statement in a shard held by
+    the current worker process, as (confidence, position, text) tuples.
+    """
+    from chatterbot.logic.best_match import closest_matches
+
+    compare_statements, shard = _shards[shard_id]
+    statement_list = list(shard.values())
+
+    positions = {}
+    for position, statement in enumerate(statement_list):
+        positions[statement.text] = position
+
+    matches = closest_matches(compare_statements, input_statement, statement_list, k)
+
+    return [
+        (confidence, positions[statement.text], statement.text, )
+        for confidence, statement in matches
+    ]
+
+
+class StatementShards(object):
+    """
+    Compare statements to the known statements in a pool of worker processes.
+
+    The known statements are split into one shard for each worker. Each shard
+    is held by its own worker process for as long as the pool is running,
+    and is kept up to date as statements are saved or removed. The closest
+    matches found in each shard are merged to find the closest matches overall.
+
+    :param compare_statements: The comparison function used by each worker.
+                               It must be possible to pickle the function.
+
+    :param worker_count: The number of worker processes.
+                         Defaults to the number of CPUs.
+    :type worker_count: int
+    """
+
+    def __init__(self, compare_statements, worker_count=None):
+        import multiprocessing
+
+        self.compare_statements = compare_statements
+        self.worker_count = worker_count or multiprocessing.cpu_count()
+
+        # Each worker has its own executor so that every shard stays in the same process
+        self.executors = []
+
+        # The shard that each statement is held in
+        self.shard_ids = {}
+
+        self.response_links = None
+
+        self.shard_sizes = []
+        self.storage = None
+        self.built = False
+
+    def __len__(self):
+        return len(self.shard_ids)
+
+    def build(self, storage, statement_list):
+        """
+        Start the worker processes and send a shard of the
+        statements to each of them.
+        """
+        from concurrent.futures import ProcessPoolExecutor, wait
+        from chatterbot.indexes import ResponseLinks
+
+        self.shutdown()
+
+        self.executors = [
+            ProcessPoolExecutor(max_workers=1) for _ in range(self.worker_count)
+        ]
+
+        statement_list = list(statement_list)
+        shard_size = -(-len(statement_list) // self.worker_count)
+
+        futures = []
+        for shard_id, executor in enumerate(self.executors):
+            shard = statement_list[shard_id * shard_size:(shard_id + 1) * shard_size]
+
+            for statement in shard:
+                self.shard_ids[statement.text] = shard_id
+
+            self.shard_sizes.append(len(shard))
+            futures.append(executor.submit(
+                _load_shard, shard_id, self.compare_statements, shard
+            ))
+
+        wait(futures)
+
+        for future in futures:
+            future.result()
+
+        self.response_links = ResponseLinks(storage.filter())
+
+        self.storage = storage
+        storage.add_index(self)
+        self.built = True
+
+    def shutdown(self):
+        """
+        Stop the worker processes.
+        """
+        for executor in self.executors:
+            executor.shutdown(wait=True)
+
+        if self.storage is not None and self in self.storage.indexes:
+            self.storage.indexes.remove(self)
+
+        self.executors = []
+        self.shard_ids = {}
+        self.shard_sizes = []
+        self.response_links = None
+        self.storage = None
+        self.built = False
+
+    def statement_updated(self, statement):
+        """
+        Called by the storage adapter when a statement has been saved.
+        Each response to the statement is added to the smallest shard.
+        """
+        from chatterbot.conversation import Statement
+
+        # Statements that the saved statement was the last response to
+        for statement_text in self.response_links.update(statement):
+            self.remove_from_shard(statement_text)
+
+        for response in statement.in_response_to:
+            if response.text not in self.shard_ids:
+                shard_id = self.shard_sizes.index(min(self.shard_sizes))
+
+                self.shard_ids[response.text] = shard_id
+                self.shard_sizes[shard_id] += 1
+
+                self.executors[shard_id].submit(
+                    _add_to_shard, shard_id, [Statement(response.text)]
+                )
+
+    def statement_removed(self, statement_text):
+        """
+        Called by the storage adapter when a statement has been removed.
+        """
+        self.remove_from_shard(statement_text)
+
+        for response_text in self.response_links.remove(statement_text):
+            self.remove_from_shard(response_text)
+
+    def remove_from_shard(self, statement_text):
+        """
+        Remove a statement from the shard that holds it.
+        """
+        shard_id = self.shard_ids.pop(statement_text, None)
+
+        if shard_id is not None:
+            self.shard_sizes[shard_id] -= 1
+            self.executors[shard_id].submit(_remove_from_shard, shard_id, statement_text)
+
+    def statements_cleared(self):
+        """
+        Called by the storage adapter when every statement has been removed.
+        The worker processes are stopped until there are enough statements again.
+        """
+        self.shutdown()
+
+    def get_top_k(self, input_statement, k):
+        """
+        Return a list of up to k (confidence, statement) pairs for the statements
+        that most closely match the input statement, ordered from the closest match.
+        """
+        import heapq
+
+        futures = [
+            executor.submit(_compare_shard, shard_id, input_statement, k)
+            for shard_id, executor in enumerate(self.executors)
+        ]
+
+        # Statements in earlier shards are ranked higher when the confidence is the same
+        results = []
+        for shard_id, future in enumerate(futures):
+            for confidence, position, text in future.result():
+                results.append((-confidence, shard_id, position, text, ))
+
+        matches = []
+        for confidence, shard_id, position, text in heapq.nsmallest(k, results):
+            statement = self.storage.find(text)
+
+            if statement is not None:
+                matches.append((-confidence, statement, ))
+
+        return matches
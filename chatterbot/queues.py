@@ -78,3 +78,209 @@ class ResponseQueue(FixedSizeQueue):
             # Return the input statement
             return previous_interaction[0]
         return None
+
+
+class WriteBehindQueue(object):
+    """
+    A queue of statements that are saved to a storage adapter by a
+    background thread, so that saving a statement does not wait for
+    the database.
+
+    When a statement is added to the queue while an earlier version of
+    it is still waiting to be saved, only the latest version is saved.
+    The statements in the queue are saved once the number of waiting
+    statements reaches the batch size, or the flush interval has passed.
+
+    :param storage: The storage adapter that statements are saved to.
+
+    :param batch_size: The number of waiting statements that causes them to be saved.
+    :type batch_size: int
+
+    :param flush_interval: The maximum number of seconds that a statement waits to be saved.
+    :type flush_interval: float
+    """
+
+    def __init__(self, storage, batch_size=100, flush_interval=1, logger=None):
+        import logging
+        import threading
+        from collections import OrderedDict
+
+        self.storage = storage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Statements waiting to be saved, and statements that are being saved
+        self.pending = OrderedDict()
+        self.saving = {}
+
+        self.condition = threading.Condition()
+
+        # Only one batch of statements is saved at a time
+        self.flush_lock = threading.Lock()
+
+        self.thread = None
+        self.running = False
+
+    def __len__(self):
+        return len(self.pending)
+
+    def start(self):
+        """
+        Start the background thread that saves statements.
+        """
+        import atexit
+        import threading
+
+        with self.condition:
+            if self.running:
+                return
+
+            self.running = True
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.thread.start()
+
+        # Save any statements that are waiting when the program exits
+        atexit.register(self.shutdown)
+
+    def run(self):
+        """
+        Save the waiting statements each time a batch is ready.
+        """
+        import time
+
+        while True:
+            with self.condition:
+                deadline = time.time() + self.flush_interval
+
+                while self.running and len(self.pending) < self.batch_size:
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
+                        break
+
+                    self.condition.wait(remaining)
+
+                if not self.running:
+                    return
+
+            self.flush()
+
+    def put(self, statement):
+        """
+        Add a statement to the queue to be saved. A copy of the statement is
+        saved, so later changes to the statement are not saved unless it is
+        added to the queue again. Statements that have not changed since
+        they were saved are not added.
+        """
+        if not statement.has_changes():
+            return
+
+        queued_statement = copy_statement(statement)
+
+        # The statement now has the values that will be saved, so that
+        # only later changes are saved if it is added to the queue again
+        statement.mark_saved()
+
+        with self.condition:
+            saving_statement = self.saving.get(queued_statement.text)
+
+            # Changes are found from the values in the database, or from the
+            # values that are being saved, rather than from the queued values
+            if queued_statement.text in self.pending:
+                queued_statement.saved_state = self.pending.pop(queued_statement.text).saved_state
+            elif saving_statement is not None:
+                queued_statement.saved_state = copy_statement(saving_statement, saved=True).saved_state
+
+            # Move the statement to the end of the queue
+            self.pending[queued_statement.text] = queued_statement
+
+            if len(self.pending) >= self.batch_size:
+                self.condition.notify()
+
+        if not self.running:
+            self.start()
+
+    def find(self, statement_text):
+        """
+        Return the statement with the text, including changes that
+        are still waiting to be saved.
+        """
+        with self.condition:
+            statement = self.pending.get(statement_text) or self.saving.get(statement_text)
+
+        if statement is not None:
+            return copy_statement(statement)
+
+        return self.storage.find(statement_text)
+
+    def flush(self):
+        """
+        Save every statement that is waiting to be saved.
+        """
+        with self.flush_lock:
+            with self.condition:
+                self.saving = self.pending
+                self.pending = type(self.pending)()
+
+            for statement_text, statement in self.saving.items():
+                try:
+                    self.storage.update(statement)
+                except Exception:
+                    self.logger.exception('Unable to save "{}"'.format(statement_text))
+
+                    # Try again later unless a newer version is waiting,
+                    # which then also needs to save the changes that failed
+                    with self.condition:
+                        if statement_text in self.pending:
+                            self.pending[statement_text].saved_state = statement.saved_state
+                        else:
+                            self.pending[statement_text] = statement
+
+            with self.condition:
+                self.saving = {}
+
+    def shutdown(self):
+        """
+        Stop the background thread and save every waiting statement.
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        self.flush()
+
+
+def copy_statement(statement, saved=False):
+    """
+    Return a copy of a statement that can be changed
+    without changing the original statement. The copy
+    has the same saved values as the statement, so only
+    the changes that were made to it are saved.
+
+    :param saved: If True, the current values of the copy are
+                  recorded as its saved values instead.
+    :type saved: bool
+    """
+    from chatterbot.conversation import Statement, Response
+
+    statement_copy = Statement(
+        statement.text,
+        in_response_to=[
+            Response(response.text, occurrence=response.occurrence)
+            for response in statement.in_response_to
+        ],
+        extra_data=statement.extra_data.copy()
+    )
+
+    if saved:
+        statement_copy.mark_saved()
+    else:
+        statement_copy.saved_state = statement.saved_state
+
+    return statement_copy
@@ -2,3 +2,6 @@ from .storage_adapter import StorageAdapter
 from .django_storage import DjangoStorageAdapter
 from .jsonfile import JsonFileStorageAdapter
 from .mongodb import MongoDatabaseAdapter
+from .memory import MemoryStorageAdapter
+from .logfile import LogFileStorageAdapter
+from .sqlite import SQLiteStorageAdapter
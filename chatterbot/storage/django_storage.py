@@ -1,4 +1,5 @@
 import json
+from collections import OrderedDict
 from chatterbot.storage import StorageAdapter
 from chatterbot.conversation import Statement, Response
 
@@ -33,12 +34,55 @@ class DjangoStorageAdapter(StorageAdapter):
                 occurrence=response_object.occurrence
             ))
 
+        statement.mark_saved()
+
         return statement
 
+    def get_response_prefetch(self):
+        """
+        Return the prefetch that loads the responses to statements,
+        and the statement of each response, with one query.
+        """
+        from django.db.models import Prefetch
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+
+        return Prefetch(
+            'in_response_to',
+            queryset=ResponseModel.objects.select_related('response')
+        )
+
+    def iter_statement_models(self, queryset, chunk_size=1000):
+        """
+        Return a generator of the statement models in a query set, with the
+        responses to each statement prefetched. The statements are loaded in
+        chunks, so the number of queries does not depend on the number of
+        responses, and only one chunk is held in memory at a time.
+        """
+        queryset = queryset.order_by('id').prefetch_related(self.get_response_prefetch())
+        last_id = None
+
+        while True:
+            chunk_queryset = queryset
+
+            if last_id is not None:
+                chunk_queryset = chunk_queryset.filter(id__gt=last_id)
+
+            chunk = list(chunk_queryset[:chunk_size])
+
+            for statement_model in chunk:
+                yield statement_model
+
+            if len(chunk) < chunk_size:
+                return
+
+            last_id = chunk[-1].id
+
     def find(self, statement_text):
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
         try:
-            statement = StatementModel.objects.get(
+            statement = StatementModel.objects.prefetch_related(
+                self.get_response_prefetch()
+            ).get(
                 text=statement_text
             )
             return self.model_to_object(statement)
@@ -46,6 +90,44 @@ class DjangoStorageAdapter(StorageAdapter):
             self.logger.info(str(e))
             return None
 
+    def find_many(self, statement_texts):
+        """
+        Return the statements that have any of the given text.
+        """
+        from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
+
+        statement_texts = list(statement_texts)
+
+        results = []
+
+        for start in range(0, len(statement_texts), 500):
+            queryset = StatementModel.objects.filter(
+                text__in=statement_texts[start:start + 500]
+            )
+
+            for statement_model in self.iter_statement_models(queryset):
+                results.append(self.model_to_object(statement_model))
+
+        return results
+
+    def get_statement_models(self, statement_texts):
+        """
+        Return the statement models that have any of the given text,
+        with one query for each five hundred statements.
+        """
+        from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
+
+        statement_texts = list(statement_texts)
+
+        statement_models = []
+
+        for start in range(0, len(statement_texts), 500):
+            statement_models.extend(StatementModel.objects.filter(
+                text__in=statement_texts[start:start + 500]
+            ))
+
+        return statement_models
+
     def filter(self, **kwargs):
         """
         Returns a list of statements in the database
@@ -59,6 +141,11 @@ class DjangoStorageAdapter(StorageAdapter):
             value = kwargs[kwarg]
             del kwargs[kwarg]
             kwarg = kwarg.replace('__contains', '__response__text')
+
+            # Match statements that contain any one of a list of values
+            if isinstance(value, list):
+                kwarg += '__in'
+
             kwargs[kwarg] = value
 
         if 'in_response_to' in kwargs:
@@ -72,11 +159,12 @@ class DjangoStorageAdapter(StorageAdapter):
             else:
                 kwargs['in_response_to'] = None
 
-        statement_objects = StatementModel.objects.filter(**kwargs)
+        # Statements that match more than one response are only returned once
+        statement_objects = StatementModel.objects.filter(**kwargs).distinct()
 
         results = []
 
-        for statement_object in statement_objects:
+        for statement_object in self.iter_statement_models(statement_objects):
             results.append(self.model_to_object(statement_object))
 
         return results
@@ -85,35 +173,142 @@ class DjangoStorageAdapter(StorageAdapter):
         """
         Update the provided statement.
         """
+        self.bulk_update([statement], **kwargs)
+
+        return statement
+
+    def bulk_update(self, statements, **kwargs):
+        """
+        Update a list of statements in one transaction. Statements and
+        responses that do not exist are created with one query for each
+        type of object, and only the responses that changed are updated.
+        """
+        from django.db import transaction
+        from django.db.models import F
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+
         # Do not alter the database unless writing is enabled
-        if not self.read_only:
-            django_statement, created = StatementModel.objects.get_or_create(
-                text=statement.text,
-                extra_data=json.dumps(statement.extra_data)
-            )
+        if self.read_only:
+            return statements
+
+        changed_statements = [
+            statement for statement in statements if statement.has_changes()
+        ]
+
+        if not changed_statements:
+            return statements
+
+        extra_data = OrderedDict()
+        for statement in changed_statements:
+            extra_data[statement.text] = json.dumps(statement.extra_data)
 
             for response in statement.in_response_to:
-                response_statement, created = StatementModel.objects.get_or_create(
-                    text=response.text
-                )
-                response_object, created = django_statement.in_response_to.get_or_create(
-                    statement=statement,
-                    response=response_statement
-                )
-                response_object.occurrence = response.occurrence
-                response_object.save()
-
-            django_statement.save()
+                extra_data.setdefault(response.text, '{}')
 
-        return statement
+        with transaction.atomic():
+            statement_models = {}
+            for statement_model in self.get_statement_models(extra_data.keys()):
+                statement_models[statement_model.text] = statement_model
+
+            created_texts = [text for text in extra_data if text not in statement_models]
+
+            StatementModel.objects.bulk_create([
+                StatementModel(text=text, extra_data=extra_data[text]) for text in created_texts
+            ])
+
+            # Get the ids of the statements that were created
+            for statement_model in self.get_statement_models(created_texts):
+                statement_models[statement_model.text] = statement_model
+
+            statement_ids = [
+                statement_models[statement.text].id for statement in changed_statements
+            ]
+
+            response_models = {}
+            for start in range(0, len(statement_ids), 500):
+                for response_model in ResponseModel.objects.filter(
+                    statement_id__in=statement_ids[start:start + 500]
+                ):
+                    key = (response_model.statement_id, response_model.response_id, )
+                    response_models[key] = response_model
+
+            created_response_models = []
+
+            for statement in changed_statements:
+                changes = statement.get_changes()
+                statement_model = statement_models[statement.text]
+
+                if statement_model.extra_data != extra_data[statement.text]:
+                    StatementModel.objects.filter(id=statement_model.id).update(
+                        extra_data=extra_data[statement.text]
+                    )
+
+                # Only save the responses that changed since the statement was saved
+                differences = {}
+                if changes is None:
+                    responses = statement.in_response_to
+                else:
+                    responses = list(changes['added_responses'])
+
+                    for response, difference in changes['occurrence_changes']:
+                        responses.append(response)
+                        differences[response.text] = difference
+
+                    if changes['removed_responses']:
+                        ResponseModel.objects.filter(
+                            statement_id=statement_model.id,
+                            response__text__in=changes['removed_responses']
+                        ).delete()
+
+                for response in responses:
+                    response_statement_model = statement_models[response.text]
+                    response_model = response_models.get(
+                        (statement_model.id, response_statement_model.id, )
+                    )
+
+                    if response_model is None:
+                        created_response_models.append(ResponseModel(
+                            statement=statement_model,
+                            response=response_statement_model,
+                            occurrence=response.occurrence
+                        ))
+                    elif response.text in differences:
+                        # Increment the count, so changes saved by other processes are kept
+                        ResponseModel.objects.filter(id=response_model.id).update(
+                            occurrence=F('occurrence') + differences[response.text]
+                        )
+                    elif response_model.occurrence != response.occurrence:
+                        ResponseModel.objects.filter(id=response_model.id).update(
+                            occurrence=response.occurrence
+                        )
+
+            ResponseModel.objects.bulk_create(created_response_models)
+
+        for statement in changed_statements:
+            statement.mark_saved()
+            self.update_indexes(statement)
+
+        return statements
 
     def get_random(self):
         """
         Returns a random statement from the database
         """
+        from random import randint
+        from django.db.models import Max, Min
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
-        statement = StatementModel.objects.order_by('?').first()
+
+        ids = StatementModel.objects.aggregate(min_id=Min('id'), max_id=Max('id'))
+
+        if ids['min_id'] is None:
+            raise self.EmptyDatabaseException()
+
+        # Select the first statement at or after a random id, using the primary key index
+        statement = StatementModel.objects.filter(
+            id__gte=randint(ids['min_id'], ids['max_id'])
+        ).order_by('id').prefetch_related(self.get_response_prefetch()).first()
+
         return self.model_to_object(statement)
 
     def remove(self, statement_text):
@@ -134,6 +329,8 @@ class DjangoStorageAdapter(StorageAdapter):
         responses.delete()
         statements.delete()
 
+        self.remove_from_indexes(statement_text)
+
     def drop(self):
         """
         Remove all data from the database.
@@ -142,4 +339,6 @@ class DjangoStorageAdapter(StorageAdapter):
         from chatterbot.ext.django_chatterbot.models import Response as ResponseModel        
 
         StatementModel.objects.all().delete()
-        ResponseModel.objects.all().delete()
\ No newline at end of file
+        ResponseModel.objects.all().delete()
+
+        self.clear_indexes()
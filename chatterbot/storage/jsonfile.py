@@ -63,6 +63,7 @@ class JsonFileStorageAdapter(StorageAdapter):
             self.update(statement)
 
         self.database.delete(statement_text)
+        self.remove_from_indexes(statement_text)
 
     def deserialize_responses(self, response_list):
         """
@@ -98,7 +99,10 @@ class JsonFileStorageAdapter(StorageAdapter):
         # Remove the text attribute from the values
         text = statement_data.pop('text')
 
-        return Statement(text, **statement_data)
+        statement = Statement(text, **statement_data)
+        statement.mark_saved()
+
+        return statement
 
     def _all_kwargs_match_values(self, kwarguments, values):
         for kwarg in kwarguments:
@@ -114,8 +118,16 @@ class JsonFileStorageAdapter(StorageAdapter):
                     for val in values[key]:
                         text_values.append(val['text'])
 
-                    if (kwarguments[kwarg] not in text_values) and (
-                            kwarguments[kwarg] not in values[key]):
+                    search_values = kwarguments[kwarg]
+
+                    # A list matches if any one of its values is contained
+                    if not isinstance(search_values, list):
+                        search_values = [search_values]
+
+                    if not any(
+                        (value in text_values) or (value in values[key])
+                        for value in search_values
+                    ):
                         return False
 
             if kwarg in values:
@@ -129,6 +141,10 @@ class JsonFileStorageAdapter(StorageAdapter):
         Returns a list of statements in the database
         that match the parameters specified.
         """
+        # Find the responses to statements without reading every statement
+        if list(kwargs.keys()) == ['in_response_to__contains']:
+            return self._filter_responses(kwargs['in_response_to__contains'])
+
         results = []
 
         for key in self._keys():
@@ -143,27 +159,103 @@ class JsonFileStorageAdapter(StorageAdapter):
 
         return results
 
+    def _filter_responses(self, statement_texts):
+        """
+        Return the statements that are in response to any of the
+        statement texts, using the set of known responses.
+        """
+        response_statement_set = self.get_response_statement_set()
+
+        if not isinstance(statement_texts, list):
+            statement_texts = [statement_texts]
+
+        results = []
+        found_texts = set()
+
+        for statement_text in statement_texts:
+            for response_text in response_statement_set.get_responses(statement_text):
+                if response_text in found_texts:
+                    continue
+
+                statement = self.find(response_text)
+
+                # The response may have been removed from the statement since it was saved
+                if statement and statement_text in [
+                    response.text for response in statement.in_response_to
+                ]:
+                    results.append(statement)
+                    found_texts.add(response_text)
+
+        return results
+
     def update(self, statement, **kwargs):
         """
         Update a statement in the database.
         """
         # Do not alter the database unless writing is enabled
-        if not self.read_only:
+        if not self.read_only and statement.has_changes():
+            changes = statement.get_changes()
             data = statement.serialize()
 
             # Remove the text key from the data
             del data['text']
             self.database.data(key=statement.text, value=data)
 
+            # Entries for responses that were already saved exist
+            if changes is None:
+                added_responses = statement.in_response_to
+            else:
+                added_responses = changes['added_responses']
+
             # Make sure that an entry for each response exists
-            for response_statement in statement.in_response_to:
+            for response_statement in added_responses:
                 response = self.find(response_statement.text)
                 if not response:
                     response = Statement(response_statement.text)
                     self.update(response)
 
+            statement.mark_saved()
+            self.update_indexes(statement)
+
         return statement
 
+    def bulk_update(self, statements, **kwargs):
+        """
+        Update a list of statements in the database.
+        The database file is only written once.
+        """
+        # Do not alter the database unless writing is enabled
+        if not self.read_only:
+            changed_statements = [
+                statement for statement in statements if statement.has_changes()
+            ]
+
+            if not changed_statements:
+                return statements
+
+            data = self.database.data()
+
+            for statement in changed_statements:
+                values = statement.serialize()
+
+                # Remove the text key from the data
+                del values['text']
+                data[statement.text] = values
+
+            # Make sure that an entry for each response exists
+            for statement in changed_statements:
+                for response in statement.in_response_to:
+                    if response.text not in data:
+                        data[response.text] = {'in_response_to': [], 'extra_data': {}}
+
+            self.database.write_data(self.database.path, data)
+
+            for statement in changed_statements:
+                statement.mark_saved()
+                self.update_indexes(statement)
+
+        return statements
+
     def get_random(self):
         from random import choice
 
@@ -182,6 +274,8 @@ class JsonFileStorageAdapter(StorageAdapter):
         if os.path.exists(self.database.path):
             os.remove(self.database.path)
 
+        self.clear_indexes()
+
     class UnsuitableForProductionWarning(Warning):
         """
         The json file storage adapter will display an :code:`UnsuitableForProductionWarning`
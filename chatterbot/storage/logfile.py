@@ -0,0 +1,469 @@
+import json
+from collections import OrderedDict
+from chatterbot.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class LogFileStorageAdapter(StorageAdapter):
+    """
+    The LogFileStorageAdapter stores statements in a file that changes are
+    only ever appended to, so the amount of data written when a statement is
+    saved does not depend on the size of the database.
+
+    Each line of the file records a statement being saved or removed. The
+    position of the latest line for each statement is kept in memory, so a
+    statement is read from the file without searching it. When most of the
+    file is made of lines that have been replaced, the file is compacted in
+    the background by writing only the latest line for each statement to a
+    new file.
+
+    :keyword database: The path to the log file.
+    :type database: str
+
+    :keyword sync_batch_size: The number of changes that are written before the
+                              file is synced to disk. Defaults to 100.
+    :type sync_batch_size: int
+
+    :keyword sync_interval: The file is also synced to disk when a change is made and this
+                            many seconds have passed since it was last synced. Changes that
+                            have not been synced are synced in a background thread once this
+                            many seconds have passed. Defaults to 1.
+    :type sync_interval: float
+
+    :keyword compaction_min_size: The size of the file in bytes before it can be compacted.
+                                  Defaults to 1048576.
+    :type compaction_min_size: int
+
+    :keyword read_only: If set to True, ChatterBot will not save information to the database.
+                        False by default.
+    :type read_only: bool
+    """
+
+    def __init__(self, **kwargs):
+        super(LogFileStorageAdapter, self).__init__(**kwargs)
+        import atexit
+        import threading
+
+        self.database_path = self.kwargs.get('database', 'database.log')
+        self.sync_batch_size = self.kwargs.get('sync_batch_size', 100)
+        self.sync_interval = self.kwargs.get('sync_interval', 1)
+        self.compaction_min_size = self.kwargs.get('compaction_min_size', 1048576)
+
+        self.lock = threading.RLock()
+        self.compaction_thread = None
+
+        # Syncs the file once the sync interval has passed, while changes are not synced
+        self.sync_timer = None
+
+        # Changed when the log file is dropped, so that compaction of the dropped file stops
+        self.generation = 0
+
+        self.adapter_supports_queries = False
+
+        self.load()
+
+        # Make sure that every change is synced to disk
+        atexit.register(self.sync)
+
+    def load(self):
+        """
+        Open the log file and find the latest line for each statement.
+        An incomplete line at the end of the file, which is left if the
+        program stops while writing, is removed.
+        """
+        import time
+
+        with self.lock:
+            # The position and length of the latest line for each statement
+            self.positions = OrderedDict()
+
+            # The text of the statements that each statement is in response to
+            self.in_response_to = {}
+
+            # The text of the statements that are in response to each statement
+            self.responses = {}
+
+            # The text of every statement, and the position of each text in the list
+            self.keys = []
+            self.key_positions = {}
+
+            # The number of bytes used by the latest line for each statement
+            self.live_size = 0
+
+            self.log_file = open(self.database_path, 'a+b')
+            self.log_file.seek(0)
+
+            offset = 0
+            for line in self.log_file:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('Incomplete line')
+
+                    operation, statement_text, data = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    self.log_file.truncate(offset)
+                    break
+
+                self._apply(operation, statement_text, data, offset, len(line))
+                offset += len(line)
+
+            self.file_size = offset
+            self.unsynced_changes = 0
+            self.last_sync_time = time.time()
+
+    def _apply(self, operation, statement_text, data, offset, length):
+        """
+        Update the positions and indexes for a line of the log file.
+        """
+        if statement_text in self.positions:
+            self.live_size -= self.positions[statement_text][1]
+            self._remove_responses(statement_text)
+
+            if operation == 'remove':
+                del self.positions[statement_text]
+                self._remove_key(statement_text)
+        elif operation == 'update':
+            self._add_key(statement_text)
+
+        if operation == 'update':
+            self.positions[statement_text] = (offset, length, )
+            self.live_size += length
+
+            response_texts = [response['text'] for response in data['in_response_to']]
+            self.in_response_to[statement_text] = response_texts
+
+            for response_text in response_texts:
+                self.responses.setdefault(
+                    response_text, OrderedDict()
+                )[statement_text] = True
+
+    def _add_key(self, statement_text):
+        self.key_positions[statement_text] = len(self.keys)
+        self.keys.append(statement_text)
+
+    def _remove_key(self, statement_text):
+        # Move the last key into the position of the removed key
+        position = self.key_positions.pop(statement_text)
+        last_key = self.keys.pop()
+
+        if last_key != statement_text:
+            self.keys[position] = last_key
+            self.key_positions[last_key] = position
+
+    def _remove_responses(self, statement_text):
+        for response_text in self.in_response_to.pop(statement_text, ()):
+            responses = self.responses.get(response_text)
+
+            if responses is not None:
+                responses.pop(statement_text, None)
+
+                if not responses:
+                    del self.responses[response_text]
+
+    def _read(self, statement_text):
+        """
+        Return the data of a statement from its latest line in the log file.
+        """
+        offset, length = self.positions[statement_text]
+
+        self.log_file.flush()
+        self.log_file.seek(offset)
+
+        operation, statement_text, data = json.loads(
+            self.log_file.read(length).decode('utf-8')
+        )
+
+        return data
+
+    def _append(self, operation, statement_text, data=None):
+        """
+        Append a line to the log file.
+        """
+        line = (json.dumps([operation, statement_text, data]) + '\n').encode('utf-8')
+
+        offset = self.file_size
+        self.log_file.write(line)
+        self.file_size += len(line)
+        self.unsynced_changes += 1
+
+        self._apply(operation, statement_text, data, offset, len(line))
+
+    def sync(self):
+        """
+        Write every change to disk.
+        """
+        import os
+        import time
+
+        with self.lock:
+            if not self.log_file.closed:
+                self.log_file.flush()
+                os.fsync(self.log_file.fileno())
+
+            self.unsynced_changes = 0
+            self.last_sync_time = time.time()
+
+            if self.sync_timer is not None:
+                self.sync_timer.cancel()
+                self.sync_timer = None
+
+    def _sync_scheduled(self):
+        with self.lock:
+            self.sync_timer = None
+
+            if self.unsynced_changes:
+                self.sync()
+
+    def _changed(self):
+        """
+        Sync the file if enough changes have been made, and start
+        compacting the file if most of it is no longer used.
+        """
+        import threading
+        import time
+
+        remaining_time = self.last_sync_time + self.sync_interval - time.time()
+
+        if self.unsynced_changes >= self.sync_batch_size or remaining_time <= 0:
+            self.sync()
+        elif self.sync_timer is None:
+            # Sync the change even if no other change is made
+            self.sync_timer = threading.Timer(remaining_time, self._sync_scheduled)
+            self.sync_timer.daemon = True
+            self.sync_timer.start()
+
+        if self.file_size >= self.compaction_min_size and self.file_size > 2 * self.live_size:
+            if self.compaction_thread is None or not self.compaction_thread.is_alive():
+                self.compaction_thread = threading.Thread(target=self.compact)
+                self.compaction_thread.daemon = True
+                self.compaction_thread.start()
+
+    def compact(self):
+        """
+        Replace the log file with a file that only contains the latest line
+        for each statement. Changes can be made while the new file is written.
+        Compaction stops if the log file is dropped while the new file is written.
+        """
+        import os
+
+        temporary_file_path = self.database_path + '.tmp'
+
+        with self.lock:
+            self.log_file.flush()
+            generation = self.generation
+            compacted_size = self.file_size
+            positions = list(self.positions.items())
+
+            # The file is opened before it can be dropped
+            previous_file = open(self.database_path, 'rb')
+
+        new_positions = OrderedDict()
+
+        with previous_file:
+            with open(temporary_file_path, 'wb') as new_file:
+                for statement_text, (offset, length) in positions:
+                    previous_file.seek(offset)
+                    new_positions[statement_text] = (new_file.tell(), length, )
+                    new_file.write(previous_file.read(length))
+
+                with self.lock:
+                    # The file that was compacted has been dropped
+                    if self.generation != generation:
+                        new_file.close()
+                        os.remove(temporary_file_path)
+                        return
+
+                    self.log_file.flush()
+
+                    # Copy the changes that were made while the file was compacted
+                    previous_file.seek(compacted_size)
+                    for line in previous_file:
+                        operation, statement_text, data = json.loads(line.decode('utf-8'))
+
+                        if operation == 'update':
+                            new_positions[statement_text] = (new_file.tell(), len(line), )
+                        else:
+                            new_positions.pop(statement_text, None)
+
+                        new_file.write(line)
+
+                    new_file.flush()
+                    os.fsync(new_file.fileno())
+
+                    # Only the positions of the lines change, the statements are the same
+                    self.log_file.close()
+                    getattr(os, 'replace', os.rename)(temporary_file_path, self.database_path)
+                    self.log_file = open(self.database_path, 'a+b')
+
+                    self.positions = OrderedDict(
+                        (text, new_positions[text]) for text in self.positions
+                    )
+                    self.file_size = new_file.tell()
+                    self.unsynced_changes = 0
+
+    def count(self):
+        return len(self.keys)
+
+    def find(self, statement_text):
+        with self.lock:
+            if statement_text not in self.positions:
+                return None
+
+            return self.data_to_object(statement_text, self._read(statement_text))
+
+    def data_to_object(self, statement_text, data):
+        """
+        Return a statement created from its serialized data.
+        """
+        in_response_to = [
+            Response(response['text'], occurrence=response['occurrence'])
+            for response in data['in_response_to']
+        ]
+
+        statement = Statement(statement_text, in_response_to=in_response_to, extra_data=data['extra_data'])
+        statement.mark_saved()
+
+        return statement
+
+    def remove(self, statement_text):
+        """
+        Removes the statement that matches the input text.
+        Removes any responses from statements if the response text matches the
+        input text.
+        """
+        with self.lock:
+            for response_text in list(self.responses.get(statement_text, ())):
+                statement = self.find(response_text)
+                statement.remove_response(statement_text)
+                self.update(statement)
+
+            if statement_text in self.positions:
+                self._append('remove', statement_text)
+                self._changed()
+
+        self.remove_from_indexes(statement_text)
+
+    def filter(self, **kwargs):
+        """
+        Returns a list of statements in the database
+        that match the parameters specified.
+
+        The supported parameters are :code:`text`, :code:`extra_data`,
+        :code:`in_response_to` and :code:`in_response_to__contains`.
+        """
+        self.check_filter_parameters(kwargs, [
+            'text', 'extra_data', 'in_response_to', 'in_response_to__contains'
+        ])
+
+        with self.lock:
+            if 'in_response_to__contains' in kwargs:
+                response_texts = kwargs['in_response_to__contains']
+
+                # Match statements that contain any one of a list of values
+                if not isinstance(response_texts, list):
+                    response_texts = [response_texts]
+
+                statement_texts = OrderedDict()
+                for response_text in response_texts:
+                    for statement_text in self.responses.get(response_text, ()):
+                        statement_texts[statement_text] = True
+            elif 'text' in kwargs:
+                statement_texts = [kwargs['text']] if kwargs['text'] in self.positions else []
+            else:
+                statement_texts = list(self.positions.keys())
+
+            results = []
+
+            for statement_text in statement_texts:
+                if 'text' in kwargs and statement_text != kwargs['text']:
+                    continue
+
+                data = self._read(statement_text)
+
+                if 'in_response_to' in kwargs:
+                    response_texts = [response.text for response in kwargs['in_response_to']]
+
+                    if response_texts != [
+                        response['text'] for response in data['in_response_to']
+                    ]:
+                        continue
+
+                if 'extra_data' in kwargs and data['extra_data'] != kwargs['extra_data']:
+                    continue
+
+                results.append(self.data_to_object(statement_text, data))
+
+        return results
+
+    def update(self, statement, **kwargs):
+        """
+        Update a statement in the database.
+        """
+        # Do not alter the database unless writing is enabled
+        if not self.read_only and statement.has_changes():
+            with self.lock:
+                data = statement.serialize()
+                del data['text']
+
+                self._append('update', statement.text, data)
+
+                # Make sure that an entry for each response exists
+                for response in statement.in_response_to:
+                    if response.text not in self.positions:
+                        self._append('update', response.text, {
+                            'in_response_to': [], 'extra_data': {}
+                        })
+
+                self._changed()
+
+            statement.mark_saved()
+            self.update_indexes(statement)
+
+        return statement
+
+    def get_random(self):
+        """
+        Returns a random statement from the database
+        """
+        from random import choice
+
+        with self.lock:
+            if not self.keys:
+                raise self.EmptyDatabaseException()
+
+            return self.find(choice(self.keys))
+
+    def drop(self):
+        """
+        Remove every statement from the log file.
+        """
+        import os
+
+        with self.lock:
+            self.generation += 1
+            self.log_file.close()
+
+            if self.sync_timer is not None:
+                self.sync_timer.cancel()
+                self.sync_timer = None
+
+            if os.path.exists(self.database_path):
+                os.remove(self.database_path)
+
+            self.load()
+
+        self.clear_indexes()
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        A statement must exist which lists the closest matching statement in the
+        in_response_to field. Otherwise, the logic adapter may find a closest
+        matching statement that does not have a known response.
+        """
+        with self.lock:
+            return [
+                self.data_to_object(statement_text, self._read(statement_text))
+                for statement_text in self.positions
+                if statement_text in self.responses
+            ]
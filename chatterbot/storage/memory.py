@@ -0,0 +1,375 @@
+from collections import OrderedDict
+from chatterbot.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class MemoryStorageAdapter(StorageAdapter):
+    """
+    The MemoryStorageAdapter keeps every statement in memory, which makes
+    it fast for chat bots that read from their database much more often
+    than they write to it.
+
+    Statements are found by their text, statements that are in response to
+    a statement are found with an index of responses, and random statements
+    are selected from a list of the text of every statement, so none of these
+    operations need to look at every statement in the database.
+
+    :keyword database: The path to a file that a snapshot of the statements
+                       is saved to. The snapshot is loaded when the adapter is
+                       created. If no path is set, the statements are not saved.
+    :type database: str
+
+    :keyword snapshot_interval: The minimum number of seconds between snapshots.
+                                A snapshot is saved when a statement is updated or
+                                removed and this much time has passed since the last
+                                snapshot. Otherwise, a snapshot of the changes is saved
+                                in a background thread once the interval has passed.
+                                Defaults to 60.
+    :type snapshot_interval: int
+
+    :keyword read_only: If set to True, ChatterBot will not save information to the database.
+                        False by default.
+    :type read_only: bool
+    """
+
+    def __init__(self, **kwargs):
+        super(MemoryStorageAdapter, self).__init__(**kwargs)
+        import threading
+
+        self.database_path = self.kwargs.get('database')
+        self.snapshot_interval = self.kwargs.get('snapshot_interval', 60)
+
+        self.lock = threading.RLock()
+
+        # The serialized data of each statement
+        self.statements = OrderedDict()
+
+        # The text of the statements that are in response to each statement
+        self.responses = {}
+
+        # The text of every statement, and the position of each text in the list
+        self.keys = []
+        self.key_positions = {}
+
+        self.last_snapshot_time = None
+        self.has_changes = False
+
+        # Saves the snapshot once the interval has passed, while changes are waiting
+        self.snapshot_timer = None
+
+        self.adapter_supports_queries = False
+
+        if self.database_path:
+            import atexit
+
+            self.load_snapshot()
+
+            # Save any changes made since the last snapshot
+            atexit.register(self.save_snapshot)
+
+    def count(self):
+        return len(self.keys)
+
+    def find(self, statement_text):
+        data = self.statements.get(statement_text)
+
+        if data is None:
+            return None
+
+        return self.data_to_object(statement_text, data)
+
+    def data_to_object(self, statement_text, data):
+        """
+        Return a statement created from its serialized data.
+        """
+        in_response_to = [
+            Response(response['text'], occurrence=response['occurrence'])
+            for response in data['in_response_to']
+        ]
+
+        statement = Statement(
+            statement_text,
+            in_response_to=in_response_to,
+            extra_data=data['extra_data'].copy()
+        )
+        statement.mark_saved()
+
+        return statement
+
+    def remove(self, statement_text):
+        """
+        Removes the statement that matches the input text.
+        Removes any responses from statements if the response text matches the
+        input text.
+        """
+        with self.lock:
+            for response_text in list(self.responses.get(statement_text, ())):
+                statement = self.find(response_text)
+                statement.remove_response(statement_text)
+                self.update(statement)
+
+            data = self.statements.pop(statement_text, None)
+
+            if data is not None:
+                self._remove_responses(statement_text, data)
+                self._remove_key(statement_text)
+                self.has_changes = True
+
+        self.remove_from_indexes(statement_text)
+        self.save_snapshot_if_due()
+
+    def _add_key(self, statement_text):
+        self.key_positions[statement_text] = len(self.keys)
+        self.keys.append(statement_text)
+
+    def _remove_key(self, statement_text):
+        # Move the last key into the position of the removed key
+        position = self.key_positions.pop(statement_text)
+        last_key = self.keys.pop()
+
+        if last_key != statement_text:
+            self.keys[position] = last_key
+            self.key_positions[last_key] = position
+
+    def _remove_responses(self, statement_text, data):
+        for response in data['in_response_to']:
+            responses = self.responses.get(response['text'])
+
+            if responses is not None:
+                responses.pop(statement_text, None)
+
+                if not responses:
+                    del self.responses[response['text']]
+
+    def filter(self, **kwargs):
+        """
+        Returns a list of statements in the database
+        that match the parameters specified.
+
+        The supported parameters are :code:`text`, :code:`extra_data`,
+        :code:`in_response_to` and :code:`in_response_to__contains`.
+        """
+        self.check_filter_parameters(kwargs, [
+            'text', 'extra_data', 'in_response_to', 'in_response_to__contains'
+        ])
+
+        with self.lock:
+            if 'in_response_to__contains' in kwargs:
+                response_texts = kwargs['in_response_to__contains']
+
+                # Match statements that contain any one of a list of values
+                if not isinstance(response_texts, list):
+                    response_texts = [response_texts]
+
+                statement_texts = OrderedDict()
+                for response_text in response_texts:
+                    for statement_text in self.responses.get(response_text, ()):
+                        statement_texts[statement_text] = True
+            elif 'text' in kwargs:
+                statement_texts = [kwargs['text']] if kwargs['text'] in self.statements else []
+            else:
+                statement_texts = list(self.statements.keys())
+
+            results = []
+
+            for statement_text in statement_texts:
+                data = self.statements[statement_text]
+
+                if 'text' in kwargs and statement_text != kwargs['text']:
+                    continue
+
+                if 'in_response_to' in kwargs:
+                    response_texts = [response.text for response in kwargs['in_response_to']]
+
+                    if response_texts != [
+                        response['text'] for response in data['in_response_to']
+                    ]:
+                        continue
+
+                if 'extra_data' in kwargs and data['extra_data'] != kwargs['extra_data']:
+                    continue
+
+                results.append(self.data_to_object(statement_text, data))
+
+        return results
+
+    def update(self, statement, **kwargs):
+        """
+        Update a statement in the database.
+        """
+        # Do not alter the database unless writing is enabled
+        if not self.read_only and statement.has_changes():
+            with self.lock:
+                data = statement.serialize()
+                del data['text']
+
+                # Changes made to the statement later should not change the saved data
+                data['extra_data'] = data['extra_data'].copy()
+
+                previous_data = self.statements.get(statement.text)
+
+                if previous_data is None:
+                    self._add_key(statement.text)
+                else:
+                    self._remove_responses(statement.text, previous_data)
+
+                self.statements[statement.text] = data
+
+                for response in statement.in_response_to:
+                    self.responses.setdefault(
+                        response.text, OrderedDict()
+                    )[statement.text] = True
+
+                    # Make sure that an entry for each response exists
+                    if response.text not in self.statements:
+                        self.statements[response.text] = {'in_response_to': [], 'extra_data': {}}
+                        self._add_key(response.text)
+
+                self.has_changes = True
+
+            statement.mark_saved()
+            self.update_indexes(statement)
+            self.save_snapshot_if_due()
+
+        return statement
+
+    def get_random(self):
+        """
+        Returns a random statement from the database
+        """
+        from random import choice
+
+        with self.lock:
+            if not self.keys:
+                raise self.EmptyDatabaseException()
+
+            return self.find(choice(self.keys))
+
+    def drop(self):
+        """
+        Remove all statements from the database, and remove the snapshot file.
+        """
+        import os
+
+        with self.lock:
+            self.statements = OrderedDict()
+            self.responses = {}
+            self.keys = []
+            self.key_positions = {}
+            self.has_changes = False
+
+            self._cancel_snapshot_timer()
+
+            if self.database_path and os.path.exists(self.database_path):
+                os.remove(self.database_path)
+
+        self.clear_indexes()
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        A statement must exist which lists the closest matching statement in the
+        in_response_to field. Otherwise, the logic adapter may find a closest
+        matching statement that does not have a known response.
+        """
+        with self.lock:
+            return [
+                self.data_to_object(statement_text, data)
+                for statement_text, data in self.statements.items()
+                if statement_text in self.responses
+            ]
+
+    def save_snapshot_if_due(self):
+        """
+        Save a snapshot if the snapshot interval has passed since the last snapshot.
+        Otherwise, schedule the snapshot to be saved once the interval has passed.
+        """
+        import threading
+        import time
+
+        if self.database_path and self.has_changes:
+            with self.lock:
+                remaining_time = 0
+                if self.last_snapshot_time is not None:
+                    remaining_time = self.last_snapshot_time + self.snapshot_interval - time.time()
+
+                if remaining_time > 0:
+                    if self.snapshot_timer is None:
+                        self.snapshot_timer = threading.Timer(
+                            remaining_time, self._save_scheduled_snapshot
+                        )
+                        self.snapshot_timer.daemon = True
+                        self.snapshot_timer.start()
+                    return
+
+            self.save_snapshot()
+
+    def _save_scheduled_snapshot(self):
+        with self.lock:
+            self.snapshot_timer = None
+
+        self.save_snapshot_if_due()
+
+    def _cancel_snapshot_timer(self):
+        with self.lock:
+            if self.snapshot_timer is not None:
+                self.snapshot_timer.cancel()
+                self.snapshot_timer = None
+
+    def save_snapshot(self):
+        """
+        Save every statement to the snapshot file.
+        """
+        import json
+        import os
+        import time
+
+        if not self.database_path or not self.has_changes:
+            return
+
+        with self.lock:
+            temporary_file_path = self.database_path + '.tmp'
+            with open(temporary_file_path, 'w') as snapshot_file:
+                json.dump(list(self.statements.items()), snapshot_file)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+
+            # Replace the previous snapshot only once the new one is complete
+            getattr(os, 'replace', os.rename)(temporary_file_path, self.database_path)
+
+            self.last_snapshot_time = time.time()
+            self.has_changes = False
+
+            self._cancel_snapshot_timer()
+
+    def load_snapshot(self):
+        """
+        Load the statements from the snapshot file if it exists.
+        """
+        import json
+        import os
+        import time
+
+        if not os.path.exists(self.database_path):
+            return
+
+        with open(self.database_path, 'r') as snapshot_file:
+            items = json.load(snapshot_file)
+
+        with self.lock:
+            self.statements = OrderedDict()
+            self.responses = {}
+            self.keys = []
+            self.key_positions = {}
+
+            for statement_text, data in items:
+                self.statements[statement_text] = data
+                self._add_key(statement_text)
+
+                for response in data['in_response_to']:
+                    self.responses.setdefault(
+                        response['text'], OrderedDict()
+                    )[statement_text] = True
+
+            self.last_snapshot_time = time.time()
+            self.has_changes = False
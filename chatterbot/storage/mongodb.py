@@ -1,5 +1,6 @@
 from chatterbot.storage import StorageAdapter
 from chatterbot.conversation import Statement, Response
+from chatterbot.utils import chain_future
 
 
 class Query(object):
@@ -46,7 +47,10 @@ class Query(object):
         if '$elemMatch' not in query['in_response_to']:
             query['in_response_to']['$elemMatch'] = {}
 
-        query['in_response_to']['$elemMatch']['text'] = statement_text
+        if isinstance(statement_text, list):
+            query['in_response_to']['$elemMatch']['text'] = {'$in': statement_text}
+        else:
+            query['in_response_to']['$elemMatch']['text'] = statement_text
 
         return Query(query)
 
@@ -77,10 +81,16 @@ class MongoDatabaseAdapter(StorageAdapter):
 
        database_uri='mongodb://example.com:8100/'
 
+    :keyword batch_size: The number of statements read from the server at a time
+                         when statements are streamed from a cursor. Defaults to 1000.
+    :type batch_size: int
 
     :keyword read_only: If set to True, ChatterBot will not save information to the database.
                         False by default.
     :type read_only: bool
+
+    The asynchronous methods, such as :code:`afind`, use the Motor driver if it is
+    installed, so that they do not block the event loop or use a thread.
     """
 
     def __init__(self, **kwargs):
@@ -93,6 +103,7 @@ class MongoDatabaseAdapter(StorageAdapter):
         self.database_uri = self.kwargs.get(
             "database_uri", "mongodb://localhost:27017/"
         )
+        self.batch_size = self.kwargs.get('batch_size', 1000)
 
         # Use the default host and port
         self.client = MongoClient(self.database_uri)
@@ -103,10 +114,28 @@ class MongoDatabaseAdapter(StorageAdapter):
         # The mongo collection of statement documents
         self.statements = self.database['statements']
 
+        self.create_indexes()
+
+        self.base_query = Query()
+
+        # The collection used by the asynchronous driver, once it has been connected
+        self.async_statements = None
+        self.async_driver_installed = True
+
+        # Flag the response statements in a database that was saved before the flag was used
+        if self.statements.find_one({'has_responses': {'$exists': True}}) is None:
+            self.set_response_flags()
+
+    def create_indexes(self):
+        """
+        Create the indexes of the statements collection.
+        """
         # Set a requirement for the text attribute to be unique
         self.statements.create_index('text', unique=True)
 
-        self.base_query = Query()
+        # Statements are flagged when another statement is in response to them
+        self.statements.create_index('has_responses', sparse=True)
+        self.statements.create_index('in_response_to.text')
 
     def count(self):
         return self.statements.count()
@@ -119,14 +148,27 @@ class MongoDatabaseAdapter(StorageAdapter):
         if not values:
             return None
 
-        del values['text']
+        return self.mongo_to_object(values)
 
-        # Build the objects for the response list
-        values['in_response_to'] = self.deserialize_responses(
-            values.get('in_response_to', [])
-        )
+    def find_many(self, statement_texts):
+        """
+        Return the statements that have any of the given text.
+        The statements are found with one query for each
+        thousand statements.
+        """
+        statement_texts = list(statement_texts)
 
-        return Statement(statement_text, **values)
+        results = []
+
+        for start in range(0, len(statement_texts), 1000):
+            query = self.base_query.raw({
+                'text': {'$in': statement_texts[start:start + 1000]}
+            })
+
+            for match in self.statements.find(query.value()):
+                results.append(self.mongo_to_object(match))
+
+        return results
 
     def deserialize_responses(self, response_list):
         """
@@ -153,17 +195,58 @@ class MongoDatabaseAdapter(StorageAdapter):
         statement_text = statement_data['text']
         del statement_data['text']
 
+        statement_data.pop('has_responses', None)
+
         statement_data['in_response_to'] = self.deserialize_responses(
             statement_data.get('in_response_to', [])
         )
 
-        return Statement(statement_text, **statement_data)
+        statement = Statement(statement_text, **statement_data)
+        statement.mark_saved()
+
+        return statement
 
     def filter(self, **kwargs):
         """
         Returns a list of statements in the database
         that match the parameters specified.
         """
+        return list(self.filter_iter(**kwargs))
+
+    def filter_iter(self, batch_size=None, fields=None, **kwargs):
+        """
+        Return a generator of the statements in the database that match
+        the parameters specified. The statements are read from a cursor,
+        so only one batch of them is held in memory at a time.
+
+        :param batch_size: The number of statements read from the server at a time.
+        :type batch_size: int
+
+        :param fields: The names of the fields to load, such as :code:`['text']`
+                       to load only the text of each statement. Every field is
+                       loaded by default. Statements loaded with only some of their
+                       fields should not be changed and saved.
+        :type fields: list
+        """
+        query = self.get_filter_query(**kwargs)
+
+        projection = None
+        if fields is not None:
+            projection = dict((field, True, ) for field in fields)
+            projection['text'] = True
+
+        matches = self.statements.find(query.value(), projection)
+
+        if batch_size:
+            matches = matches.batch_size(batch_size)
+
+        for match in matches:
+            yield self.mongo_to_object(match)
+
+    def get_filter_query(self, **kwargs):
+        """
+        Return a query for the filter parameters.
+        """
         query = self.base_query
 
         # Convert Response objects to data
@@ -181,71 +264,226 @@ class MongoDatabaseAdapter(StorageAdapter):
             )
             del kwargs['in_response_to__contains']
 
-        query = query.raw(kwargs)
+        return query.raw(kwargs)
 
-        matches = self.statements.find(query.value())
+    def update(self, statement, **kwargs):
+        from pymongo.errors import BulkWriteError
 
-        results = []
+        force = kwargs.get('force', False)
+        # Do not alter the database unless writing is enabled
+        if (force or not self.read_only) and statement.has_changes():
+            changes = statement.get_changes()
 
-        for match in list(matches):
-            results.append(self.mongo_to_object(match))
+            if changes is None:
+                operations = self.get_update_operations(statement)
 
-        return results
+                # Every value is replaced, so the responses that the saved
+                # statement no longer includes are found before they are removed
+                removed_response_texts = self.get_removed_response_texts([statement])
+            else:
+                operations = self.get_change_operations(statement, changes)
+                removed_response_texts = changes['removed_responses']
 
-    def update(self, statement, **kwargs):
-        from pymongo import UpdateOne
+            try:
+                self.statements.bulk_write(operations, ordered=False)
+            except BulkWriteError as bwe:
+                # Log the details of a bulk write error
+                self.logger.error(str(bwe.details))
+
+            self.update_response_flags(removed_response_texts)
+
+            statement.mark_saved()
+            self.update_indexes(statement)
+
+        return statement
+
+    def bulk_update(self, statements, **kwargs):
+        """
+        Update a list of statements in the database with one bulk write.
+        """
         from pymongo.errors import BulkWriteError
 
         force = kwargs.get('force', False)
         # Do not alter the database unless writing is enabled
         if force or not self.read_only:
-            data = statement.serialize()
+            changed_statements = [
+                statement for statement in statements if statement.has_changes()
+            ]
+
+            statement_texts = set(statement.text for statement in changed_statements)
+            response_texts = set()
+            removed_response_texts = set()
+            flagged_texts = set()
 
             operations = []
 
-            update_operation = UpdateOne(
+            removed_response_texts.update(self.get_removed_response_texts([
+                statement for statement in changed_statements
+                if statement.get_changes() is None
+            ]))
+
+            for statement in changed_statements:
+                changes = statement.get_changes()
+
+                if changes is None:
+                    operations.extend(self.get_update_operations(
+                        statement, create_responses=False
+                    ))
+                    added_responses = statement.in_response_to
+                else:
+                    operations.extend(self.get_change_operations(
+                        statement, changes, create_responses=False
+                    ))
+                    added_responses = changes['added_responses']
+                    removed_response_texts.update(changes['removed_responses'])
+
+                # Each entry only needs to be created once, and statements
+                # saved in this update already have an entry
+                response_list = []
+                for response in added_responses:
+                    if response.text in statement_texts:
+                        flagged_texts.add(response.text)
+                    elif response.text not in response_texts:
+                        response_texts.add(response.text)
+                        response_list.append(response.serialize())
+
+                operations.extend(self.get_response_entry_operations(response_list))
+
+            if operations:
+                try:
+                    self.statements.bulk_write(operations, ordered=False)
+                except BulkWriteError as bwe:
+                    # Log the details of a bulk write error
+                    self.logger.error(str(bwe.details))
+
+            # Flag the saved statements that have responses once they exist
+            flagged_texts = list(flagged_texts)
+            for start in range(0, len(flagged_texts), 1000):
+                self.statements.update_many(
+                    {'text': {'$in': flagged_texts[start:start + 1000]}},
+                    {'$set': {'has_responses': True}}
+                )
+
+            self.update_response_flags(removed_response_texts)
+
+            for statement in changed_statements:
+                statement.mark_saved()
+                self.update_indexes(statement)
+
+        return statements
+
+    def get_update_operations(self, statement, create_responses=True):
+        """
+        Return the operations that save every value of a statement.
+
+        :param create_responses: If True, operations that make sure that an
+                                 entry exists for each response are included.
+        :type create_responses: bool
+        """
+        from pymongo import UpdateOne
+
+        data = statement.serialize()
+
+        operations = []
+
+        update_operation = UpdateOne(
+            {'text': statement.text},
+            {'$set': data},
+            upsert=True
+        )
+        operations.append(update_operation)
+
+        if create_responses:
+            operations.extend(self.get_response_entry_operations(
+                data.get('in_response_to', [])
+            ))
+
+        return operations
+
+    def get_change_operations(self, statement, changes, create_responses=True):
+        """
+        Return the operations that save only the values of a statement
+        that changed since it was last saved. Occurrence counts are
+        incremented, so changes saved by other clients are kept.
+
+        :param create_responses: If True, operations that make sure that an
+                                 entry exists for each added response are included.
+        :type create_responses: bool
+        """
+        from pymongo import UpdateOne
+
+        operations = []
+
+        if changes['extra_data']:
+            operations.append(UpdateOne(
                 {'text': statement.text},
-                {'$set': data},
-                upsert=True
-            )
-            operations.append(update_operation)
+                {'$set': {'extra_data': statement.extra_data}}
+            ))
 
-            # Make sure that an entry for each response is saved
-            for response_dict in data.get('in_response_to', []):
-                response_text = response_dict.get('text')
+        if changes['removed_responses']:
+            operations.append(UpdateOne(
+                {'text': statement.text},
+                {'$pull': {'in_response_to': {'text': {'$in': changes['removed_responses']}}}}
+            ))
 
-                # $setOnInsert does nothing if the document is not created
-                update_operation = UpdateOne(
-                    {'text': response_text},
-                    {'$set': response_dict},
-                    upsert=True
-                )
-                operations.append(update_operation)
+        for response, difference in changes['occurrence_changes']:
+            operations.append(UpdateOne(
+                {'text': statement.text, 'in_response_to.text': response.text},
+                {'$inc': {'in_response_to.$.occurrence': difference}}
+            ))
 
-            try:
-                self.statements.bulk_write(operations, ordered=False)
-            except BulkWriteError as bwe:
-                # Log the details of a bulk write error
-                self.logger.error(str(bwe.details))
+        added_responses = [
+            response.serialize() for response in changes['added_responses']
+        ]
 
-        return statement
+        for response_dict in added_responses:
+            # Do not add the response again if another client has added it
+            operations.append(UpdateOne(
+                {'text': statement.text, 'in_response_to.text': {'$ne': response_dict['text']}},
+                {'$push': {'in_response_to': response_dict}}
+            ))
 
-    def get_random(self):
+        if create_responses:
+            operations.extend(self.get_response_entry_operations(added_responses))
+
+        return operations
+
+    def get_response_entry_operations(self, response_list):
         """
-        Returns a random statement from the database
+        Return the operations that make sure that an entry for each response is saved.
         """
-        from random import randint
+        from pymongo import UpdateOne
 
-        count = self.count()
+        operations = []
 
-        if count < 1:
-            raise self.EmptyDatabaseException()
+        for response_dict in response_list:
+            response_text = response_dict.get('text')
 
-        random_integer = randint(0, count - 1)
+            # Flag the statement as one that has a known response
+            values = dict(response_dict, has_responses=True)
 
-        statements = self.statements.find().limit(1).skip(random_integer)
+            # $setOnInsert does nothing if the document is not created
+            update_operation = UpdateOne(
+                {'text': response_text},
+                {'$set': values},
+                upsert=True
+            )
+            operations.append(update_operation)
+
+        return operations
+
+    def get_random(self):
+        """
+        Returns a random statement from the database
+        """
+        statements = list(self.statements.aggregate([
+            {'$sample': {'size': 1}}
+        ]))
+
+        if not statements:
+            raise self.EmptyDatabaseException()
 
-        return self.mongo_to_object(list(statements)[0])
+        return self.mongo_to_object(statements[0])
 
     def remove(self, statement_text):
         """
@@ -257,7 +495,88 @@ class MongoDatabaseAdapter(StorageAdapter):
             statement.remove_response(statement_text)
             self.update(statement)
 
-        self.statements.delete_one({'text': statement_text})
+        removed_statement = self.statements.find_one_and_delete(
+            {'text': statement_text}, {'in_response_to.text': True}
+        )
+
+        # Statements that the removed statement was in response to may no longer have responses
+        if removed_statement:
+            self.update_response_flags([
+                response['text'] for response in removed_statement.get('in_response_to', [])
+            ])
+
+        self.remove_from_indexes(statement_text)
+
+    def set_response_flags(self):
+        """
+        Flag every statement that another statement is in response to.
+        The text of the statements is read from the server in batches,
+        so the client does not need to hold all of them at once.
+        """
+        response_texts = self.statements.aggregate([
+            {'$unwind': '$in_response_to'},
+            {'$group': {'_id': '$in_response_to.text'}}
+        ], allowDiskUse=True)
+
+        batch = []
+
+        for response_text in response_texts:
+            batch.append(response_text['_id'])
+
+            if len(batch) >= 1000:
+                self.statements.update_many(
+                    {'text': {'$in': batch}}, {'$set': {'has_responses': True}}
+                )
+                batch = []
+
+        if batch:
+            self.statements.update_many(
+                {'text': {'$in': batch}}, {'$set': {'has_responses': True}}
+            )
+
+    def get_removed_response_texts(self, statements):
+        """
+        Return the text of the responses that the saved copies of the
+        statements include, but that the given statements do not.
+        """
+        if not statements:
+            return set()
+
+        saved_statements = self.statements.find(
+            {'text': {'$in': [statement.text for statement in statements]}},
+            {'text': True, 'in_response_to.text': True}
+        )
+
+        saved_response_texts = {}
+        for data in saved_statements:
+            saved_response_texts[data['text']] = set(
+                response.get('text') for response in data.get('in_response_to', [])
+            )
+
+        removed_response_texts = set()
+        for statement in statements:
+            removed_response_texts.update(
+                saved_response_texts.get(statement.text, set()) - set(
+                    response.text for response in statement.in_response_to
+                )
+            )
+
+        return removed_response_texts
+
+    def update_response_flags(self, statement_texts):
+        """
+        Remove the flag from statements that no other
+        statement is in response to anymore.
+        """
+        for statement_text in statement_texts:
+            response = self.statements.find_one(
+                {'in_response_to.text': statement_text}, {'_id': True}
+            )
+
+            if response is None:
+                self.statements.update_one(
+                    {'text': statement_text}, {'$unset': {'has_responses': ''}}
+                )
 
     def get_response_statements(self):
         """
@@ -265,28 +584,171 @@ class MongoDatabaseAdapter(StorageAdapter):
         A statement must exist which lists the closest matching statement in the
         in_response_to field. Otherwise, the logic adapter may find a closest
         matching statement that does not have a known response.
+
+        These statements are flagged when they are saved, and the flag is
+        indexed, so they are found without sending a list of them to the server.
+        """
+        return list(self.iter_response_statements())
+
+    def iter_response_statements(self):
+        """
+        Return a generator of the statements that are in response to another
+        statement, which are read from the server in batches.
         """
-        response_query = self.statements.distinct('in_response_to.text')
+        return self.filter_iter(batch_size=self.batch_size, has_responses=True)
 
-        _statement_query = {
-            'text': {
-                '$in': response_query
-            }
-        }
+    def drop(self):
+        """
+        Remove the database.
+        """
+        self.client.drop_database(self.database_name)
+
+        # The collection is created again when a statement is saved,
+        # so its indexes are needed for the statements saved after this
+        self.create_indexes()
 
-        _statement_query.update(self.base_query.value())
+        self.clear_indexes()
 
-        statement_query = self.statements.find(_statement_query)
+    def get_async_statements(self):
+        """
+        Return the collection of statements for the Motor asyncio driver,
+        or None if Motor is not installed. The client is created when it
+        is first used, so that it uses the running event loop.
+        """
+        if self.async_statements is None and self.async_driver_installed:
+            try:
+                from motor.motor_asyncio import AsyncIOMotorClient
+            except ImportError:
+                self.logger.info(
+                    'Motor is not installed. Running asynchronous database operations in threads.'
+                )
+                self.async_driver_installed = False
+                return None
 
-        statement_objects = []
+            async_client = AsyncIOMotorClient(self.database_uri)
+            self.async_statements = async_client[self.database_name]['statements']
 
-        for statement in list(statement_query):
-            statement_objects.append(self.mongo_to_object(statement))
+        return self.async_statements
 
-        return statement_objects
+    def afind(self, statement_text):
+        statements = self.get_async_statements()
 
-    def drop(self):
+        if statements is None:
+            return super(MongoDatabaseAdapter, self).afind(statement_text)
+
+        query = self.base_query.statement_text_equals(statement_text)
+
+        def to_object(values):
+            if not values:
+                return None
+
+            return self.mongo_to_object(values)
+
+        return chain_future(statements.find_one(query.value()), to_object)
+
+    def afilter(self, **kwargs):
+        statements = self.get_async_statements()
+
+        if statements is None:
+            return super(MongoDatabaseAdapter, self).afilter(**kwargs)
+
+        query = self.get_filter_query(**kwargs)
+        cursor = statements.find(query.value()).batch_size(self.batch_size)
+
+        return chain_future(
+            cursor.to_list(length=None),
+            lambda matches: [self.mongo_to_object(match) for match in matches]
+        )
+
+    def aupdate(self, statement, **kwargs):
+        import asyncio
+
+        statements = self.get_async_statements()
+
+        if statements is None:
+            return super(MongoDatabaseAdapter, self).aupdate(statement, **kwargs)
+
+        force = kwargs.get('force', False)
+
+        # Do not alter the database unless writing is enabled
+        if not ((force or not self.read_only) and statement.has_changes()):
+            result = asyncio.Future(loop=asyncio.get_event_loop())
+            result.set_result(statement)
+            return result
+
+        changes = statement.get_changes()
+
+        if changes is None:
+            operations = self.get_update_operations(statement)
+        else:
+            operations = self.get_change_operations(statement, changes)
+
+        def write(removed_response_texts):
+            def saved(write_result):
+                statement.mark_saved()
+                self.update_indexes(statement)
+
+                if removed_response_texts:
+                    return chain_future(
+                        self.run_async(self.update_response_flags, removed_response_texts),
+                        lambda flags_result: statement
+                    )
+
+                return statement
+
+            return chain_future(self.async_bulk_write(operations), saved)
+
+        if changes is None:
+            # Every value is replaced, so the responses that the saved
+            # statement no longer includes are found before they are removed
+            return chain_future(
+                self.run_async(self.get_removed_response_texts, [statement]),
+                write
+            )
+
+        return write(changes['removed_responses'])
+
+    def async_bulk_write(self, operations):
         """
-        Remove the database.
+        Return a future for writing operations with the asynchronous driver.
+        A bulk write error is logged, as it is by :code:`update`.
         """
-        self.client.drop_database(self.database_name)
+        import asyncio
+        from pymongo.errors import BulkWriteError
+
+        result = asyncio.Future(loop=asyncio.get_event_loop())
+
+        def written(completed):
+            if completed.cancelled():
+                result.cancel()
+            elif isinstance(completed.exception(), BulkWriteError):
+                # Log the details of a bulk write error
+                self.logger.error(str(completed.exception().details))
+                result.set_result(None)
+            elif completed.exception() is not None:
+                result.set_exception(completed.exception())
+            else:
+                result.set_result(completed.result())
+
+        asyncio.ensure_future(
+            self.get_async_statements().bulk_write(operations, ordered=False)
+        ).add_done_callback(written)
+
+        return result
+
+    def aget_random(self):
+        statements = self.get_async_statements()
+
+        if statements is None:
+            return super(MongoDatabaseAdapter, self).aget_random()
+
+        def to_object(matches):
+            if not matches:
+                raise self.EmptyDatabaseException()
+
+            return self.mongo_to_object(matches[0])
+
+        return chain_future(
+            statements.aggregate([{'$sample': {'size': 1}}]).to_list(length=1),
+            to_object
+        )
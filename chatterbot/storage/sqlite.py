@@ -0,0 +1,383 @@
+import json
+from chatterbot.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class SQLiteStorageAdapter(StorageAdapter):
+    """
+    The SQLiteStorageAdapter allows ChatterBot to store statements
+    in a SQLite database file, without running a database server.
+
+    The statement text and the text of each response are indexed, so
+    statements are found without reading the whole database. The database
+    uses write-ahead logging, which allows other processes to read from it
+    while statements are being saved.
+
+    :keyword database: The path to the SQLite database file.
+                       Use :code:`:memory:` for a temporary database.
+    :type database: str
+
+    .. code-block:: python
+
+       database='database.sqlite3'
+
+    :keyword read_only: If set to True, ChatterBot will not save information to the database.
+                        False by default.
+    :type read_only: bool
+    """
+
+    def __init__(self, **kwargs):
+        super(SQLiteStorageAdapter, self).__init__(**kwargs)
+        import sqlite3
+        import threading
+
+        self.database_path = self.kwargs.get('database', 'database.sqlite3')
+
+        # The connection is shared, so it is only used by one thread at a time
+        self.connection = sqlite3.connect(self.database_path, check_same_thread=False)
+        self.lock = threading.RLock()
+
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.connection.execute('PRAGMA foreign_keys = ON')
+
+        self.create_tables()
+
+        self.adapter_supports_queries = False
+
+    def create_tables(self):
+        """
+        Create the tables and indexes used to store
+        statements if they do not already exist.
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS statement ('
+                'id INTEGER PRIMARY KEY, '
+                'text TEXT NOT NULL UNIQUE, '
+                'extra_data TEXT NOT NULL DEFAULT \'{}\')'
+            )
+
+            # Each statement that a statement is in response to
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS response ('
+                'statement_id INTEGER NOT NULL REFERENCES statement (id) ON DELETE CASCADE, '
+                'text TEXT NOT NULL, '
+                'occurrence INTEGER NOT NULL DEFAULT 1, '
+                'PRIMARY KEY (statement_id, text))'
+            )
+
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS response_text ON response (text)'
+            )
+
+    def count(self):
+        with self.lock:
+            cursor = self.connection.execute('SELECT COUNT(*) FROM statement')
+            return cursor.fetchone()[0]
+
+    def find(self, statement_text):
+        results = self.filter(text=statement_text)
+
+        if not results:
+            return None
+
+        return results[0]
+
+    def find_many(self, statement_texts):
+        """
+        Return the statements that have any of the given text.
+        """
+        statement_texts = list(statement_texts)
+
+        results = []
+
+        # Stay below the limit on the number of parameters in a query
+        for start in range(0, len(statement_texts), 500):
+            chunk = statement_texts[start:start + 500]
+
+            results.extend(self.select(
+                ['statement.text IN ({})'.format(', '.join('?' * len(chunk)))],
+                chunk
+            ))
+
+        return results
+
+    def remove(self, statement_text):
+        """
+        Removes the statement that matches the input text.
+        Removes any responses from statements if the response text matches the
+        input text.
+        """
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM response WHERE text = ?', (statement_text, ))
+            self.connection.execute('DELETE FROM statement WHERE text = ?', (statement_text, ))
+
+        self.remove_from_indexes(statement_text)
+
+    def rows_to_objects(self, rows):
+        """
+        Return a list of statements from rows of statement and response
+        values, where the rows for each statement are next to each other.
+        """
+        results = []
+        statement = None
+        previous_statement_id = None
+
+        for statement_id, text, extra_data, response_text, occurrence in rows:
+            if statement_id != previous_statement_id:
+                statement = Statement(text, extra_data=json.loads(extra_data))
+                previous_statement_id = statement_id
+                results.append(statement)
+
+            if response_text is not None:
+                statement.in_response_to.append(
+                    Response(response_text, occurrence=occurrence)
+                )
+
+        for statement in results:
+            statement.mark_saved()
+
+        return results
+
+    def filter(self, **kwargs):
+        """
+        Returns a list of statements in the database
+        that match the parameters specified.
+
+        The supported parameters are :code:`text`, :code:`extra_data`,
+        :code:`in_response_to` and :code:`in_response_to__contains`.
+        """
+        self.check_filter_parameters(kwargs, [
+            'text', 'extra_data', 'in_response_to', 'in_response_to__contains'
+        ])
+
+        conditions = []
+        parameters = []
+
+        if 'text' in kwargs:
+            conditions.append('statement.text = ?')
+            parameters.append(kwargs['text'])
+
+        if 'in_response_to' in kwargs:
+            responses = kwargs['in_response_to']
+
+            if responses:
+                conditions.append(
+                    'statement.id IN (SELECT statement_id FROM response WHERE text IN ({}))'.format(
+                        ', '.join('?' * len(responses))
+                    )
+                )
+                parameters.extend(response.text for response in responses)
+            else:
+                conditions.append(
+                    'NOT EXISTS (SELECT 1 FROM response WHERE statement_id = statement.id)'
+                )
+
+        if 'in_response_to__contains' in kwargs:
+            response_texts = kwargs['in_response_to__contains']
+
+            # Match statements that contain any one of a list of values
+            if not isinstance(response_texts, list):
+                response_texts = [response_texts]
+
+            conditions.append(
+                'statement.id IN (SELECT statement_id FROM response WHERE text IN ({}))'.format(
+                    ', '.join('?' * len(response_texts))
+                )
+            )
+            parameters.extend(response_texts)
+
+        results = self.select(conditions, parameters)
+
+        # Extra data is compared after it is loaded, because the same
+        # values can be saved as JSON text in a different order
+        if 'extra_data' in kwargs:
+            results = [
+                statement for statement in results
+                if statement.extra_data == kwargs['extra_data']
+            ]
+
+        return results
+
+    def select(self, conditions, parameters):
+        """
+        Return the statements that match all of the SQL conditions.
+        """
+        query = (
+            'SELECT statement.id, statement.text, statement.extra_data, '
+            'response.text, response.occurrence '
+            'FROM statement LEFT JOIN response ON response.statement_id = statement.id'
+        )
+
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+
+        query += ' ORDER BY statement.id, response.rowid'
+
+        with self.lock:
+            rows = self.connection.execute(query, parameters).fetchall()
+
+        return self.rows_to_objects(rows)
+
+    def update(self, statement, **kwargs):
+        """
+        Update a statement in the database.
+        """
+        # Do not alter the database unless writing is enabled
+        if not self.read_only and statement.has_changes():
+            changes = statement.get_changes()
+
+            with self.lock, self.connection:
+                if changes is None:
+                    self.save_statement(statement)
+                else:
+                    self.save_changes(statement, changes)
+
+            statement.mark_saved()
+            self.update_indexes(statement)
+
+        return statement
+
+    def bulk_update(self, statements, **kwargs):
+        """
+        Update a list of statements in the database in one transaction.
+        """
+        # Do not alter the database unless writing is enabled
+        if not self.read_only:
+            changed_statements = [
+                statement for statement in statements if statement.has_changes()
+            ]
+
+            with self.lock, self.connection:
+                for statement in changed_statements:
+                    changes = statement.get_changes()
+
+                    if changes is None:
+                        self.save_statement(statement)
+                    else:
+                        self.save_changes(statement, changes)
+
+            for statement in changed_statements:
+                statement.mark_saved()
+                self.update_indexes(statement)
+
+        return statements
+
+    def save_statement(self, statement):
+        """
+        Save every value of a statement, replacing any saved responses.
+        """
+        self.connection.execute(
+            'INSERT OR IGNORE INTO statement (text) VALUES (?)', (statement.text, )
+        )
+        self.connection.execute(
+            'UPDATE statement SET extra_data = ? WHERE text = ?',
+            (json.dumps(statement.extra_data), statement.text, )
+        )
+
+        statement_id = self.connection.execute(
+            'SELECT id FROM statement WHERE text = ?', (statement.text, )
+        ).fetchone()[0]
+
+        self.connection.execute(
+            'DELETE FROM response WHERE statement_id = ?', (statement_id, )
+        )
+        self.add_responses(statement_id, statement.in_response_to)
+
+    def save_changes(self, statement, changes):
+        """
+        Save only the values of a statement that changed since it was last saved.
+        Occurrence counts are incremented, so changes saved by other connections
+        are kept.
+        """
+        row = self.connection.execute(
+            'SELECT id FROM statement WHERE text = ?', (statement.text, )
+        ).fetchone()
+
+        # The statement was removed after it was read
+        if row is None:
+            return self.save_statement(statement)
+
+        statement_id = row[0]
+
+        if changes['extra_data']:
+            self.connection.execute(
+                'UPDATE statement SET extra_data = ? WHERE id = ?',
+                (json.dumps(statement.extra_data), statement_id, )
+            )
+
+        self.connection.executemany(
+            'DELETE FROM response WHERE statement_id = ? AND text = ?',
+            [(statement_id, text, ) for text in changes['removed_responses']]
+        )
+        self.connection.executemany(
+            'UPDATE response SET occurrence = occurrence + ? '
+            'WHERE statement_id = ? AND text = ?',
+            [
+                (difference, statement_id, response.text, )
+                for response, difference in changes['occurrence_changes']
+            ]
+        )
+        self.add_responses(statement_id, changes['added_responses'])
+
+    def add_responses(self, statement_id, responses):
+        """
+        Save responses for a statement, and make sure
+        that an entry for each response exists.
+        """
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO response (statement_id, text, occurrence) '
+            'VALUES (?, ?, ?)',
+            [
+                (statement_id, response.text, response.occurrence, )
+                for response in responses
+            ]
+        )
+        self.connection.executemany(
+            'INSERT OR IGNORE INTO statement (text) VALUES (?)',
+            [(response.text, ) for response in responses]
+        )
+
+    def get_random(self):
+        """
+        Returns a random statement from the database
+        """
+        from random import randint
+
+        with self.lock:
+            min_id, max_id = self.connection.execute(
+                'SELECT MIN(id), MAX(id) FROM statement'
+            ).fetchone()
+
+        if min_id is None:
+            raise self.EmptyDatabaseException()
+
+        # Select the first statement at or after a random id
+        results = self.select(
+            ['statement.id = (SELECT MIN(id) FROM statement WHERE id >= ?)'],
+            [randint(min_id, max_id)]
+        )
+
+        return results[0]
+
+    def drop(self):
+        """
+        Remove all statements from the database.
+        """
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM response')
+            self.connection.execute('DELETE FROM statement')
+
+        self.clear_indexes()
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        A statement must exist which lists the closest matching statement in the
+        in_response_to field. Otherwise, the logic adapter may find a closest
+        matching statement that does not have a known response.
+        """
+        return self.select(
+            ['statement.text IN (SELECT text FROM response)'], []
+        )
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from chatterbot.adapters import Adapter
 
 
@@ -16,16 +17,118 @@ class StorageAdapter(Adapter):
         self.kwargs = kwargs
         self.read_only = kwargs.get('read_only', False)
         self.adapter_supports_queries = True
-        self.base_query = None
+        self.shared_base_query = None
+
+        # Indexes that are notified when statements are saved or removed
+        self.indexes = []
+
+        # The statements that have known responses, once they have been found
+        self.response_statements = None
+
+    @property
+    def base_query(self):
+        """
+        The query that statements are selected from. While a match context
+        is active, the base query that was generated for its input statement
+        is used, so that responses that are generated at the same time in
+        different sessions do not use each other's query.
+        """
+        from chatterbot.logic.match_context import MatchContext
+
+        context = MatchContext.get_active()
+
+        if context is not None and context.base_query is not None:
+            return context.base_query
+
+        return self.shared_base_query
+
+    @base_query.setter
+    def base_query(self, query):
+        from chatterbot.logic.match_context import MatchContext
+
+        context = MatchContext.get_active()
+
+        if context is not None:
+            context.base_query = query
+        else:
+            self.shared_base_query = query
 
     def generate_base_query(self, chatterbot, session_id):
         """
         Create a base query for the storage adapter.
+        When a match context is active, the query is only
+        used while that context is active.
         """
         if self.adapter_supports_queries:
             for filter_instance in chatterbot.filters:
                 self.base_query = filter_instance.filter_selection(chatterbot, session_id)
 
+    def add_index(self, index):
+        """
+        Register an index that should be kept up to date
+        when statements are updated or removed. Any object with
+        :code:`statement_updated` and :code:`statement_removed`
+        methods can be registered. If the index also has a
+        :code:`statements_cleared` method, it is called when
+        the database is dropped.
+        """
+        if index not in self.indexes:
+            self.indexes.append(index)
+
+    def update_indexes(self, statement):
+        """
+        Notify each registered index that a statement has been saved.
+        Storage adapters should call this method from :code:`update`.
+        """
+        for index in self.indexes:
+            index.statement_updated(statement)
+
+    def remove_from_indexes(self, statement_text):
+        """
+        Notify each registered index that a statement has been removed.
+        Storage adapters should call this method from :code:`remove`.
+        """
+        for index in self.indexes:
+            index.statement_removed(statement_text)
+
+    def clear_indexes(self):
+        """
+        Notify each registered index that every statement has been removed,
+        and discard the set of statements that have known responses.
+        Storage adapters should call this method from :code:`drop`.
+        """
+        self.reset_response_statements()
+
+        # An index may unregister itself when it is cleared
+        for index in list(self.indexes):
+            statements_cleared = getattr(index, 'statements_cleared', None)
+
+            if statements_cleared is not None:
+                statements_cleared()
+
+    def check_filter_parameters(self, kwargs, supported_parameters):
+        """
+        Raise an exception if any of the filter parameters is not supported.
+        """
+        unsupported_parameters = sorted(set(kwargs) - set(supported_parameters))
+
+        if unsupported_parameters:
+            raise self.UnsupportedFilterException(
+                'The {} cannot filter statements by: {}'.format(
+                    self.__class__.__name__, ', '.join(unsupported_parameters)
+                )
+            )
+
+    def reset_response_statements(self):
+        """
+        Discard the set of statements that have known responses so that it
+        is found again the next time it is needed.
+        Storage adapters should call this method from :code:`drop`.
+        """
+        if self.response_statements is not None:
+            self.indexes.remove(self.response_statements)
+            self.response_statements = None
+
     def count(self):
         """
         Return the number of entries in the database.
@@ -38,6 +141,22 @@ class StorageAdapter(Adapter):
         """
         raise self.AdapterMethodNotImplementedError()
 
+    def find_many(self, statement_texts):
+        """
+        Return the statements in the database that have any of the given text.
+        Storage adapters can override this method to find all of
+        the statements with fewer queries.
+        """
+        results = []
+
+        for statement_text in statement_texts:
+            statement = self.find(statement_text)
+
+            if statement is not None:
+                results.append(statement)
+
+        return results
+
     def remove(self, statement_text):
         """
         Removes the statement that matches the input text.
@@ -63,6 +182,18 @@ class StorageAdapter(Adapter):
         """
         raise self.AdapterMethodNotImplementedError()
 
+    def bulk_update(self, statements, **kwargs):
+        """
+        Modifies a list of entries in the database, creating
+        any entries that do not exist. Each statement is saved
+        as it would be by :code:`update`. Storage adapters can override
+        this method to save all of the statements with fewer queries.
+        """
+        for statement in statements:
+            self.update(statement, **kwargs)
+
+        return statements
+
     def get_random(self):
         """
         Returns a random statement from the database
@@ -75,6 +206,54 @@ class StorageAdapter(Adapter):
         """
         raise self.AdapterMethodNotImplementedError()
 
+    def run_async(self, method, *args, **kwargs):
+        """
+        Return an asyncio future for the result of calling a method of the
+        adapter in the event loop's default executor, so that the event
+        loop is not blocked while the method waits for the database.
+        """
+        import asyncio
+        import functools
+
+        loop = asyncio.get_event_loop()
+
+        return loop.run_in_executor(None, functools.partial(method, *args, **kwargs))
+
+    def afind(self, statement_text):
+        """
+        Return an asyncio future for the result of :code:`find`. Storage
+        adapters with an asynchronous database driver can override the
+        asynchronous methods. Otherwise, each method is run in a thread.
+        """
+        return self.run_async(self.find, statement_text)
+
+    def afilter(self, **kwargs):
+        """
+        Return an asyncio future for the result of :code:`filter`.
+        """
+        return self.run_async(self.filter, **kwargs)
+
+    def aupdate(self, statement, **kwargs):
+        """
+        Return an asyncio future for the result of :code:`update`.
+        """
+        return self.run_async(self.update, statement, **kwargs)
+
+    def aget_random(self):
+        """
+        Return an asyncio future for the result of :code:`get_random`.
+        """
+        return self.run_async(self.get_random)
+
+    def iter_response_statements(self):
+        """
+        Return an iterator of the statements that are in response to another
+        statement. Storage adapters that can read statements from the database
+        in batches override this method, so that every statement does not need
+        to be held in memory at once.
+        """
+        return iter(self.get_response_statements())
+
     def get_response_statements(self):
         """
         Return only statements that are in response to another statement.
@@ -84,22 +263,34 @@ class StorageAdapter(Adapter):
 
         This method may be overridden by a child class to provide more a
         efficient method to get these results.
+
+        The statements are found the first time this method is called, and are
+        kept up to date as statements are updated or removed after that.
+        The returned list should not be modified.
         """
-        statement_list = self.filter()
+        return self.get_response_statement_set().get_statements(self)
 
-        responses = set()
-        to_remove = list()
-        for statement in statement_list:
-            for response in statement.in_response_to:
-                responses.add(response.text)
-        for statement in statement_list:
-            if statement.text not in responses:
-                to_remove.append(statement)
+    def get_response_statement_set(self):
+        """
+        Return the set of statements that have known responses. The set is
+        created from every statement in the database the first time it is
+        needed, and is kept up to date as statements are updated or removed.
 
-        for statement in to_remove:
-            statement_list.remove(statement)
+        :rtype: ResponseStatementSet
+        """
+        if self.response_statements is None:
+            self.response_statements = ResponseStatementSet(self.filter())
+            self.add_index(self.response_statements)
 
-        return statement_list
+        return self.response_statements
+
+    class UnsupportedFilterException(Exception):
+
+        def __init__(self, value='The storage adapter cannot filter statements by this parameter.'):
+            self.value = value
+
+        def __str__(self):
+            return repr(self.value)
 
     class EmptyDatabaseException(Exception):
 
@@ -108,3 +299,180 @@ class StorageAdapter(Adapter):
 
         def __str__(self):
             return repr(self.value)
+
+
+class ResponseStatementSet(object):
+    """
+    The statements that are in response to at least one other statement,
+    and the texts of the statements that are in response to each statement.
+
+    The set is kept up to date as statements are updated or removed, so that
+    the database does not need to be searched each time it is used.
+    Statements that become known responses when another statement is saved
+    are found in the database the next time the statements are requested.
+
+    :param statement_list: Every statement in the database.
+    :type statement_list: list
+    """
+
+    def __init__(self, statement_list):
+        import threading
+
+        # Guards the set while it is read in one thread and updated in another
+        self.lock = threading.RLock()
+
+        # The texts of the statements that each statement is in response to
+        self.in_response_to = {}
+
+        # The texts of the statements that are in response to each statement,
+        # in the order that they were saved
+        self.responses = {}
+
+        self.statements = []
+
+        # The position of each statement in the list of statements
+        self.positions = {}
+
+        # Statements in the list that need to be found in the database
+        self.unresolved = set()
+
+        self.requires_rebuild = False
+
+        for statement in statement_list:
+            self.add_responses(statement)
+
+        for statement in statement_list:
+            if statement.text in self.responses and statement.text not in self.positions:
+                self.add(statement.text, statement)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, statement_text):
+        return statement_text in self.positions
+
+    def get_responses(self, statement_text):
+        """
+        Return the texts of the statements that are in response
+        to a statement, in the order that they were saved.
+        """
+        return list(self.responses.get(statement_text, ()))
+
+    def add_responses(self, statement):
+        """
+        Record each of the responses of a statement, and return
+        the texts of the responses that were not already known.
+        """
+        responses = self.in_response_to.setdefault(statement.text, set())
+
+        new_responses = []
+        for response in statement.in_response_to:
+            if response.text not in responses:
+                responses.add(response.text)
+                self.responses.setdefault(response.text, OrderedDict())[statement.text] = True
+                new_responses.append(response.text)
+
+        return new_responses
+
+    def remove_responses(self, statement_text, response_texts):
+        """
+        Forget that a statement is in response to each of the statements, and
+        remove the statements that are no longer in response to any statement.
+        """
+        responses = self.in_response_to.get(statement_text, set())
+
+        for response_text in list(response_texts):
+            responses.discard(response_text)
+
+            statement_texts = self.responses.get(response_text)
+
+            if statement_texts is not None:
+                statement_texts.pop(statement_text, None)
+
+                if not statement_texts:
+                    del self.responses[response_text]
+                    self.discard(response_text)
+
+    def add(self, statement_text, statement=None):
+        """
+        Add a statement to the list. If the statement is None,
+        it will be found in the database when it is needed.
+        """
+        self.positions[statement_text] = len(self.statements)
+        self.statements.append(statement)
+
+        if statement is None:
+            self.unresolved.add(statement_text)
+
+    def discard(self, statement_text):
+        """
+        Remove a statement from the list if it is in the list.
+        """
+        if self.positions.pop(statement_text, None) is not None:
+            self.unresolved.discard(statement_text)
+            self.requires_rebuild = True
+
+    def statement_updated(self, statement):
+        """
+        Called by the storage adapter when a statement has been saved.
+        """
+        with self.lock:
+            # Responses that were removed from the statement since it was last saved
+            response_texts = set(response.text for response in statement.in_response_to)
+            self.remove_responses(
+                statement.text,
+                self.in_response_to.get(statement.text, set()) - response_texts
+            )
+
+            for response_text in self.add_responses(statement):
+                if response_text not in self.positions:
+                    self.add(response_text)
+
+            if statement.text in self.positions:
+                # Keep the most recently saved version of the statement
+                self.statements[self.positions[statement.text]] = statement
+                self.unresolved.discard(statement.text)
+            elif statement.text in self.responses:
+                self.add(statement.text, statement)
+
+    def statement_removed(self, statement_text):
+        """
+        Called by the storage adapter when a statement has been removed.
+        """
+        with self.lock:
+            self.remove_responses(statement_text, self.in_response_to.pop(statement_text, ()))
+
+            for response_statement_text in self.responses.pop(statement_text, ()):
+                self.in_response_to[response_statement_text].discard(statement_text)
+
+            self.discard(statement_text)
+
+    def get_statements(self, storage):
+        """
+        Return a copy of the list of statements, finding any
+        statements that are not yet known in the storage adapter.
+        """
+        with self.lock:
+            for statement_text in list(self.unresolved):
+                statement = storage.find(statement_text)
+
+                if statement is None:
+                    self.discard(statement_text)
+                else:
+                    self.statements[self.positions[statement_text]] = statement
+                    self.unresolved.discard(statement_text)
+
+            if self.requires_rebuild:
+                statement_list = [
+                    statement for position, statement in enumerate(self.statements)
+                    if statement is not None and self.positions.get(statement.text) == position
+                ]
+
+                self.statements = []
+                self.positions = {}
+                for statement in statement_list:
+                    self.add(statement.text, statement)
+
+                self.requires_rebuild = False
+
+            return list(self.statements)
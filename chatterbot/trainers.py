@@ -29,6 +29,75 @@ class Trainer(object):
 
         return statement
 
+    def get_training_statements(self, conversations, extra_data=None):
+        """
+        Return the statements learned from a list of conversations.
+
+        The number of times that each statement follows another statement is
+        counted in memory first, then the counts are added to the statements
+        that are already in the database, which are found all at once.
+
+        :param extra_data: A dictionary of the extra data to add to each
+                           statement, where the keys are the statement text.
+        :type extra_data: dict
+        """
+        extra_data = extra_data or {}
+
+        from collections import OrderedDict
+
+        # The number of times that each statement is in response to each other statement
+        response_counts = OrderedDict()
+
+        for conversation in conversations:
+            previous_text = None
+
+            for text in conversation:
+                counts = response_counts.setdefault(text, OrderedDict())
+
+                if previous_text is not None:
+                    counts[previous_text] = counts.get(previous_text, 0) + 1
+
+                previous_text = text
+
+        existing_statements = {}
+        for statement in self.storage.find_many(list(response_counts.keys())):
+            existing_statements[statement.text] = statement
+
+        statements = []
+
+        for text, counts in response_counts.items():
+            statement = existing_statements.get(text) or Statement(text)
+
+            statement.extra_data.update(extra_data.get(text, {}))
+
+            for response_text, count in counts.items():
+                for response in statement.in_response_to:
+                    if response.text == response_text:
+                        response.occurrence += count
+                        break
+                else:
+                    statement.in_response_to.append(
+                        Response(response_text, occurrence=count)
+                    )
+
+            statements.append(statement)
+
+        return statements
+
+    def bulk_train(self, conversations, extra_data=None):
+        """
+        Train the chat bot with a list of conversations, where each
+        conversation is a list of strings. All of the statements are
+        saved with one bulk update.
+
+        :param extra_data: A dictionary of the extra data to add to each
+                           statement, where the keys are the statement text.
+        :type extra_data: dict
+        """
+        statements = self.get_training_statements(conversations, extra_data)
+
+        self.storage.bulk_update(statements, force=True)
+
     class TrainerInitializationException(Exception):
         """
         Exception raised when a base class has not overridden
@@ -76,18 +145,7 @@ class ListTrainer(Trainer):
         Train the chat bot based on the provided list of
         statements that represents a single conversation.
         """
-        statement_history = []
-
-        for text in conversation:
-            statement = self.get_or_create(text)
-
-            if statement_history:
-                statement.add_response(
-                    Response(statement_history[-1].text)
-                )
-
-            statement_history.append(statement)
-            self.storage.update(statement, force=True)
+        self.bulk_train([conversation])
 
 
 class ChatterBotCorpusTrainer(Trainer):
@@ -103,18 +161,21 @@ class ChatterBotCorpusTrainer(Trainer):
         self.corpus = Corpus()
 
     def train(self, *corpora):
-        trainer = ListTrainer(self.storage)
-
         # Allow a list of coupora to be passed instead of arguments
         if len(corpora) == 1:
             if isinstance(corpora[0], list):
                 corpora = corpora[0]
 
+        conversations = []
+
         for corpus in corpora:
             corpus_data = self.corpus.load_corpus(corpus)
             for data in corpus_data:
                 for pair in data:
-                    trainer.train(pair)
+                    conversations.append(pair)
+
+        # Save every conversation in the corpora at once
+        self.bulk_train(conversations)
 
 
 class TwitterTrainer(Trainer):
@@ -207,10 +268,60 @@ class TwitterTrainer(Trainer):
                 self.storage.update(statement, force=True)
 
 
+def read_ubuntu_dialog_file(file_path):
+    """
+    Read a file of the Ubuntu Dialog Corpus. This function is run in
+    worker processes, so it only parses the file.
+
+    :returns: A list of (text, extra_data) tuples for each line of the dialog.
+    :rtype: list
+    """
+    import csv
+
+    rows = []
+
+    with open(file_path, 'r') as tsv:
+        reader = csv.reader(tsv, delimiter='\t')
+
+        for row in reader:
+            if len(row) > 0:
+                extra_data = {
+                    'datetime': row[0],
+                    'speaker': row[1]
+                }
+
+                if row[2].strip():
+                    extra_data['addressing_speaker'] = row[2]
+
+                rows.append((row[3], extra_data, ))
+
+    return rows
+
+
 class UbuntuCorpusTrainer(Trainer):
     """
     Allow chatbots to be trained with the data from
     the Ubuntu Dialog Corpus.
+
+    The dialog files are read by a pool of worker processes, and the
+    statements from them are saved in batches. Each file that has been
+    saved is recorded in a checkpoint file, so training that is stopped
+    continues from the files that have not been saved. The checkpoint records
+    the database that the files were saved to, and it is cleared when training
+    with another database, or when the database has no statements, such as
+    after it is dropped.
+
+    :keyword ubuntu_corpus_worker_count: The number of processes that read
+                                         dialog files. Defaults to the number of CPUs.
+    :type ubuntu_corpus_worker_count: int
+
+    :keyword ubuntu_corpus_batch_size: The number of lines of dialog that are
+                                       read before they are saved. Defaults to 10000.
+    :type ubuntu_corpus_batch_size: int
+
+    :keyword ubuntu_corpus_checkpoint_path: The path to the checkpoint file.
+                                            Defaults to a file in the data directory.
+    :type ubuntu_corpus_checkpoint_path: str
     """
 
     def __init__(self, storage, **kwargs):
@@ -227,6 +338,14 @@ class UbuntuCorpusTrainer(Trainer):
             './data/'
         )
 
+        self.worker_count = kwargs.get('ubuntu_corpus_worker_count')
+        self.batch_size = kwargs.get('ubuntu_corpus_batch_size', 10000)
+
+        self.checkpoint_path = kwargs.get(
+            'ubuntu_corpus_checkpoint_path',
+            os.path.join(self.data_directory, 'training_checkpoint.txt')
+        )
+
         # Create the data directory if it does not already exist
         if not os.path.exists(self.data_directory):
             os.makedirs(self.data_directory)
@@ -294,7 +413,7 @@ class UbuntuCorpusTrainer(Trainer):
             for member in members:
                 # this will be the current file being extracted
                 yield member
-                print('Extracting {}'.format(member.path))
+                self.logger.debug('Extracting {}'.format(member.path))
 
         with tarfile.open(file_path) as tar:
             tar.extractall(path=self.data_directory, members=track_progress(tar))
@@ -303,46 +422,184 @@ class UbuntuCorpusTrainer(Trainer):
 
         return True
 
+    def get_checkpoint_header(self):
+        """
+        Return the first line of the checkpoint file, which
+        identifies the database that the dialog files are saved to.
+        """
+        import json
+
+        storage_class = type(self.storage)
+
+        return 'database: ' + json.dumps([
+            storage_class.__module__ + '.' + storage_class.__name__,
+            self.storage.kwargs.get('database_uri'),
+            self.storage.kwargs.get('database')
+        ])
+
+    def read_checkpoint(self):
+        """
+        Return the set of dialog files that have already been saved to the database.
+        """
+        import os
+
+        if not os.path.exists(self.checkpoint_path):
+            return set()
+
+        with open(self.checkpoint_path, 'r') as checkpoint_file:
+            lines = [line.rstrip('\n') for line in checkpoint_file if line.strip()]
+
+        # The files were saved to another database
+        if not lines or lines[0] != self.get_checkpoint_header():
+            self.logger.info('The checkpoint is for another database. Training every file again')
+            self.clear_checkpoint()
+            return set()
+
+        return set(lines[1:])
+
+    def clear_checkpoint(self):
+        """
+        Remove the record of the dialog files that have been saved.
+        """
+        import os
+
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def write_checkpoint(self, file_names):
+        """
+        Record that the dialog files have been saved.
+        """
+        import os
+
+        is_new = not os.path.exists(self.checkpoint_path) or not os.path.getsize(self.checkpoint_path)
+
+        with open(self.checkpoint_path, 'a') as checkpoint_file:
+            if is_new:
+                checkpoint_file.write(self.get_checkpoint_header() + '\n')
+
+            for file_name in file_names:
+                checkpoint_file.write(file_name + '\n')
+
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+    def read_files(self, file_paths):
+        """
+        Read the dialog files in a pool of worker processes.
+        The rows of each file are yielded in the order of the files,
+        and only a few files are read ahead of the files being saved.
+        """
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        worker_count = self.worker_count or multiprocessing.cpu_count()
+
+        if worker_count < 2:
+            for file_path in file_paths:
+                yield file_path, read_ubuntu_dialog_file(file_path)
+            return
+
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            pending = deque()
+
+            for file_path in file_paths:
+                pending.append((file_path, executor.submit(read_ubuntu_dialog_file, file_path), ))
+
+                if len(pending) >= worker_count * 4:
+                    file_path, future = pending.popleft()
+                    yield file_path, future.result()
+
+            while pending:
+                file_path, future = pending.popleft()
+                yield file_path, future.result()
+
     def train(self):
         import glob
-        import csv
         import os
+        import time
 
         # Download and extract the Ubuntu dialog corpus
         corpus_download_path = self.download(self.data_download_url)
 
         self.extract(corpus_download_path)
 
-        extracted_corpus_path = os.path.join(
+        extracted_directory = os.path.join(
             self.data_directory,
-            os.path.split(corpus_download_path)[-1].split('.')[0],
-            '**', '*.tsv'
+            os.path.split(corpus_download_path)[-1].split('.')[0]
         )
 
-        for file in glob.iglob(extracted_corpus_path):
-            self.logger.info('Training from: {}'.format(file))
+        extracted_corpus_path = os.path.join(extracted_directory, '**', '*.tsv')
+
+        completed_files = self.read_checkpoint()
 
-            with open(file, 'r') as tsv:
-                reader = csv.reader(tsv, delimiter='\t')
+        # The statements from the completed files are no longer saved
+        if completed_files and not self.storage.count():
+            self.logger.info('The database is empty. Training every file again')
+            self.clear_checkpoint()
+            completed_files = set()
 
-                statement_history = []
+        if completed_files:
+            self.logger.info('Skipping {} files that have already been trained'.format(
+                len(completed_files)
+            ))
 
-                for row in reader:
-                    if len(row) > 0:
-                        text = row[3]
-                        statement = self.get_or_create(text)
-                        print(text, len(row))
+        file_paths = (
+            file_path for file_path in glob.iglob(extracted_corpus_path)
+            if os.path.relpath(file_path, extracted_directory) not in completed_files
+        )
 
-                        statement.add_extra_data('datetime', row[0])
-                        statement.add_extra_data('speaker', row[1])
+        conversations = []
+        extra_data = {}
+        batch_files = []
+        batch_rows = 0
 
-                        if row[2].strip():
-                            statement.add_extra_data('addressing_speaker', row[2])
+        file_count = 0
+        row_count = 0
+        start_time = time.time()
+
+        for file_path, rows in self.read_files(file_paths):
+            conversation = []
+
+            for text, data in rows:
+                conversation.append(text)
+                extra_data.setdefault(text, {}).update(data)
+
+            conversations.append(conversation)
+            batch_files.append(os.path.relpath(file_path, extracted_directory))
+            batch_rows += len(rows)
+
+            if batch_rows >= self.batch_size:
+                self.bulk_train(conversations, extra_data)
+                self.write_checkpoint(batch_files)
+
+                file_count += len(batch_files)
+                row_count += batch_rows
+                self.log_progress(file_count, row_count, start_time)
+
+                conversations = []
+                extra_data = {}
+                batch_files = []
+                batch_rows = 0
+
+        if batch_files:
+            self.bulk_train(conversations, extra_data)
+            self.write_checkpoint(batch_files)
+
+            file_count += len(batch_files)
+            row_count += batch_rows
+            self.log_progress(file_count, row_count, start_time)
+
+    def log_progress(self, file_count, row_count, start_time):
+        """
+        Log the number of files and rows that have been trained,
+        and the number of rows trained each second.
+        """
+        import time
 
-                        if statement_history:
-                            statement.add_response(
-                                Response(statement_history[-1].text)
-                            )
+        elapsed_time = max(time.time() - start_time, 0.001)
 
-                        statement_history.append(statement)
-                        self.storage.update(statement, force=True)
+        self.logger.info('Trained {} files and {} rows ({:.0f} rows per second)'.format(
+            file_count, row_count, row_count / elapsed_time
+        ))
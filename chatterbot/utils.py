@@ -184,3 +184,52 @@ def remove_stopwords(tokens, language):
     tokens = set(tokens) - set(stop_words)
 
     return tokens
+
+
+def chain_future(future, callback):
+    """
+    Return an asyncio future for the result of calling the callback with the
+    result of another future. If the callback returns an awaitable, the
+    returned future has the result of the awaitable instead. Exceptions raised
+    by either future or by the callback are set on the returned future.
+
+    This allows asynchronous steps to be combined on versions of Python
+    that do not support the async and await syntax.
+    """
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    result = asyncio.Future(loop=loop)
+
+    def copy_state(completed):
+        if result.done():
+            return
+
+        if completed.cancelled():
+            result.cancel()
+        elif completed.exception() is not None:
+            result.set_exception(completed.exception())
+        else:
+            result.set_result(completed.result())
+
+    def call_back(completed):
+        if result.done():
+            return
+
+        if completed.cancelled() or completed.exception() is not None:
+            return copy_state(completed)
+
+        try:
+            value = callback(completed.result())
+        except Exception as exception:
+            result.set_exception(exception)
+            return
+
+        if asyncio.iscoroutine(value) or isinstance(value, asyncio.Future):
+            asyncio.ensure_future(value).add_done_callback(copy_state)
+        else:
+            result.set_result(value)
+
+    asyncio.ensure_future(future).add_done_callback(call_back)
+
+    return result
@@ -87,3 +87,27 @@ class ChatBotMongoTestCase(ChatBotTestCase):
         kwargs['database'] = self.random_string()
         kwargs['storage_adapter'] = 'chatterbot.storage.MongoDatabaseAdapter'
         return kwargs
+
+
+class ChatBotSQLiteTestCase(ChatBotTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotSQLiteTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.storage.SQLiteStorageAdapter'
+        return kwargs
+
+
+class ChatBotMemoryTestCase(ChatBotTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotMemoryTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.storage.MemoryStorageAdapter'
+        return kwargs
+
+
+class ChatBotLogFileTestCase(ChatBotTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotLogFileTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.storage.LogFileStorageAdapter'
+        return kwargs
@@ -83,3 +83,60 @@ class StatementTests(TestCase):
     def test_add_non_response(self):
         with self.assertRaises(Statement.InvalidTypeException):
             self.statement.add_response(Statement("Blah"))
+
+    def test_new_statement_has_changes(self):
+        self.assertTrue(self.statement.has_changes())
+        self.assertIsNone(self.statement.get_changes())
+
+    def test_saved_statement_has_no_changes(self):
+        self.statement.add_response(Response("ABC"))
+        self.statement.mark_saved()
+
+        self.assertFalse(self.statement.has_changes())
+
+    def test_extra_data_changed(self):
+        self.statement.mark_saved()
+        self.statement.add_extra_data('pos_tags', ['NN'])
+
+        self.assertTrue(self.statement.has_changes())
+        self.assertTrue(self.statement.get_changes()['extra_data'])
+
+    def test_nested_extra_data_changed(self):
+        self.statement.add_extra_data('pos_tags', ['NN'])
+        self.statement.mark_saved()
+        self.statement.extra_data['pos_tags'].append('VB')
+
+        self.assertTrue(self.statement.has_changes())
+
+    def test_occurrence_changed(self):
+        self.statement.add_response(Response("ABC"))
+        self.statement.mark_saved()
+        self.statement.add_response(Response("ABC"))
+
+        changes = self.statement.get_changes()
+
+        self.assertTrue(self.statement.has_changes())
+        self.assertFalse(changes['extra_data'])
+        self.assertEqual(changes['added_responses'], [])
+        self.assertEqual(len(changes['occurrence_changes']), 1)
+        self.assertEqual(changes['occurrence_changes'][0][0].text, "ABC")
+        self.assertEqual(changes['occurrence_changes'][0][1], 1)
+
+    def test_responses_added_and_removed(self):
+        self.statement.add_response(Response("ABC"))
+        self.statement.mark_saved()
+        self.statement.remove_response("ABC")
+        self.statement.add_response(Response("DEF"))
+
+        changes = self.statement.get_changes()
+
+        self.assertEqual(changes['added_responses'], ["DEF"])
+        self.assertEqual(changes['removed_responses'], ["ABC"])
+        self.assertEqual(changes['occurrence_changes'], [])
+
+    def test_text_changed(self):
+        self.statement.mark_saved()
+        self.statement.text = "Another statement."
+
+        self.assertTrue(self.statement.has_changes())
+        self.assertIsNone(self.statement.get_changes())
@@ -94,3 +94,248 @@ class BestMatchLevenshteinDistanceTestCase(TestCase):
 
         self.assertEqual(confidence, 0)
         self.assertEqual(match.text, "Random")
+
+
+class LevenshteinUpperBoundTestCase(TestCase):
+    """
+    Tests for the upper bound of the Levenshtein distance comparison.
+    """
+
+    def test_upper_bound_is_not_less_than_distance(self):
+        from chatterbot.comparisons import levenshtein_distance, levenshtein_upper_bound
+
+        pairs = [
+            ('What is your quest?', 'What... is your quest?'),
+            ('wwxx', 'xxyy'),
+            ('xxx', 'yyy'),
+            ('Who do you love?', 'I hear you are going on a quest?'),
+        ]
+
+        for text, other_text in pairs:
+            statement = Statement(text)
+            other_statement = Statement(other_text)
+
+            self.assertGreaterEqual(
+                levenshtein_upper_bound(statement, other_statement),
+                levenshtein_distance(statement, other_statement)
+            )
+
+    def test_upper_bound_no_common_characters(self):
+        from chatterbot.comparisons import levenshtein_upper_bound
+
+        self.assertEqual(levenshtein_upper_bound(Statement('xxx'), Statement('yyy')), 0)
+
+    def test_length_ratio_bound(self):
+        from chatterbot.comparisons import length_ratio_bound
+
+        self.assertEqual(length_ratio_bound(2, 6), 0.5)
+        self.assertEqual(length_ratio_bound(0, 6), 0)
+
+
+class BestMatchTrigramIndexTestCase(TestCase):
+    """
+    Integration tests for the BestMatch logic adapter using
+    Levenshtein distance with a trigram index.
+    """
+
+    def setUp(self):
+        from chatterbot.comparisons import levenshtein_distance
+
+        self.adapter = BestMatch(
+            statement_comparison_function=levenshtein_distance,
+            statement_index='chatterbot.indexes.TrigramIndex',
+            index_candidate_limit=2
+        )
+        self.adapter.set_chatbot(MockChatBot())
+
+        texts = [
+            'Who do you love?',
+            'What is the meaning of life?',
+            'I am Iron Man.',
+            'What... is your quest?',
+            'Yuck, black licorice jelly beans.',
+            'I hear you are going on a quest?',
+            'xxyy',
+        ]
+        self.possible_choices = [
+            Statement(text, in_response_to=[Response(texts[index - 1])])
+            for index, text in enumerate(texts)
+        ]
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=self.possible_choices)
+
+    def test_same_confidence_as_full_scan(self):
+        from chatterbot.comparisons import levenshtein_distance
+
+        for text in ['What is your quest?', 'wwxx', 'Are you Iron Man?', 'zzz']:
+            statement = Statement(text)
+            expected = max(
+                levenshtein_distance(statement, choice) for choice in self.possible_choices
+            )
+
+            confidence, match = self.adapter.get(statement)
+
+            self.assertEqual(confidence, expected)
+
+    def test_get_closest_statement(self):
+        confidence, match = self.adapter.get(Statement('What is your quest?'))
+
+        self.assertEqual('What... is your quest?', match)
+
+    def test_same_matches_as_full_scan_with_ties(self):
+        texts = ['xbcd', 'axcd', 'abxd', 'abcx', 'abyd', 'aycd', 'yyyd', 'dcba']
+        possible_choices = [
+            Statement(text, in_response_to=[Response(texts[index - 1])])
+            for index, text in enumerate(texts)
+        ]
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=possible_choices)
+
+        for text in ['abcd', 'abdd', 'dddd', 'bcda']:
+            statement = Statement(text)
+
+            for k in range(1, 4):
+                expected = self.adapter.get_closest_matches(statement, possible_choices, k)
+                matches = self.adapter.get_top_k(statement, k)
+
+                self.assertEqual(
+                    [(confidence, match.text) for confidence, match in matches],
+                    [(confidence, match.text) for confidence, match in expected]
+                )
+
+
+class BestMatchParallelComparisonTestCase(TestCase):
+    """
+    Integration tests for the BestMatch logic adapter using
+    Levenshtein distance in a pool of worker processes.
+    """
+
+    def setUp(self):
+        from chatterbot.comparisons import levenshtein_distance
+
+        self.adapter = BestMatch(
+            statement_comparison_function=levenshtein_distance,
+            parallel_comparison=True,
+            parallel_worker_count=2,
+            parallel_min_statements=5
+        )
+        self.adapter.set_chatbot(MockChatBot())
+
+        texts = [
+            'Who do you love?',
+            'What is the meaning of life?',
+            'I am Iron Man.',
+            'What... is your quest?',
+            'Yuck, black licorice jelly beans.',
+            'I hear you are going on a quest?',
+        ]
+        self.possible_choices = [
+            Statement(text, in_response_to=[Response(texts[index - 1])])
+            for index, text in enumerate(texts)
+        ]
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=self.possible_choices)
+        self.adapter.chatbot.storage.find = MagicMock(side_effect=lambda text: Statement(text))
+
+    def tearDown(self):
+        self.adapter.statement_shards.shutdown()
+
+    def test_same_matches_as_single_process(self):
+        statement = Statement('What is your quest?')
+
+        expected = self.adapter.get_closest_matches(statement, self.possible_choices, 3)
+        matches = self.adapter.get_top_k(statement, 3)
+
+        self.assertTrue(self.adapter.statement_shards.built)
+        self.assertEqual(matches, expected)
+
+    def test_not_used_for_few_statements(self):
+        self.adapter.parallel_min_statements = 10
+
+        confidence, match = self.adapter.get(Statement('What is your quest?'))
+
+        self.assertFalse(self.adapter.statement_shards.built)
+        self.assertEqual('What... is your quest?', match)
+
+
+class LevenshteinCompareManyTestCase(TestCase):
+    """
+    Tests for comparing a statement to many statements at once.
+    """
+
+    def test_compare_many_matches_compare(self):
+        from chatterbot.comparisons import levenshtein_distance
+
+        statement = Statement('What is your quest?')
+        other_statements = [
+            Statement('What... is your quest?'),
+            Statement('wwxx'),
+            Statement(''),
+            Statement('What is your quest?'),
+        ]
+
+        self.assertEqual(
+            levenshtein_distance.compare_many(statement, other_statements),
+            [levenshtein_distance(statement, other) for other in other_statements]
+        )
+
+    def test_compare_many_empty_input(self):
+        from chatterbot.comparisons import levenshtein_distance
+
+        results = levenshtein_distance.compare_many(Statement(''), [Statement('Hi')])
+        self.assertEqual(results, [0])
+
+    def test_compare_many_used_with_upper_bound(self):
+        from chatterbot.comparisons import LevenshteinDistance
+        from chatterbot.logic.best_match import closest_matches
+
+        comparator = LevenshteinDistance()
+        comparator.compare_many = MagicMock(side_effect=comparator.compare_many)
+
+        statement = Statement('What is your quest?')
+        other_statements = [
+            Statement('What... is your quest?'),
+            Statement('zzz'),
+            Statement('I hear you are going on a quest?'),
+            Statement('What is your quest?'),
+            Statement('What is the quest?'),
+        ]
+
+        expected = closest_matches(
+            lambda a, b: comparator.compare(a, b), statement, other_statements, 2
+        )
+        comparator.compare_many.reset_mock()
+
+        matches = closest_matches(comparator, statement, other_statements, 2, batch_size=2)
+
+        self.assertEqual(matches, expected)
+        self.assertEqual(comparator.compare_many.call_count, 2)
+
+        # A statement with no characters in common is never compared
+        compared_texts = [
+            other.text
+            for args, kwargs in comparator.compare_many.call_args_list
+            for other in args[1]
+        ]
+        self.assertNotIn('zzz', compared_texts)
+
+    def test_compare_many_keeps_order_of_texts(self):
+        from chatterbot.comparisons import levenshtein_distance
+
+        statement = Statement('is are are hello looking')
+        other_statements = [
+            Statement('hello hi office'),
+            Statement('looking for the post office'),
+        ]
+
+        expected = []
+        for other_statement in other_statements:
+            similarity = levenshtein_distance.SequenceMatcher(
+                None, statement.text.lower(), other_statement.text.lower()
+            )
+            expected.append(int(round(100 * similarity.ratio())) / 100.0)
+
+        self.assertEqual(
+            levenshtein_distance.compare_many(statement, other_statements),
+            [levenshtein_distance.compare(statement, other) for other in other_statements]
+        )
+        self.assertEqual(
+            levenshtein_distance.compare_many(statement, other_statements), expected
+        )
@@ -48,3 +48,17 @@ class BestMatchSentimentComparisonTestCase(ChatBotTestCase):
 
         self.assertEqual(response.text, 'I am glad to hear that.')
         self.assertAlmostEqual(confidence, 0.75, places=1)
+
+    def test_compare_many_matches_compare(self):
+        from chatterbot.comparisons import sentiment_comparison
+
+        statement = Statement('I enjoy raspberry ice cream.')
+        other_statements = [
+            Statement('I am glad to hear that.'),
+            Statement('I do not like ice cream.'),
+        ]
+
+        self.assertEqual(
+            sentiment_comparison.compare_many(statement, other_statements),
+            [sentiment_comparison(statement, other) for other in other_statements]
+        )
@@ -79,3 +79,17 @@ class BestMatchSynsetDistanceTestCase(TestCase):
 
         self.assertEqual(confidence, 0)
         self.assertEqual(match.text, 'Random')
+
+    def test_compare_many_matches_compare(self):
+        from chatterbot.comparisons import synset_distance
+
+        statement = Statement('What is your quest?')
+        other_statements = [
+            Statement('What is your goal?'),
+            Statement('I like green eggs and ham.'),
+        ]
+
+        self.assertEqual(
+            synset_distance.compare_many(statement, other_statements),
+            [synset_distance(statement, other) for other in other_statements]
+        )
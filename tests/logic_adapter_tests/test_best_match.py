@@ -27,3 +27,257 @@ class BestMatchTestCase(TestCase):
 
         with self.assertRaises(BestMatch.EmptyDatasetException):
             self.adapter.get(statement)
+
+
+class BestMatchStatementIndexTestCase(TestCase):
+    """
+    Unit tests for the BestMatch logic adapter using a statement index.
+    """
+
+    def setUp(self):
+        self.adapter = BestMatch(
+            statement_index='chatterbot.indexes.TokenIndex'
+        )
+        self.adapter.set_chatbot(MockChatBot())
+
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('Who are you?')]),
+            Statement('Who are you?', in_response_to=[Response('What is your quest?')]),
+        ])
+
+    def test_index_created(self):
+        from chatterbot.indexes import TokenIndex
+        self.assertIsInstance(self.adapter.statement_index, TokenIndex)
+
+    def test_get_closest_statement(self):
+        confidence, match = self.adapter.get(Statement('What is the quest?'))
+
+        self.assertEqual(match, 'What is your quest?')
+        self.assertGreater(confidence, 0)
+
+    def test_only_candidates_compared(self):
+        self.adapter.compare_statements = MagicMock(spec=[], return_value=0.5)
+        self.adapter.get(Statement('What is the quest?'))
+
+        self.assertEqual(self.adapter.compare_statements.call_count, 1)
+
+    def test_fallback_to_full_scan(self):
+        self.adapter.compare_statements = MagicMock(spec=[], return_value=0.5)
+        confidence, match = self.adapter.get(Statement('Green eggs'))
+
+        self.assertEqual(self.adapter.compare_statements.call_count, 2)
+        self.assertEqual(confidence, 0.5)
+
+    def test_fallback_disabled(self):
+        self.adapter.index_fallback_threshold = None
+        self.adapter.compare_statements = MagicMock(spec=[], return_value=0.5)
+        confidence, match = self.adapter.get(Statement('Green eggs'))
+
+        self.assertEqual(self.adapter.compare_statements.call_count, 0)
+        self.assertEqual(confidence, 0)
+
+
+class BestMatchVectorizedComparisonTestCase(TestCase):
+    """
+    Unit tests for the BestMatch logic adapter using vectorized comparison.
+    """
+
+    def setUp(self):
+        self.adapter = BestMatch(vectorized_comparison=True)
+        self.adapter.set_chatbot(MockChatBot())
+
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('Who are you?')]),
+            Statement('Who are you?', in_response_to=[Response('What is your quest?')]),
+        ])
+
+    def test_tfidf_index_used_by_default(self):
+        from chatterbot.indexes import TfidfIndex
+        self.assertIsInstance(self.adapter.statement_index, TfidfIndex)
+
+    def test_comparison_function_not_used(self):
+        self.adapter.compare_statements = MagicMock(spec=[], return_value=0.5)
+        confidence, match = self.adapter.get(Statement('What is your quest?'))
+
+        self.assertFalse(self.adapter.compare_statements.called)
+        self.assertAlmostEqual(confidence, 1.0)
+        self.assertEqual(match, 'What is your quest?')
+
+    def test_no_match(self):
+        confidence, match = self.adapter.get(Statement('Green eggs'))
+        self.assertEqual(confidence, 0)
+
+    def test_index_without_top_k(self):
+        with self.assertRaises(BestMatch.InvalidIndexException):
+            BestMatch(
+                vectorized_comparison=True,
+                statement_index='chatterbot.indexes.TokenIndex'
+            )
+
+
+class BestMatchCompareManyTestCase(TestCase):
+    """
+    Unit tests for the BestMatch logic adapter using a comparison
+    that can compare a statement to many statements at once.
+    """
+
+    def setUp(self):
+        from chatterbot.comparisons import Comparator
+
+        self.comparator = Comparator()
+        self.comparator.compare = MagicMock(return_value=0)
+        self.comparator.compare_many = MagicMock(return_value=[0.2, 0.7, 0.4])
+
+        self.adapter = BestMatch(statement_comparison_function=self.comparator)
+        self.adapter.set_chatbot(MockChatBot())
+
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=[
+            Statement('A', in_response_to=[Response('C')]),
+            Statement('B', in_response_to=[Response('A')]),
+            Statement('C', in_response_to=[Response('B')]),
+        ])
+
+    def test_compare_many_called_once(self):
+        confidence, match = self.adapter.get(Statement('Hello'))
+
+        self.assertEqual(self.comparator.compare_many.call_count, 1)
+        self.assertFalse(self.comparator.compare.called)
+        self.assertEqual(confidence, 0.7)
+        self.assertEqual(match, 'B')
+
+
+    def test_statements_compared_in_batches(self):
+        from chatterbot.logic.best_match import closest_matches
+
+        self.comparator.compare_many = MagicMock(
+            side_effect=lambda statement, others: [1 if other.text == 'B' else 0.5 for other in others]
+        )
+        read_texts = []
+
+        def statement_list():
+            for text in 'ABCDEF':
+                read_texts.append(text)
+                yield Statement(text)
+
+        matches = closest_matches(
+            self.comparator, Statement('Hello'), statement_list(), 1, batch_size=2
+        )
+
+        # The search ends after the batch that contains an exact match
+        self.assertEqual(matches, [(1, Statement('B'), )])
+        self.assertEqual(self.comparator.compare_many.call_count, 1)
+        self.assertEqual(read_texts, ['A', 'B', 'C'])
+
+class BestMatchFeatureCacheTestCase(TestCase):
+    """
+    Unit tests for the BestMatch logic adapter using a
+    comparison that precomputes the features of statements.
+    """
+
+    def test_comparison_registered_with_storage(self):
+        from chatterbot.comparisons import Comparator
+
+        comparator = Comparator()
+        comparator.precompute_features = True
+
+        adapter = BestMatch(statement_comparison_function=comparator)
+        adapter.set_chatbot(MockChatBot())
+
+        self.assertIn(comparator, adapter.chatbot.storage.indexes)
+
+    def test_levenshtein_distance_not_registered(self):
+        adapter = BestMatch()
+        adapter.set_chatbot(MockChatBot())
+
+        self.assertEqual(adapter.chatbot.storage.indexes, [])
+
+
+class BestMatchTopKTestCase(TestCase):
+    """
+    Unit tests for selecting the k closest matches with the BestMatch logic adapter.
+    """
+
+    def setUp(self):
+        confidences = {'A': 0.2, 'B': 0.7, 'C': 0.4, 'D': 0.7, 'E': 1}
+
+        self.comparator = MagicMock(
+            spec=[], side_effect=lambda statement, other: confidences[other.text]
+        )
+
+        self.adapter = BestMatch(statement_comparison_function=self.comparator)
+        self.adapter.set_chatbot(MockChatBot())
+
+        self.statements = [
+            Statement('A', in_response_to=[Response('C')]),
+            Statement('B', in_response_to=[Response('A')]),
+            Statement('C', in_response_to=[Response('B')]),
+            Statement('D', in_response_to=[Response('A')]),
+        ]
+
+    def test_closest_matches_ordered(self):
+        matches = self.adapter.get_closest_matches(Statement('Hello'), self.statements, 3)
+
+        self.assertEqual(
+            [(confidence, statement.text) for confidence, statement in matches],
+            [(0.7, 'B'), (0.7, 'D'), (0.4, 'C')]
+        )
+
+    def test_tied_match_found_first_is_kept(self):
+        matches = self.adapter.get_closest_matches(Statement('Hello'), self.statements, 1)
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0][1], 'B')
+
+    def test_stops_after_exact_matches(self):
+        statement_list = [Statement('E')] + self.statements
+
+        matches = self.adapter.get_closest_matches(Statement('Hello'), statement_list, 1)
+
+        self.assertEqual(matches[0][0], 1)
+        self.assertEqual(self.comparator.call_count, 1)
+
+    def test_get_top_k(self):
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=self.statements)
+
+        matches = self.adapter.get_top_k(Statement('Hello'), 2)
+
+        # Statement D is not a response to any statement
+        self.assertEqual([statement.text for confidence, statement in matches], ['B', 'C'])
+
+    def test_response_statements_streamed(self):
+        self.adapter.chatbot.storage.iter_response_statements = MagicMock(
+            return_value=iter(self.statements)
+        )
+        self.adapter.chatbot.storage.get_response_statements = MagicMock()
+
+        matches = self.adapter.get_top_k(Statement('Hello'), 1)
+
+        self.assertEqual(matches[0][1], 'B')
+        self.assertFalse(self.adapter.chatbot.storage.get_response_statements.called)
+
+    def test_no_streamed_response_statements(self):
+        self.adapter.chatbot.storage.iter_response_statements = MagicMock(
+            return_value=iter([])
+        )
+        self.adapter.chatbot.storage.get_random = MagicMock(
+            return_value=Statement('Random')
+        )
+
+        matches = self.adapter.get_top_k(Statement('Hello'), 1)
+
+        self.assertEqual(matches, [(0, 'Random')])
+
+    def test_responses_to_near_tied_matches(self):
+        self.adapter.match_count = 3
+        self.adapter.match_tolerance = 0.1
+        self.adapter.chatbot.storage.update = MagicMock()
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=self.statements)
+        self.adapter.chatbot.storage.get_response_statements = MagicMock(
+            return_value=self.statements
+        )
+
+        self.adapter.process(Statement('Hello'))
+
+        self.adapter.chatbot.storage.filter.assert_called_once_with(
+            in_response_to__contains=['B', 'D']
+        )
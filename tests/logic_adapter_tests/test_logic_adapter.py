@@ -48,4 +48,13 @@ class LogicAdapterTestCase(TestCase):
         adapter = LogicAdapter(
             response_selection_method=get_first_response
         )
-        self.assertTrue(callable(adapter.select_response))
\ No newline at end of file
+        self.assertTrue(callable(adapter.select_response))
+    def test_not_deterministic_by_default(self):
+        self.assertFalse(self.adapter.deterministic)
+
+    def test_not_deterministic_with_random_response_selection(self):
+        from chatterbot.logic import BestMatch
+        from chatterbot.response_selection import get_random_response
+
+        self.assertTrue(BestMatch().deterministic)
+        self.assertFalse(BestMatch(response_selection_method=get_random_response).deterministic)
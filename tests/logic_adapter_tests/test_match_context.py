@@ -0,0 +1,124 @@
+from mock import Mock
+from tests.base_case import ChatBotMemoryTestCase
+from chatterbot.conversation import Statement
+from chatterbot.logic import MultiLogicAdapter, MatchContext
+
+
+class MatchContextTestCase(ChatBotMemoryTestCase):
+
+    def setUp(self):
+        super(MatchContextTestCase, self).setUp()
+        from chatterbot.trainers import ListTrainer
+
+        self.chatbot.set_trainer(ListTrainer)
+        self.chatbot.train([
+            'What is your quest?',
+            'To seek the Holy Grail.',
+            'What is your favorite color?',
+            'Blue.'
+        ])
+
+        self.adapter = MultiLogicAdapter()
+        self.adapter.add_adapter('chatterbot.logic.BestMatch')
+        self.adapter.add_adapter('chatterbot.logic.LowConfidenceAdapter')
+        self.adapter.set_chatbot(self.chatbot)
+
+        self.iter_response_statements = Mock(
+            side_effect=self.chatbot.storage.iter_response_statements
+        )
+        self.chatbot.storage.iter_response_statements = self.iter_response_statements
+
+    def test_get(self):
+        context = MatchContext()
+        compute = Mock(return_value='value')
+
+        self.assertEqual(context.get('key', compute), 'value')
+        self.assertEqual(context.get('key', compute), 'value')
+        self.assertEqual(compute.call_count, 1)
+
+    def test_activate(self):
+        context = MatchContext()
+
+        with context.activate():
+            self.assertEqual(MatchContext.get_active(), context)
+
+        self.assertIsNone(MatchContext.get_active())
+
+    def test_base_query_kept_on_active_context(self):
+        storage = self.chatbot.storage
+        storage.base_query = 'shared'
+        context = MatchContext()
+
+        with context.activate():
+            self.assertEqual(storage.base_query, 'shared')
+            storage.base_query = 'session'
+            self.assertEqual(storage.base_query, 'session')
+
+            with MatchContext().activate():
+                self.assertEqual(storage.base_query, 'shared')
+
+        self.assertEqual(context.base_query, 'session')
+        self.assertEqual(storage.base_query, 'shared')
+
+    def test_generate_response_does_not_change_shared_base_query(self):
+        storage = self.chatbot.storage
+        storage.adapter_supports_queries = True
+        seen_queries = []
+
+        def filter_selection(chatterbot, session_id):
+            seen_queries.append(storage.base_query)
+            return 'session'
+
+        self.chatbot.filters = (Mock(filter_selection=filter_selection), )
+        self.chatbot.generate_response(Statement('What is your quest?'))
+        self.chatbot.generate_response(Statement('What is your quest?'))
+
+        self.assertEqual(seen_queries, [None, None])
+        self.assertIsNone(storage.base_query)
+
+    def test_matches_shared_between_adapters(self):
+        confidence, response = self.adapter.process(Statement('What is your quest?'))
+
+        self.assertEqual(response, 'To seek the Holy Grail.')
+        self.assertEqual(self.iter_response_statements.call_count, 1)
+
+    def test_matches_not_shared_between_statements(self):
+        self.adapter.process(Statement('What is your quest?'))
+        self.adapter.process(Statement('What is your favorite color?'))
+
+        self.assertEqual(self.iter_response_statements.call_count, 2)
+
+    def test_matches_not_shared_without_context(self):
+        adapter = self.adapter.adapters[0]
+
+        adapter.get_top_k(Statement('What is your quest?'), 1)
+        adapter.get_top_k(Statement('What is your quest?'), 1)
+
+        self.assertEqual(self.iter_response_statements.call_count, 2)
+
+    def test_matches_not_shared_between_indexes(self):
+        adapter = MultiLogicAdapter()
+        adapter.add_adapter(
+            'chatterbot.logic.BestMatch',
+            statement_index='chatterbot.indexes.TokenIndex'
+        )
+        adapter.add_adapter(
+            'chatterbot.logic.BestMatch',
+            statement_index='chatterbot.indexes.TokenIndex',
+            index_candidate_limit=1
+        )
+        adapter.set_chatbot(self.chatbot)
+
+        first_adapter, second_adapter = adapter.adapters
+
+        self.assertNotEqual(first_adapter.get_match_key(), second_adapter.get_match_key())
+
+    def test_more_matches_computed(self):
+        adapter = self.adapter.adapters[0]
+
+        with MatchContext().activate():
+            adapter.get_top_k(Statement('What is your quest?'), 1)
+            matches = adapter.get_top_k(Statement('What is your quest?'), 2)
+
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(self.iter_response_statements.call_count, 2)
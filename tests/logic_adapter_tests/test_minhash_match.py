@@ -0,0 +1,86 @@
+from unittest import TestCase
+from mock import MagicMock
+from chatterbot.logic import MinHashMatch
+from chatterbot.conversation import Statement, Response
+from tests.base_case import MockChatBot
+
+
+class MinHashMatchTestCase(TestCase):
+    """
+    Unit tests for the MinHashMatch logic adapter.
+    """
+
+    def setUp(self):
+        import tempfile
+        import os
+
+        self.directory = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.directory, 'database.minhash')
+
+        self.adapter = MinHashMatch(minhash_index_path=self.index_path)
+        self.adapter.set_chatbot(MockChatBot())
+
+        self.adapter.chatbot.storage.filter = MagicMock(return_value=[
+            Statement('Who do you love?', in_response_to=[Response('I hear you are going on a quest?')]),
+            Statement('What... is your quest?', in_response_to=[Response('Who do you love?')]),
+            Statement('I hear you are going on a quest?', in_response_to=[Response('What... is your quest?')]),
+        ])
+        self.adapter.chatbot.storage.count = MagicMock(return_value=3)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_get_closest_statement(self):
+        confidence, match = self.adapter.get(Statement('What is your quest?'))
+
+        self.assertEqual(match, 'What... is your quest?')
+        self.assertGreater(confidence, 0)
+
+    def test_no_candidates(self):
+        confidence, match = self.adapter.get(Statement('Purple monkey dishwasher'))
+
+        self.assertEqual(confidence, 0)
+
+    def test_index_saved(self):
+        import os
+
+        self.adapter.get(Statement('What is your quest?'))
+
+        self.assertTrue(os.path.exists(self.index_path))
+
+    def test_index_loaded(self):
+        self.adapter.get(Statement('What is your quest?'))
+
+        adapter = MinHashMatch(minhash_index_path=self.index_path)
+        adapter.set_chatbot(self.adapter.chatbot)
+        adapter.chatbot.storage.filter = MagicMock(return_value=[])
+        adapter.chatbot.storage.find = MagicMock(return_value=None)
+
+        confidence, match = adapter.get(Statement('What is your quest?'))
+
+        self.assertEqual(match, 'What... is your quest?')
+        self.assertFalse(adapter.chatbot.storage.filter.called)
+
+    def test_index_saved_on_process(self):
+        import os
+
+        self.adapter.chatbot.storage.update = MagicMock()
+
+        confidence, response = self.adapter.process(Statement('What is your quest?'))
+
+        self.assertTrue(os.path.exists(self.index_path))
+
+    def test_index_loaded_on_process(self):
+        self.adapter.get(Statement('What is your quest?'))
+
+        adapter = MinHashMatch(minhash_index_path=self.index_path)
+        adapter.set_chatbot(self.adapter.chatbot)
+        adapter.statement_index.build = MagicMock()
+        adapter.chatbot.storage.find = MagicMock(side_effect=Statement)
+        adapter.chatbot.storage.update = MagicMock()
+
+        adapter.process(Statement('What is your quest?'))
+
+        self.assertTrue(adapter.statement_index.built)
+        self.assertFalse(adapter.statement_index.build.called)
@@ -22,6 +22,30 @@ class TestAdapterC(LogicAdapter):
         return 0.7, Statement('Good night.')
 
 
+class SlowAdapter(LogicAdapter):
+
+    def process(self, statement):
+        import time
+        time.sleep(0.5)
+        return 0.9, Statement('Good evening.')
+
+
+class ExactAdapter(LogicAdapter):
+
+    process_cost = 0
+
+    def process(self, statement):
+        return 1, Statement('Hello.')
+
+
+class ExpensiveAdapter(LogicAdapter):
+
+    process_cost = 10
+
+    def process(self, statement):
+        raise AssertionError('The expensive adapter should not be run.')
+
+
 class MultiLogicAdapterTestCase(ChatBotTestCase):
 
     def setUp(self):
@@ -72,3 +96,124 @@ class MultiLogicAdapterTestCase(ChatBotTestCase):
         # Test that all sub adapters have the chatbot set
         for sub_adapter in adapter.adapters:
             self.assertEqual(sub_adapter.chatbot, self.chatbot)
+
+
+class ParallelMultiLogicAdapterTestCase(ChatBotTestCase):
+
+    def setUp(self):
+        super(ParallelMultiLogicAdapterTestCase, self).setUp()
+        self.adapter = MultiLogicAdapter(
+            logic_adapter_workers=4,
+            logic_adapter_timeout=0.1
+        )
+        self.adapter.set_chatbot(self.chatbot)
+
+    def test_sub_adapter_agreement(self):
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterB')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.5)
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_late_response_not_used(self):
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.SlowAdapter')
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.7)
+        self.assertEqual(statement, 'Good night.')
+
+    def test_adapter_process_timeout(self):
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+        self.adapter.add_adapter(
+            'tests.logic_adapter_tests.test_multi_adapter.SlowAdapter',
+            process_timeout=2
+        )
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.9)
+        self.assertEqual(statement, 'Good evening.')
+
+    def test_timeout_measured_from_start(self):
+        from chatterbot.logic import MatchContext
+
+        adapter = MultiLogicAdapter(logic_adapter_workers=1, logic_adapter_timeout=0.8)
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.SlowAdapter')
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.SlowAdapter')
+        adapter.set_chatbot(self.chatbot)
+
+        # The second adapter waits for the first, so it cannot finish before the deadline
+        outputs = list(adapter.process_parallel(
+            adapter.get_adapters(), Statement('Howdy!'), MatchContext()
+        ))
+
+        self.assertEqual(outputs[0][0], 0.9)
+        self.assertIsNone(outputs[1])
+
+
+class ShortCircuitMultiLogicAdapterTestCase(ChatBotTestCase):
+
+    def setUp(self):
+        super(ShortCircuitMultiLogicAdapterTestCase, self).setUp()
+        self.adapter = MultiLogicAdapter(short_circuit_confidence=1)
+        self.adapter.set_chatbot(self.chatbot)
+
+    def test_cheaper_adapter_short_circuits(self):
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.ExpensiveAdapter')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.ExactAdapter')
+
+        confidence, statement = self.adapter.process(Statement('Hi'))
+
+        self.assertEqual(confidence, 1)
+        self.assertEqual(statement, 'Hello.')
+
+    def test_process_cost_setting(self):
+        self.adapter.add_adapter(
+            'tests.logic_adapter_tests.test_multi_adapter.TestAdapterC',
+            process_cost=20
+        )
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.ExactAdapter')
+
+        self.assertEqual(self.adapter.adapters[0].process_cost, 20)
+
+        confidence, statement = self.adapter.process(Statement('Hi'))
+
+        self.assertEqual(statement, 'Hello.')
+
+    def test_no_voting_by_default(self):
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterB')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.7)
+        self.assertEqual(statement, 'Good night.')
+
+    def test_voting_enabled(self):
+        adapter = MultiLogicAdapter(short_circuit_confidence=1, logic_adapter_voting=True)
+        adapter.set_chatbot(self.chatbot)
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterB')
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        confidence, statement = adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.5)
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_parallel_short_circuit(self):
+        adapter = MultiLogicAdapter(short_circuit_confidence=1, logic_adapter_workers=2)
+        adapter.set_chatbot(self.chatbot)
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.SlowAdapter')
+        adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.ExactAdapter')
+
+        confidence, statement = adapter.process(Statement('Hi'))
+
+        self.assertEqual(confidence, 1)
+        self.assertEqual(statement, 'Hello.')
@@ -0,0 +1,6 @@
+from tests.base_case import ChatBotLogFileTestCase
+from .base import StorageIntegrationTests
+
+
+class LogFileStorageIntegrationTests(StorageIntegrationTests, ChatBotLogFileTestCase):
+    pass
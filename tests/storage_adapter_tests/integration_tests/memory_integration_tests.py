@@ -0,0 +1,6 @@
+from tests.base_case import ChatBotMemoryTestCase
+from .base import StorageIntegrationTests
+
+
+class MemoryStorageIntegrationTests(StorageIntegrationTests, ChatBotMemoryTestCase):
+    pass
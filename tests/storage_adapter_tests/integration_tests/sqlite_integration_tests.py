@@ -0,0 +1,6 @@
+from tests.base_case import ChatBotSQLiteTestCase
+from .base import StorageIntegrationTests
+
+
+class SQLiteStorageIntegrationTests(StorageIntegrationTests, ChatBotSQLiteTestCase):
+    pass
@@ -200,6 +200,30 @@ class JsonFileStorageAdapterTestCase(JsonAdapterTestCase):
 
         self.assertEqual(results, [])
 
+    def test_filter_responses_after_update(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        self.adapter.filter(in_response_to__contains="Hi")
+
+        statement = Statement("Hey", in_response_to=[Response("Hi")])
+        self.adapter.update(statement)
+
+        results = self.adapter.filter(in_response_to__contains="Hi")
+
+        self.assertEqual(len(results), 2)
+        self.assertIn(statement, results)
+
+    def test_filter_responses_after_response_removed(self):
+        statement = Statement("Hello", in_response_to=[Response("Hi")])
+        self.adapter.update(statement)
+        self.adapter.filter(in_response_to__contains="Hi")
+
+        statement.remove_response("Hi")
+        self.adapter.update(statement)
+
+        results = self.adapter.filter(in_response_to__contains="Hi")
+
+        self.assertEqual(results, [])
+
     def test_get_response_statements(self):
         """
         Test that we are able to get a list of only statements
@@ -281,6 +305,17 @@ class JsonFileStorageAdapterFilterTestCase(JsonAdapterTestCase):
         self.assertEqual(len(results), 1)
         self.assertIn(self.statement1, results)
 
+    def test_filter_contains_any_of_list(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains=["Why are you counting?", "Testing..."]
+        )
+        self.assertEqual(len(results), 2)
+        self.assertIn(self.statement1, results)
+        self.assertIn(self.statement2, results)
+
     def test_filter_contains_no_result(self):
         self.adapter.update(self.statement1)
 
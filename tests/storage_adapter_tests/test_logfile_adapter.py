@@ -0,0 +1,551 @@
+from unittest import TestCase
+from chatterbot.storage import LogFileStorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class LogFileAdapterTestCase(TestCase):
+
+    def setUp(self):
+        """
+        Instantiate the adapter with a temporary log file.
+        """
+        import tempfile
+        import os
+
+        self.directory = tempfile.mkdtemp()
+        self.adapter = LogFileStorageAdapter(
+            database=os.path.join(self.directory, 'test.log')
+        )
+
+    def tearDown(self):
+        """
+        Remove the test database.
+        """
+        import shutil
+
+        self.adapter.drop()
+        self.adapter.log_file.close()
+        shutil.rmtree(self.directory)
+
+
+class LogFileStorageAdapterTestCase(LogFileAdapterTestCase):
+
+    def test_count_returns_zero(self):
+        """
+        The count method should return a value of 0
+        when nothing has been saved to the database.
+        """
+        self.assertEqual(self.adapter.count(), 0)
+
+    def test_count_returns_value(self):
+        """
+        The count method should return a value of 1
+        when one item has been saved to the database.
+        """
+        statement = Statement("Test statement")
+        self.adapter.update(statement)
+        self.assertEqual(self.adapter.count(), 1)
+
+    def test_statement_not_found(self):
+        """
+        Test that None is returned by the find method
+        when a matching statement is not found.
+        """
+        self.assertEqual(self.adapter.find("Non-existant"), None)
+
+    def test_statement_found(self):
+        """
+        Test that a matching statement is returned
+        when it exists in the database.
+        """
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        found_statement = self.adapter.find("New statement")
+        self.assertNotEqual(found_statement, None)
+        self.assertEqual(found_statement.text, statement.text)
+
+    def test_update_adds_new_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertNotEqual(statement_found, None)
+        self.assertEqual(statement_found.text, statement.text)
+
+    def test_update_modifies_existing_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        # Check the initial values
+        found_statement = self.adapter.find(statement.text)
+        self.assertEqual(
+            len(found_statement.in_response_to), 0
+        )
+
+        # Update the statement value
+        statement.add_response(
+            Response("New response")
+        )
+        self.adapter.update(statement)
+
+        # Check that the values have changed
+        found_statement = self.adapter.find(statement.text)
+        self.assertEqual(
+            len(found_statement.in_response_to), 1
+        )
+
+    def test_get_random_returns_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        random_statement = self.adapter.get_random()
+        self.assertEqual(random_statement.text, statement.text)
+
+    def test_find_returns_nested_responses(self):
+        response_list = [
+            Response("Yes"),
+            Response("No")
+        ]
+        statement = Statement(
+            "Do you like this?",
+            in_response_to=response_list
+        )
+        self.adapter.update(statement)
+
+        result = self.adapter.find(statement.text)
+
+        self.assertIn("Yes", result.in_response_to)
+        self.assertIn("No", result.in_response_to)
+
+    def test_multiple_responses_added_on_update(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thank you."),
+                Response("Thanks.")
+            ]
+        )
+        self.adapter.update(statement)
+        result = self.adapter.find(statement.text)
+
+        self.assertEqual(len(result.in_response_to), 2)
+        self.assertIn(statement.in_response_to[0], result.in_response_to)
+        self.assertIn(statement.in_response_to[1], result.in_response_to)
+
+    def test_update_saves_statement_with_multiple_responses(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thanks."),
+                Response("Thank you.")
+            ]
+        )
+        self.adapter.update(statement)
+        response = self.adapter.find(statement.text)
+
+        self.assertEqual(len(response.in_response_to), 2)
+
+    def test_getting_and_updating_statement(self):
+        statement = Statement("Hi")
+        self.adapter.update(statement)
+
+        statement.add_response(Response("Hello"))
+        statement.add_response(Response("Hello"))
+        self.adapter.update(statement)
+
+        response = self.adapter.find(statement.text)
+
+        self.assertEqual(len(response.in_response_to), 1)
+        self.assertEqual(response.in_response_to[0].occurrence, 2)
+
+    def test_remove(self):
+        text = "Sometimes you have to run before you can walk."
+        statement = Statement(text)
+        self.adapter.update(statement)
+        self.adapter.remove(statement.text)
+        result = self.adapter.find(text)
+
+        self.assertIsNone(result)
+
+    def test_remove_response(self):
+        text = "Sometimes you have to run before you can walk."
+        statement = Statement(
+            "A test flight is not recommended at this design phase.",
+            in_response_to=[Response(text)]
+        )
+        self.adapter.update(statement)
+        self.adapter.remove(statement.text)
+        results = self.adapter.filter(in_response_to__contains=text)
+
+        self.assertEqual(results, [])
+
+    def test_get_response_statements(self):
+        """
+        Test that we are able to get a list of only statements
+        that are known to be in response to another statement.
+        """
+        statement_list = [
+            Statement("What... is your quest?"),
+            Statement("This is a phone."),
+            Statement("A what?", in_response_to=[Response("This is a phone.")]),
+            Statement("A phone.", in_response_to=[Response("A what?")])
+        ]
+
+        for statement in statement_list:
+            self.adapter.update(statement)
+
+        responses = self.adapter.get_response_statements()
+
+        self.assertEqual(len(responses), 2)
+        self.assertIn("This is a phone.", responses)
+        self.assertIn("A what?", responses)
+
+    def test_drop_clears_indexes(self):
+        from chatterbot.indexes import StatementIndex
+
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        index = StatementIndex()
+        index.build(self.adapter)
+
+        self.adapter.drop()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(self.adapter.get_response_statements(), [])
+
+
+class LogFileStorageAdapterFilterTestCase(LogFileAdapterTestCase):
+
+    def setUp(self):
+        super(LogFileStorageAdapterFilterTestCase, self).setUp()
+
+        self.statement1 = Statement(
+            "Testing...",
+            in_response_to=[
+                Response("Why are you counting?")
+            ]
+        )
+        self.statement2 = Statement(
+            "Testing one, two, three.",
+            in_response_to=[
+                Response("Testing...")
+            ]
+        )
+
+    def test_filter_text_no_matches(self):
+        self.adapter.update(self.statement1)
+        results = self.adapter.filter(text="Howdy")
+
+        self.assertEqual(len(results), 0)
+
+    def test_filter_in_response_to_no_matches(self):
+        self.adapter.update(self.statement1)
+
+        results = self.adapter.filter(
+            in_response_to=[Response("Maybe")]
+        )
+        self.assertEqual(len(results), 0)
+
+    def test_filter_equal_results(self):
+        statement1 = Statement(
+            "Testing...",
+            in_response_to=[]
+        )
+        statement2 = Statement(
+            "Testing one, two, three.",
+            in_response_to=[]
+        )
+        self.adapter.update(statement1)
+        self.adapter.update(statement2)
+
+        results = self.adapter.filter(in_response_to=[])
+        self.assertEqual(len(results), 2)
+        self.assertIn(statement1, results)
+        self.assertIn(statement2, results)
+
+    def test_filter_contains_result(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains="Why are you counting?"
+        )
+        self.assertEqual(len(results), 1)
+        self.assertIn(self.statement1, results)
+
+    def test_filter_contains_any_of_list(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains=["Why are you counting?", "Testing..."]
+        )
+        self.assertEqual(len(results), 2)
+        self.assertIn(self.statement1, results)
+        self.assertIn(self.statement2, results)
+
+    def test_filter_contains_no_result(self):
+        self.adapter.update(self.statement1)
+
+        results = self.adapter.filter(
+            in_response_to__contains="How do you do?"
+        )
+        self.assertEqual(results, [])
+
+    def test_filter_multiple_parameters(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            text="Testing...",
+            in_response_to__contains="Why are you counting?"
+        )
+
+        self.assertEqual(len(results), 1)
+        self.assertIn(self.statement1, results)
+
+    def test_filter_multiple_parameters_no_results(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            text="Test",
+            in_response_to__contains="Not an existing response."
+        )
+
+        self.assertEqual(len(results), 0)
+
+    def test_filter_extra_data(self):
+        self.statement1.add_extra_data("pos_tags", "NN")
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(extra_data={"pos_tags": "NN"})
+
+        self.assertEqual(results, [self.statement1])
+
+    def test_filter_unsupported_parameter(self):
+        with self.assertRaises(self.adapter.UnsupportedFilterException):
+            self.adapter.filter(speaker="jane")
+
+    def test_filter_no_parameters(self):
+        """
+        If no parameters are passed to the filter,
+        then all statements should be returned.
+        """
+        statement1 = Statement("Testing...")
+        statement2 = Statement("Testing one, two, three.")
+        self.adapter.update(statement1)
+        self.adapter.update(statement2)
+
+        results = self.adapter.filter()
+
+        self.assertEqual(len(results), 2)
+
+    def test_filter_returns_statement_with_multiple_responses(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thanks."),
+                Response("Thank you.")
+            ]
+        )
+        self.adapter.update(statement)
+        response = self.adapter.filter(
+            in_response_to__contains="Thanks."
+        )
+
+        # Get the first response
+        response = response[0]
+
+        self.assertEqual(len(response.in_response_to), 2)
+
+    def test_response_list_in_results(self):
+        """
+        If a statement with response values is found using
+        the filter method, they should be returned as
+        response objects.
+        """
+        statement = Statement(
+            "The first is to help yourself, the second is to help others.",
+            in_response_to=[
+                Response("Why do people have two hands?")
+            ]
+        )
+        self.adapter.update(statement)
+        found = self.adapter.filter(text=statement.text)
+
+        self.assertEqual(len(found[0].in_response_to), 1)
+        self.assertEqual(type(found[0].in_response_to[0]), Response)
+
+
+class ReadOnlyLogFileStorageAdapterTestCase(LogFileAdapterTestCase):
+
+    def test_update_does_not_add_new_statement(self):
+        self.adapter.read_only = True
+
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertEqual(statement_found, None)
+
+    def test_update_does_not_modify_existing_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        self.adapter.read_only = True
+
+        statement.add_response(
+            Response("New response")
+        )
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertEqual(
+            statement_found.text, statement.text
+        )
+        self.assertEqual(
+            len(statement_found.in_response_to), 0
+        )
+
+
+class LogFileStorageAdapterLogTestCase(LogFileAdapterTestCase):
+
+    def reopen(self):
+        self.adapter.sync()
+        self.adapter.log_file.close()
+        self.adapter = LogFileStorageAdapter(database=self.adapter.database_path)
+
+    def test_changes_appended(self):
+        self.adapter.update(Statement("Hello"))
+        size = self.adapter.file_size
+
+        self.adapter.update(Statement("Hi"))
+        self.adapter.sync()
+
+        with open(self.adapter.database_path, 'rb') as log_file:
+            log_file.seek(size)
+            self.assertEqual(log_file.read().count(b'\n'), 1)
+
+    def test_unchanged_statement_not_appended(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        file_size = self.adapter.file_size
+
+        statement = self.adapter.find("Hello")
+        self.adapter.update(statement)
+
+        self.assertEqual(self.adapter.file_size, file_size)
+
+    def test_statements_loaded(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi", occurrence=2)]))
+        self.adapter.update(Statement("Hey", in_response_to=[Response("Hi")]))
+        self.adapter.remove("Hey")
+
+        self.reopen()
+
+        self.assertEqual(self.adapter.count(), 2)
+        self.assertIsNone(self.adapter.find("Hey"))
+        self.assertEqual(self.adapter.find("Hello").in_response_to[0].occurrence, 2)
+        self.assertEqual(self.adapter.filter(in_response_to__contains="Hi"), ["Hello"])
+
+    def test_incomplete_line_removed(self):
+        self.adapter.update(Statement("Hello"))
+        self.adapter.sync()
+        size = self.adapter.file_size
+
+        self.adapter.log_file.write(b'["update", "Hi", {"in_resp')
+        self.reopen()
+
+        self.assertEqual(self.adapter.count(), 1)
+        self.assertEqual(self.adapter.file_size, size)
+
+        self.adapter.update(Statement("Hi"))
+        self.reopen()
+
+        self.assertEqual(self.adapter.count(), 2)
+
+    def test_synced_after_batch(self):
+        self.adapter.sync_batch_size = 2
+        self.adapter.sync_interval = 60
+        self.adapter.sync()
+
+        self.adapter.update(Statement("Hello"))
+        self.assertEqual(self.adapter.unsynced_changes, 1)
+
+        self.adapter.update(Statement("Hi"))
+        self.assertEqual(self.adapter.unsynced_changes, 0)
+
+    def test_synced_after_interval_without_changes(self):
+        self.adapter.sync_batch_size = 100
+        self.adapter.sync_interval = 0.1
+        self.adapter.sync()
+
+        self.adapter.update(Statement("Hello"))
+        timer = self.adapter.sync_timer
+
+        self.assertIsNotNone(timer)
+        self.assertEqual(self.adapter.unsynced_changes, 1)
+
+        timer.join(1)
+
+        self.assertEqual(self.adapter.unsynced_changes, 0)
+        self.assertIsNone(self.adapter.sync_timer)
+
+    def test_compact(self):
+        for occurrence in range(10):
+            self.adapter.update(Statement("Hello", in_response_to=[Response("Hi", occurrence=occurrence)]))
+
+        size = self.adapter.file_size
+        self.adapter.compact()
+
+        self.assertLess(self.adapter.file_size, size)
+        self.assertEqual(self.adapter.file_size, self.adapter.live_size)
+        self.assertEqual(self.adapter.find("Hello").in_response_to[0].occurrence, 9)
+
+        self.reopen()
+
+        self.assertEqual(self.adapter.count(), 2)
+        self.assertEqual(self.adapter.find("Hello").in_response_to[0].occurrence, 9)
+
+    def test_compaction_stopped_by_drop(self):
+        import os
+        from mock import patch
+
+        for occurrence in range(10):
+            self.adapter.update(Statement("Hello", in_response_to=[Response("Hi", occurrence=occurrence)]))
+
+        builtin_open = open
+
+        def open_after_drop(path, mode='r'):
+            # Drop the log file once the file that is compacted has been read
+            if path.endswith('.tmp'):
+                self.adapter.drop()
+                self.adapter.update(Statement("Hey"))
+
+            return builtin_open(path, mode)
+
+        with patch('chatterbot.storage.logfile.open', open_after_drop, create=True):
+            self.adapter.compact()
+
+        self.assertFalse(os.path.exists(self.adapter.database_path + '.tmp'))
+        self.assertEqual(self.adapter.count(), 1)
+        self.assertIsNone(self.adapter.find("Hello"))
+        self.assertEqual(self.adapter.find("Hey"), "Hey")
+
+        self.reopen()
+
+        self.assertEqual(self.adapter.count(), 1)
+        self.assertEqual(self.adapter.find("Hey"), "Hey")
+
+    def test_compacted_in_background(self):
+        self.adapter.compaction_min_size = 0
+
+        self.adapter.update(Statement("Hello"))
+        self.adapter.update(Statement("Hello"))
+        self.adapter.update(Statement("Hello"))
+        self.adapter.compaction_thread.join()
+
+        self.assertEqual(self.adapter.file_size, self.adapter.live_size)
+        self.assertEqual(self.adapter.find("Hello"), "Hello")
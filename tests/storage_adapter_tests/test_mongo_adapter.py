@@ -108,6 +108,60 @@ class MongoDatabaseAdapterTestCase(MongoAdapterTestCase):
         random_statement = self.adapter.get_random()
         self.assertEqual(random_statement.text, statement.text)
 
+    def test_get_random_empty_database(self):
+        with self.assertRaises(self.adapter.EmptyDatabaseException):
+            self.adapter.get_random()
+
+    def test_response_flag_not_in_extra_data(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        result = self.adapter.find("Hello")
+
+        self.assertNotIn("has_responses", result.extra_data)
+
+    def test_response_flags_set_for_existing_database(self):
+        self.adapter.statements.insert_one({
+            "text": "Hi", "in_response_to": [{"text": "Hello", "occurrence": 1}]
+        })
+        self.adapter.statements.insert_one({"text": "Hello", "in_response_to": []})
+
+        self.adapter.set_response_flags()
+
+        responses = self.adapter.get_response_statements()
+
+        self.assertEqual(responses, ["Hello"])
+
+    def test_drop_keeps_indexes(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.drop()
+
+        indexed_fields = [
+            index['key'][0][0]
+            for index in self.adapter.statements.index_information().values()
+        ]
+
+        self.assertIn('text', indexed_fields)
+        self.assertIn('has_responses', indexed_fields)
+        self.assertIn('in_response_to.text', indexed_fields)
+
+    def test_response_flag_removed(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.remove("Hi")
+
+        self.assertEqual(self.adapter.get_response_statements(), [])
+
+    def test_response_flag_removed_when_statement_replaced(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hey")]))
+
+        self.assertEqual(self.adapter.get_response_statements(), ["Hey"])
+
+    def test_response_flag_removed_when_statement_replaced_in_bulk(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.bulk_update([Statement("Hi", in_response_to=[Response("Hey")])])
+
+        self.assertEqual(self.adapter.get_response_statements(), ["Hey"])
+
     def test_find_returns_nested_responses(self):
         response_list = [
             Response("Yes"),
@@ -165,6 +219,64 @@ class MongoDatabaseAdapterTestCase(MongoAdapterTestCase):
         self.assertEqual(len(response.in_response_to), 1)
         self.assertEqual(response.in_response_to[0].occurrence, 2)
 
+    def test_update_increments_occurrence(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        first = self.adapter.find("Hi")
+        second = self.adapter.find("Hi")
+
+        first.add_response(Response("Hello"))
+        second.add_response(Response("Hello"))
+        self.adapter.update(first)
+        self.adapter.update(second)
+
+        response = self.adapter.find("Hi")
+
+        self.assertEqual(len(response.in_response_to), 1)
+        self.assertEqual(response.in_response_to[0].occurrence, 3)
+
+    def test_bulk_update(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        statement = self.adapter.find("Hi")
+        statement.add_response(Response("Hello"))
+
+        self.adapter.bulk_update([
+            statement,
+            Statement("How are you?", in_response_to=[Response("Hi")])
+        ])
+
+        results = self.adapter.find_many(["Hi", "Hello", "How are you?"])
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.adapter.find("Hi").in_response_to[0].occurrence, 2)
+
+    def test_filter_iter(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        results = self.adapter.filter_iter(batch_size=1)
+
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(len(list(results)), 2)
+
+    def test_filter_iter_fields(self):
+        self.adapter.update(Statement(
+            "Hi", in_response_to=[Response("Hello")], extra_data={"pos_tags": "NN"}
+        ))
+
+        results = list(self.adapter.filter_iter(fields=[], text="Hi"))
+
+        self.assertEqual(results[0].text, "Hi")
+        self.assertEqual(results[0].in_response_to, [])
+        self.assertNotIn("pos_tags", results[0].extra_data)
+
+    def test_response_text_index(self):
+        index_keys = [
+            list(index['key'].keys()) for index in self.adapter.statements.list_indexes()
+        ]
+
+        self.assertIn(['in_response_to.text'], index_keys)
+
     def test_deserialize_responses(self):
         response_list = [
             {"text": "Test", "occurrence": 3},
@@ -309,6 +421,17 @@ class MongoAdapterFilterTestCase(MongoAdapterTestCase):
         self.assertEqual(len(results), 1)
         self.assertIn(self.statement1, results)
 
+    def test_filter_contains_any_of_list(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains=["Why are you counting?", "Testing..."]
+        )
+        self.assertEqual(len(results), 2)
+        self.assertIn(self.statement1, results)
+        self.assertIn(self.statement2, results)
+
     def test_filter_contains_no_result(self):
         self.adapter.update(self.statement1)
 
@@ -391,6 +514,63 @@ class MongoAdapterFilterTestCase(MongoAdapterTestCase):
         self.assertEqual(type(found[0].in_response_to[0]), Response)
 
 
+class AsyncMongoDatabaseAdapterTestCase(MongoAdapterTestCase):
+    """
+    The asynchronous methods use the Motor driver if it is
+    installed, and otherwise run the synchronous methods in threads.
+    """
+
+    def setUp(self):
+        import asyncio
+
+        super(AsyncMongoDatabaseAdapterTestCase, self).setUp()
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        super(AsyncMongoDatabaseAdapterTestCase, self).tearDown()
+
+    def test_aupdate_and_afind(self):
+        statement = Statement('Hi', in_response_to=[Response('Hello')])
+
+        self.loop.run_until_complete(self.adapter.aupdate(statement))
+        result = self.loop.run_until_complete(self.adapter.afind('Hi'))
+
+        self.assertFalse(statement.has_changes())
+        self.assertEqual(result.in_response_to, ['Hello'])
+
+    def test_aupdate_response_flag_removed_when_statement_replaced(self):
+        self.adapter.update(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        self.loop.run_until_complete(
+            self.adapter.aupdate(Statement('Hi', in_response_to=[Response('Hey')]))
+        )
+
+        self.assertEqual(self.adapter.get_response_statements(), ['Hey'])
+
+    def test_afind_not_found(self):
+        result = self.loop.run_until_complete(self.adapter.afind('Hi'))
+
+        self.assertIsNone(result)
+
+    def test_afilter(self):
+        self.adapter.update(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        results = self.loop.run_until_complete(
+            self.adapter.afilter(in_response_to__contains='Hello')
+        )
+
+        self.assertEqual(results, ['Hi'])
+
+    def test_aget_random_empty_database(self):
+        with self.assertRaises(self.adapter.EmptyDatabaseException):
+            self.loop.run_until_complete(self.adapter.aget_random())
+
 class ReadOnlyMongoDatabaseAdapterTestCase(MongoAdapterTestCase):
 
     def test_update_does_not_add_new_statement(self):
@@ -0,0 +1,511 @@
+from unittest import TestCase
+from chatterbot.storage import SQLiteStorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class SQLiteAdapterTestCase(TestCase):
+
+    def setUp(self):
+        """
+        Instantiate the adapter with a temporary database file.
+        """
+        import tempfile
+        import os
+
+        self.directory = tempfile.mkdtemp()
+        self.adapter = SQLiteStorageAdapter(
+            database=os.path.join(self.directory, 'test.sqlite3')
+        )
+
+    def tearDown(self):
+        """
+        Remove the test database.
+        """
+        import shutil
+
+        self.adapter.drop()
+        self.adapter.connection.close()
+        shutil.rmtree(self.directory)
+
+
+class SQLiteStorageAdapterTestCase(SQLiteAdapterTestCase):
+
+    def test_count_returns_zero(self):
+        """
+        The count method should return a value of 0
+        when nothing has been saved to the database.
+        """
+        self.assertEqual(self.adapter.count(), 0)
+
+    def test_count_returns_value(self):
+        """
+        The count method should return a value of 1
+        when one item has been saved to the database.
+        """
+        statement = Statement("Test statement")
+        self.adapter.update(statement)
+        self.assertEqual(self.adapter.count(), 1)
+
+    def test_statement_not_found(self):
+        """
+        Test that None is returned by the find method
+        when a matching statement is not found.
+        """
+        self.assertEqual(self.adapter.find("Non-existant"), None)
+
+    def test_statement_found(self):
+        """
+        Test that a matching statement is returned
+        when it exists in the database.
+        """
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        found_statement = self.adapter.find("New statement")
+        self.assertNotEqual(found_statement, None)
+        self.assertEqual(found_statement.text, statement.text)
+
+    def test_update_adds_new_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertNotEqual(statement_found, None)
+        self.assertEqual(statement_found.text, statement.text)
+
+    def test_update_modifies_existing_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        # Check the initial values
+        found_statement = self.adapter.find(statement.text)
+        self.assertEqual(
+            len(found_statement.in_response_to), 0
+        )
+
+        # Update the statement value
+        statement.add_response(
+            Response("New response")
+        )
+        self.adapter.update(statement)
+
+        # Check that the values have changed
+        found_statement = self.adapter.find(statement.text)
+        self.assertEqual(
+            len(found_statement.in_response_to), 1
+        )
+
+    def test_get_random_returns_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        random_statement = self.adapter.get_random()
+        self.assertEqual(random_statement.text, statement.text)
+
+    def test_find_returns_nested_responses(self):
+        response_list = [
+            Response("Yes"),
+            Response("No")
+        ]
+        statement = Statement(
+            "Do you like this?",
+            in_response_to=response_list
+        )
+        self.adapter.update(statement)
+
+        result = self.adapter.find(statement.text)
+
+        self.assertIn("Yes", result.in_response_to)
+        self.assertIn("No", result.in_response_to)
+
+    def test_multiple_responses_added_on_update(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thank you."),
+                Response("Thanks.")
+            ]
+        )
+        self.adapter.update(statement)
+        result = self.adapter.find(statement.text)
+
+        self.assertEqual(len(result.in_response_to), 2)
+        self.assertIn(statement.in_response_to[0], result.in_response_to)
+        self.assertIn(statement.in_response_to[1], result.in_response_to)
+
+    def test_update_saves_statement_with_multiple_responses(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thanks."),
+                Response("Thank you.")
+            ]
+        )
+        self.adapter.update(statement)
+        response = self.adapter.find(statement.text)
+
+        self.assertEqual(len(response.in_response_to), 2)
+
+    def test_getting_and_updating_statement(self):
+        statement = Statement("Hi")
+        self.adapter.update(statement)
+
+        statement.add_response(Response("Hello"))
+        statement.add_response(Response("Hello"))
+        self.adapter.update(statement)
+
+        response = self.adapter.find(statement.text)
+
+        self.assertEqual(len(response.in_response_to), 1)
+        self.assertEqual(response.in_response_to[0].occurrence, 2)
+
+    def test_remove(self):
+        text = "Sometimes you have to run before you can walk."
+        statement = Statement(text)
+        self.adapter.update(statement)
+        self.adapter.remove(statement.text)
+        result = self.adapter.find(text)
+
+        self.assertIsNone(result)
+
+    def test_remove_response(self):
+        text = "Sometimes you have to run before you can walk."
+        statement = Statement(
+            "A test flight is not recommended at this design phase.",
+            in_response_to=[Response(text)]
+        )
+        self.adapter.update(statement)
+        self.adapter.remove(statement.text)
+        results = self.adapter.filter(in_response_to__contains=text)
+
+        self.assertEqual(results, [])
+
+    def test_get_response_statements(self):
+        """
+        Test that we are able to get a list of only statements
+        that are known to be in response to another statement.
+        """
+        statement_list = [
+            Statement("What... is your quest?"),
+            Statement("This is a phone."),
+            Statement("A what?", in_response_to=[Response("This is a phone.")]),
+            Statement("A phone.", in_response_to=[Response("A what?")])
+        ]
+
+        for statement in statement_list:
+            self.adapter.update(statement)
+
+        responses = self.adapter.get_response_statements()
+
+        self.assertEqual(len(responses), 2)
+        self.assertIn("This is a phone.", responses)
+        self.assertIn("A what?", responses)
+
+
+    def test_write_ahead_logging(self):
+        journal_mode = self.adapter.connection.execute('PRAGMA journal_mode').fetchone()[0]
+
+        self.assertEqual(journal_mode, 'wal')
+
+    def test_extra_data_saved(self):
+        statement = Statement("Hello", extra_data={"pos_tags": "NN"})
+        self.adapter.update(statement)
+
+        result = self.adapter.find("Hello")
+
+        self.assertEqual(result.extra_data, {"pos_tags": "NN"})
+
+    def test_remove_removes_response_from_other_statements(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        self.adapter.remove("Hi")
+
+        result = self.adapter.find("Hello")
+
+        self.assertEqual(result.in_response_to, [])
+
+    def test_statements_saved_to_file(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        adapter = SQLiteStorageAdapter(database=self.adapter.database_path)
+        result = adapter.find("Hello")
+        adapter.connection.close()
+
+        self.assertEqual(len(result.in_response_to), 1)
+
+    def test_response_query_uses_index(self):
+        query_plan = self.adapter.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT statement_id FROM response WHERE text = ?', ('Hi', )
+        ).fetchall()
+
+        self.assertIn('response_text', str(query_plan))
+
+    def test_found_statement_has_no_changes(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        result = self.adapter.find("Hello")
+
+        self.assertFalse(result.has_changes())
+
+    def test_update_increments_occurrence(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        first = self.adapter.find("Hello")
+        second = self.adapter.find("Hello")
+
+        first.add_response(Response("Hi"))
+        second.add_response(Response("Hi"))
+        self.adapter.update(first)
+        self.adapter.update(second)
+
+        result = self.adapter.find("Hello")
+
+        self.assertEqual(result.in_response_to[0].occurrence, 3)
+
+    def test_update_saves_added_and_removed_responses(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        statement = self.adapter.find("Hello")
+        statement.remove_response("Hi")
+        statement.add_response(Response("Hey"))
+        statement.add_extra_data("pos_tags", "NN")
+        self.adapter.update(statement)
+
+        result = self.adapter.find("Hello")
+
+        self.assertEqual(result.in_response_to, ["Hey"])
+        self.assertEqual(result.extra_data, {"pos_tags": "NN"})
+        self.assertIsNotNone(self.adapter.find("Hey"))
+
+    def test_find_many(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        results = self.adapter.find_many(["Hello", "Hi", "Hey"])
+
+        self.assertEqual(len(results), 2)
+        self.assertIn("Hello", results)
+        self.assertIn("Hi", results)
+
+    def test_bulk_update(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        statement = self.adapter.find("Hello")
+        statement.add_response(Response("Hi"))
+
+        self.adapter.bulk_update([
+            statement,
+            Statement("How are you?", in_response_to=[Response("Hello")])
+        ])
+
+        self.assertEqual(self.adapter.count(), 3)
+        self.assertEqual(self.adapter.find("Hello").in_response_to[0].occurrence, 2)
+        self.assertEqual(self.adapter.find("How are you?").in_response_to, ["Hello"])
+
+    def test_drop_clears_indexes(self):
+        from chatterbot.indexes import StatementIndex
+
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        index = StatementIndex()
+        index.build(self.adapter)
+        self.adapter.get_response_statements()
+
+        self.adapter.drop()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(self.adapter.get_response_statements(), [])
+
+
+class SQLiteStorageAdapterFilterTestCase(SQLiteAdapterTestCase):
+
+    def setUp(self):
+        super(SQLiteStorageAdapterFilterTestCase, self).setUp()
+
+        self.statement1 = Statement(
+            "Testing...",
+            in_response_to=[
+                Response("Why are you counting?")
+            ]
+        )
+        self.statement2 = Statement(
+            "Testing one, two, three.",
+            in_response_to=[
+                Response("Testing...")
+            ]
+        )
+
+    def test_filter_text_no_matches(self):
+        self.adapter.update(self.statement1)
+        results = self.adapter.filter(text="Howdy")
+
+        self.assertEqual(len(results), 0)
+
+    def test_filter_in_response_to_no_matches(self):
+        self.adapter.update(self.statement1)
+
+        results = self.adapter.filter(
+            in_response_to=[Response("Maybe")]
+        )
+        self.assertEqual(len(results), 0)
+
+    def test_filter_equal_results(self):
+        statement1 = Statement(
+            "Testing...",
+            in_response_to=[]
+        )
+        statement2 = Statement(
+            "Testing one, two, three.",
+            in_response_to=[]
+        )
+        self.adapter.update(statement1)
+        self.adapter.update(statement2)
+
+        results = self.adapter.filter(in_response_to=[])
+        self.assertEqual(len(results), 2)
+        self.assertIn(statement1, results)
+        self.assertIn(statement2, results)
+
+    def test_filter_contains_result(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains="Why are you counting?"
+        )
+        self.assertEqual(len(results), 1)
+        self.assertIn(self.statement1, results)
+
+    def test_filter_contains_any_of_list(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains=["Why are you counting?", "Testing..."]
+        )
+        self.assertEqual(len(results), 2)
+        self.assertIn(self.statement1, results)
+        self.assertIn(self.statement2, results)
+
+    def test_filter_contains_no_result(self):
+        self.adapter.update(self.statement1)
+
+        results = self.adapter.filter(
+            in_response_to__contains="How do you do?"
+        )
+        self.assertEqual(results, [])
+
+    def test_filter_multiple_parameters(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            text="Testing...",
+            in_response_to__contains="Why are you counting?"
+        )
+
+        self.assertEqual(len(results), 1)
+        self.assertIn(self.statement1, results)
+
+    def test_filter_multiple_parameters_no_results(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            text="Test",
+            in_response_to__contains="Not an existing response."
+        )
+
+        self.assertEqual(len(results), 0)
+
+    def test_filter_extra_data(self):
+        self.statement1.add_extra_data("pos_tags", "NN")
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(extra_data={"pos_tags": "NN"})
+
+        self.assertEqual(results, [self.statement1])
+
+    def test_filter_unsupported_parameter(self):
+        with self.assertRaises(self.adapter.UnsupportedFilterException):
+            self.adapter.filter(speaker="jane")
+
+    def test_filter_no_parameters(self):
+        """
+        If no parameters are passed to the filter,
+        then all statements should be returned.
+        """
+        statement1 = Statement("Testing...")
+        statement2 = Statement("Testing one, two, three.")
+        self.adapter.update(statement1)
+        self.adapter.update(statement2)
+
+        results = self.adapter.filter()
+
+        self.assertEqual(len(results), 2)
+
+    def test_filter_returns_statement_with_multiple_responses(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thanks."),
+                Response("Thank you.")
+            ]
+        )
+        self.adapter.update(statement)
+        response = self.adapter.filter(
+            in_response_to__contains="Thanks."
+        )
+
+        # Get the first response
+        response = response[0]
+
+        self.assertEqual(len(response.in_response_to), 2)
+
+    def test_response_list_in_results(self):
+        """
+        If a statement with response values is found using
+        the filter method, they should be returned as
+        response objects.
+        """
+        statement = Statement(
+            "The first is to help yourself, the second is to help others.",
+            in_response_to=[
+                Response("Why do people have two hands?")
+            ]
+        )
+        self.adapter.update(statement)
+        found = self.adapter.filter(text=statement.text)
+
+        self.assertEqual(len(found[0].in_response_to), 1)
+        self.assertEqual(type(found[0].in_response_to[0]), Response)
+
+
+class ReadOnlySQLiteStorageAdapterTestCase(SQLiteAdapterTestCase):
+
+    def test_update_does_not_add_new_statement(self):
+        self.adapter.read_only = True
+
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertEqual(statement_found, None)
+
+    def test_update_does_not_modify_existing_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        self.adapter.read_only = True
+
+        statement.add_response(
+            Response("New response")
+        )
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertEqual(
+            statement_found.text, statement.text
+        )
+        self.assertEqual(
+            len(statement_found.in_response_to), 0
+        )
@@ -45,3 +45,97 @@ class StorageAdapterTestCase(TestCase):
     def test_drop(self):
         with self.assertRaises(StorageAdapter.AdapterMethodNotImplementedError):
             self.adapter.drop()
+
+
+class ResponseStatementSetTestCase(TestCase):
+    """
+    Tests for keeping the statements that have known responses up to date.
+    """
+
+    def setUp(self):
+        from mock import MagicMock
+
+        self.statements = {
+            'Hi': Statement('Hi'),
+            'Hello': Statement('Hello', in_response_to=[Response('Hi')]),
+            'How are you?': Statement('How are you?', in_response_to=[Response('Hello')]),
+        }
+
+        self.adapter = StorageAdapter()
+        self.adapter.filter = MagicMock(return_value=list(self.statements.values()))
+        self.adapter.find = MagicMock(side_effect=lambda text: self.statements.get(text))
+
+    def get_texts(self):
+        return [statement.text for statement in self.adapter.get_response_statements()]
+
+    def test_get_response_statements(self):
+        self.assertEqual(self.get_texts(), ['Hi', 'Hello'])
+
+    def test_database_searched_once(self):
+        self.adapter.get_response_statements()
+        self.adapter.get_response_statements()
+
+        self.assertEqual(self.adapter.filter.call_count, 1)
+
+    def test_statement_updated(self):
+        self.adapter.get_response_statements()
+
+        statement = Statement('Good', in_response_to=[Response('How are you?')])
+        self.statements['Good'] = statement
+        self.adapter.update_indexes(statement)
+
+        self.assertEqual(self.get_texts(), ['Hi', 'Hello', 'How are you?'])
+        self.adapter.find.assert_called_once_with('How are you?')
+
+    def test_updated_statement_replaced(self):
+        self.adapter.get_response_statements()
+
+        statement = Statement('Hello', in_response_to=[Response('Hi')])
+        self.adapter.update_indexes(statement)
+
+        self.assertIs(self.adapter.get_response_statements()[1], statement)
+
+    def test_statement_removed(self):
+        self.adapter.get_response_statements()
+
+        self.adapter.remove_from_indexes('Hello')
+
+        # "Hi" is no longer a response to any statement
+        self.assertEqual(self.get_texts(), [])
+
+    def test_response_removed_from_statement(self):
+        self.adapter.get_response_statements()
+
+        statement = self.statements['Hello']
+        statement.remove_response('Hi')
+        self.adapter.update_indexes(statement)
+
+        # "Hi" is no longer a response to any statement
+        self.assertEqual(self.get_texts(), ['Hello'])
+        self.assertEqual(
+            self.adapter.get_response_statement_set().get_responses('Hi'), []
+        )
+
+    def test_reset_response_statements(self):
+        self.adapter.get_response_statements()
+        self.adapter.reset_response_statements()
+        self.adapter.get_response_statements()
+
+        self.assertEqual(self.adapter.filter.call_count, 2)
+        self.assertEqual(len(self.adapter.indexes), 1)
+
+    def test_get_responses(self):
+        response_statement_set = self.adapter.get_response_statement_set()
+
+        self.adapter.update_indexes(Statement('Hey', in_response_to=[Response('Hi')]))
+
+        self.assertEqual(response_statement_set.get_responses('Hi'), ['Hello', 'Hey'])
+        self.assertEqual(response_statement_set.get_responses('Hey'), [])
+
+    def test_responses_removed(self):
+        response_statement_set = self.adapter.get_response_statement_set()
+
+        self.adapter.remove_from_indexes('Hello')
+
+        self.assertEqual(response_statement_set.get_responses('Hi'), [])
+        self.assertEqual(response_statement_set.in_response_to['How are you?'], set())
@@ -0,0 +1,147 @@
+from unittest import TestCase
+from tests.base_case import ChatBotMemoryTestCase
+from chatterbot.cache import ResponseCache
+from chatterbot.conversation import Statement, Response
+
+
+class ResponseCacheTests(TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache(max_size=2)
+
+    def test_key_normalized(self):
+        self.assertEqual(
+            self.cache.get_key(Statement('Hello  there')),
+            self.cache.get_key(Statement(' hello there '))
+        )
+
+    def test_key_includes_base_query(self):
+        from chatterbot.storage.mongodb import Query
+
+        self.assertNotEqual(
+            self.cache.get_key(Statement('Hi'), Query({'text': {'$nin': ['Hello']}})),
+            self.cache.get_key(Statement('Hi'))
+        )
+
+    def test_hits_and_misses(self):
+        self.cache.get('a')
+        self.cache.set('a', 1)
+        self.cache.get('a')
+
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_least_recently_used_discarded(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_expired(self):
+        cache = ResponseCache(ttl=0)
+        cache.set('a', 1)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_response_added_to_match(self):
+        self.cache.set('a', 1, matched_texts=['Hi'])
+        self.cache.statement_updated(Statement('Hey', in_response_to=[Response('Hi')]))
+
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_match_saved(self):
+        self.cache.set('a', 1, matched_texts=['Hi'])
+        self.cache.statement_updated(Statement('Hi', in_response_to=[Response('Hey')]))
+
+        self.assertEqual(self.cache.get('a'), 1)
+
+    def test_response_saved(self):
+        self.cache.set('a', 1, response_texts=['Hello'])
+        self.cache.statement_updated(Statement('Hello'))
+
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_match_removed(self):
+        self.cache.set('a', 1, matched_texts=['Hi'])
+        self.cache.statement_removed('Hi')
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.dependents, {})
+
+
+class ChatBotResponseCacheTests(ChatBotMemoryTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotResponseCacheTests, self).get_kwargs()
+        kwargs['response_cache_size'] = 10
+        return kwargs
+
+    def setUp(self):
+        super(ChatBotResponseCacheTests, self).setUp()
+        from chatterbot.trainers import ListTrainer
+
+        self.chatbot.set_trainer(ListTrainer)
+        self.chatbot.train([
+            'What is your quest?',
+            'To seek the Holy Grail.'
+        ])
+
+    def test_repeated_input_cached(self):
+        first_response = self.chatbot.get_response('What is your quest?')
+        second_response = self.chatbot.get_response('what is  your quest?')
+
+        self.assertEqual(first_response, second_response)
+        self.assertEqual(self.chatbot.response_cache.hits, 1)
+        self.assertEqual(self.chatbot.response_cache.misses, 1)
+
+    def test_cache_invalidated_by_new_response(self):
+        self.chatbot.get_response('What is your quest?')
+
+        self.chatbot.train([
+            'What is your quest?',
+            'To find a shrubbery.'
+        ])
+
+        self.chatbot.get_response('What is your quest?')
+
+        self.assertEqual(self.chatbot.response_cache.hits, 0)
+        self.assertEqual(self.chatbot.response_cache.misses, 2)
+
+    def add_counter_adapter(self, **kwargs):
+        """
+        Add a logic adapter that selects a different response each time.
+        """
+        from chatterbot.logic import LogicAdapter
+
+        class CounterAdapter(LogicAdapter):
+
+            def process(self, statement):
+                self.count = getattr(self, 'count', 0) + 1
+                return 1, Statement('Response {}'.format(self.count))
+
+        adapter = CounterAdapter(**kwargs)
+        adapter.set_chatbot(self.chatbot)
+        self.chatbot.logic.adapters.append(adapter)
+
+    def test_response_from_non_deterministic_adapter_not_cached(self):
+        self.add_counter_adapter()
+
+        first_response = self.chatbot.get_response('What time is it?')
+        second_response = self.chatbot.get_response('What time is it?')
+
+        self.assertNotEqual(first_response, second_response)
+        self.assertEqual(len(self.chatbot.response_cache), 0)
+
+    def test_response_from_deterministic_adapter_cached(self):
+        self.add_counter_adapter(deterministic=True)
+
+        first_response = self.chatbot.get_response('What time is it?')
+        second_response = self.chatbot.get_response('What time is it?')
+
+        self.assertEqual(first_response, second_response)
+        self.assertEqual(self.chatbot.response_cache.hits, 1)
@@ -145,3 +145,118 @@ class ChatBotConfigFileTestCase(ChatBotTestCase):
         self.chatbot = ChatBot.from_config(self.config_file_path)
 
         self.assertEqual(self.chatbot.name, self.data['name'])
+
+
+class ChatBotWriteBehindTestCase(ChatBotTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotWriteBehindTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.storage.MemoryStorageAdapter'
+        kwargs['write_behind'] = True
+        kwargs['write_flush_interval'] = 60
+        return kwargs
+
+    def tearDown(self):
+        self.chatbot.write_queue.shutdown()
+        super(ChatBotWriteBehindTestCase, self).tearDown()
+
+    def test_learned_response_saved_on_flush(self):
+        self.chatbot.get_response('Hi')
+
+        self.assertIsNone(self.chatbot.storage.find('Hi'))
+
+        self.chatbot.flush()
+
+        self.assertIsNotNone(self.chatbot.storage.find('Hi'))
+
+    def test_waiting_changes_not_lost(self):
+        self.chatbot.learn_response(Statement('Hi'), Statement('Hello'))
+
+        # The statement is found with the response that has not been saved yet
+        statement = self.chatbot.input.process_input_statement('Hi')
+        self.chatbot.learn_response(statement, Statement('Hey'))
+        self.chatbot.flush()
+
+        self.assertEqual(self.chatbot.storage.find('Hi').in_response_to, ['Hello', 'Hey'])
+
+
+class ChatBotAsyncTestCase(ChatBotTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotAsyncTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.storage.MemoryStorageAdapter'
+        return kwargs
+
+    def setUp(self):
+        import sys
+        from unittest import SkipTest
+
+        if sys.version_info < (3, 5):
+            raise SkipTest('asyncio futures require Python 3.5 or later.')
+
+        import asyncio
+
+        super(ChatBotAsyncTestCase, self).setUp()
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        super(ChatBotAsyncTestCase, self).tearDown()
+
+    def test_aget_response(self):
+        self.chatbot.storage.update(Statement('Hello', in_response_to=[Response('Hi')]))
+
+        response = self.loop.run_until_complete(self.chatbot.aget_response('Hi'))
+
+        self.assertEqual(response, 'Hello')
+
+    def test_aget_response_input_not_processed_on_loop(self):
+        import threading
+        from mock import Mock
+
+        process_input_statement = self.chatbot.input.process_input_statement
+        threads = []
+
+        def process(input_item):
+            threads.append(threading.current_thread())
+            return process_input_statement(input_item)
+
+        self.chatbot.input.process_input_statement = Mock(side_effect=process)
+
+        self.loop.run_until_complete(self.chatbot.aget_response('Hi'))
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.current_thread())
+
+    def test_aget_response_learns_response(self):
+        self.loop.run_until_complete(self.chatbot.aget_response('Hi'))
+        self.loop.run_until_complete(self.chatbot.aget_response('Hello'))
+
+        statement = self.chatbot.storage.find('Hello')
+
+        self.assertIn('Hi', statement.in_response_to)
+
+    def test_afind(self):
+        self.chatbot.storage.update(Statement('Hi'))
+
+        statement = self.loop.run_until_complete(self.chatbot.storage.afind('Hi'))
+
+        self.assertEqual(statement, 'Hi')
+
+    def test_afilter(self):
+        self.chatbot.storage.update(Statement('Hello', in_response_to=[Response('Hi')]))
+
+        statements = self.loop.run_until_complete(
+            self.chatbot.storage.afilter(in_response_to__contains='Hi')
+        )
+
+        self.assertEqual(statements, ['Hello'])
+
+    def test_aget_random_empty_database(self):
+        with self.assertRaises(self.chatbot.storage.EmptyDatabaseException):
+            self.loop.run_until_complete(self.chatbot.storage.aget_random())
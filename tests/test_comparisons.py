@@ -0,0 +1,79 @@
+from unittest import TestCase
+from mock import MagicMock
+from chatterbot.comparisons import Comparator
+from chatterbot.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class WordCountComparator(Comparator):
+
+    precompute_features = True
+
+    def compute_features(self, text):
+        return len(text.split())
+
+    def compare(self, statement, other_statement):
+        counts = [self.get_input_features(statement), self.get_features(other_statement)]
+        return min(counts) / float(max(counts))
+
+
+class ComparatorFeatureTests(TestCase):
+
+    def setUp(self):
+        self.comparator = WordCountComparator()
+        self.comparator.compute_features = MagicMock(
+            side_effect=WordCountComparator.compute_features.__get__(self.comparator)
+        )
+
+    def test_features_cached(self):
+        self.comparator(Statement('Hi there'), Statement('Hello'))
+        self.comparator(Statement('Hi there'), Statement('Hello'))
+
+        # The features of the input are computed each time
+        self.assertEqual(self.comparator.compute_features.call_count, 3)
+        self.assertEqual(self.comparator.features, {'Hello': 1})
+
+    def test_known_input_features_used(self):
+        self.comparator(Statement('Hi you'), Statement('Hi there'))
+        self.comparator(Statement('Hi there'), Statement('Hello'))
+
+        self.assertEqual(self.comparator.compute_features.call_count, 3)
+
+    def test_features_not_pickled(self):
+        import pickle
+
+        self.comparator = WordCountComparator()
+        self.comparator(Statement('Hi there'), Statement('Hello'))
+
+        comparator = pickle.loads(pickle.dumps(self.comparator))
+
+        self.assertEqual(comparator.features, {})
+        self.assertEqual(len(self.comparator.features), 1)
+
+    def test_compare_many(self):
+        results = self.comparator.compare_many(
+            Statement('Hi there'), [Statement('Hello'), Statement('Hi you')]
+        )
+        self.assertEqual(results, [0.5, 1.0])
+
+    def test_features_computed_when_saved(self):
+        storage = StorageAdapter()
+        storage.add_index(self.comparator)
+
+        storage.update_indexes(
+            Statement('How are you?', in_response_to=[Response('Hi there')])
+        )
+
+        self.assertEqual(self.comparator.features, {'How are you?': 3, 'Hi there': 2})
+
+    def test_features_removed(self):
+        self.comparator.get_features(Statement('Hi there'))
+        self.comparator.statement_removed('Hi there')
+
+        self.assertEqual(self.comparator.features, {})
+
+    def test_features_not_precomputed(self):
+        comparator = Comparator()
+        comparator.statement_updated(Statement('Hi there'))
+
+        self.assertEqual(comparator.features, {})
@@ -0,0 +1,365 @@
+from unittest import TestCase
+from mock import MagicMock
+from chatterbot import indexes
+from chatterbot.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class TokenizeTests(TestCase):
+
+    def test_tokenize(self):
+        tokens = indexes.tokenize('What... is your quest?')
+        self.assertEqual(tokens, ['what', 'is', 'your', 'quest'])
+
+
+class StatementIndexResponseTests(TestCase):
+
+    def setUp(self):
+        from chatterbot.storage import MemoryStorageAdapter
+
+        self.storage = MemoryStorageAdapter()
+        self.storage.update(Statement('good morning', in_response_to=[Response('hello there')]))
+        self.storage.update(Statement('hello there', in_response_to=[Response('hi')]))
+
+        self.index = indexes.TokenIndex()
+        self.index.build(self.storage)
+
+    def test_statement_without_response_removed(self):
+        self.storage.remove('good morning')
+
+        self.assertNotIn('hello there', self.index)
+        self.assertEqual(self.index.candidates(Statement('hello there')), [])
+        self.assertIn('hi', self.index)
+
+    def test_statement_with_other_response_kept(self):
+        self.storage.update(Statement('hey', in_response_to=[Response('hello there')]))
+        self.storage.remove('good morning')
+
+        self.assertIn('hello there', self.index)
+
+    def test_removed_response_removes_statement(self):
+        statement = self.storage.find('hello there')
+        statement.remove_response('hi')
+        self.storage.update(statement)
+
+        self.assertNotIn('hi', self.index)
+        self.assertIn('hello there', self.index)
+
+
+class StatementIndexThreadTests(TestCase):
+
+    def test_updated_while_searched(self):
+        import threading
+
+        storage = StorageAdapter()
+        storage.filter = MagicMock(return_value=[])
+        storage.find = MagicMock(return_value=None)
+
+        index = indexes.TokenIndex(index_candidate_limit=None)
+        index.build(storage)
+
+        def update():
+            for number in range(2000):
+                storage.update_indexes(Statement(
+                    'Hi', in_response_to=[Response('hello number {}'.format(number))]
+                ))
+
+        thread = threading.Thread(target=update)
+        thread.start()
+
+        while thread.is_alive():
+            index.candidates(Statement('hello number'))
+            index.get_statements()
+
+        thread.join()
+
+        self.assertEqual(len(index.candidates(Statement('hello number'))), 1)
+
+
+class TokenIndexTests(TestCase):
+
+    def setUp(self):
+        self.storage = StorageAdapter()
+        self.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('Who are you?')]),
+            Statement('Who are you?', in_response_to=[Response('What is your quest?')]),
+            Statement('I like green eggs.', in_response_to=[Response('Who are you?')]),
+        ])
+        self.storage.find = MagicMock(return_value=None)
+
+        self.index = indexes.TokenIndex()
+        self.index.build(self.storage)
+
+    def test_build(self):
+        self.assertEqual(len(self.index), 2)
+        self.assertIn('Who are you?', self.index)
+        self.assertNotIn('I like green eggs.', self.index)
+
+    def test_build_registers_index(self):
+        self.assertIn(self.index, self.storage.indexes)
+
+    def test_candidates_share_tokens(self):
+        candidates = self.index.candidates(Statement('what is the quest'))
+        self.assertEqual(candidates, ['What is your quest?'])
+
+    def test_candidates_ordered_by_shared_tokens(self):
+        candidates = self.index.candidates(Statement('who is your quest'))
+        self.assertEqual(candidates[0], 'What is your quest?')
+        self.assertEqual(len(candidates), 2)
+
+    def test_candidate_limit(self):
+        self.index.candidate_limit = 1
+        candidates = self.index.candidates(Statement('who is your quest'))
+        self.assertEqual(len(candidates), 1)
+
+    def test_no_candidates(self):
+        candidates = self.index.candidates(Statement('Green eggs and ham'))
+        self.assertEqual(candidates, [])
+
+    def test_statement_updated_adds_responses(self):
+        self.storage.update_indexes(
+            Statement('Hello', in_response_to=[Response('Green eggs and ham')])
+        )
+        candidates = self.index.candidates(Statement('green eggs'))
+
+        self.assertEqual(candidates, ['Green eggs and ham'])
+        self.storage.find.assert_called_with('Green eggs and ham')
+
+    def test_statement_updated_replaces_statement(self):
+        statement = Statement('Who are you?', in_response_to=[Response('Hello')])
+        self.storage.update_indexes(statement)
+
+        self.assertIs(self.index.get_statement('Who are you?'), statement)
+
+    def test_statement_removed(self):
+        self.storage.remove_from_indexes('Who are you?')
+
+        self.assertNotIn('Who are you?', self.index)
+        self.assertNotIn('who', self.index.tokens)
+        self.assertEqual(self.index.candidates(Statement('who')), [])
+
+    def test_unbuilt_index_ignores_updates(self):
+        index = indexes.TokenIndex()
+        index.statement_updated(
+            Statement('Hello', in_response_to=[Response('Hi')])
+        )
+        self.assertEqual(len(index), 0)
+
+
+class TrigramIndexTests(TestCase):
+
+    def setUp(self):
+        self.storage = StorageAdapter()
+        self.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('xxyy')]),
+            Statement('xxyy', in_response_to=[Response('What is your quest?')]),
+        ])
+
+        self.index = indexes.TrigramIndex()
+        self.index.build(self.storage)
+
+    def test_trigrams(self):
+        self.assertEqual(indexes.trigrams('Hi'), set(['  h', ' hi', 'hi ']))
+
+    def test_candidates_share_trigrams(self):
+        candidates = self.index.candidates(Statement('What is the quest?'))
+        self.assertEqual(candidates, ['What is your quest?'])
+
+    def test_bounded_candidates_by_length(self):
+        candidates = self.index.bounded_candidates(Statement('wwxx'), 0)
+        self.assertEqual(candidates, ['xxyy', 'What is your quest?'])
+
+    def test_bounded_candidates_minimum_confidence(self):
+        candidates = self.index.bounded_candidates(Statement('wwxx'), 0.5)
+        self.assertEqual(candidates, ['xxyy'])
+
+    def test_bounded_candidates_exclude(self):
+        candidates = self.index.bounded_candidates(
+            Statement('wwxx'), 0, exclude=[Statement('xxyy')]
+        )
+        self.assertEqual(candidates, ['What is your quest?'])
+
+    def test_statement_removed(self):
+        self.storage.remove_from_indexes('xxyy')
+
+        self.assertNotIn(4, self.index.lengths)
+        self.assertEqual(self.index.candidates(Statement('xxyy')), [])
+
+
+class MinHashIndexTests(TestCase):
+
+    def setUp(self):
+        self.storage = StorageAdapter()
+        self.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('I like green eggs and ham.')]),
+            Statement('I like green eggs and ham.', in_response_to=[Response('What is your quest?')]),
+            Statement('Hello', in_response_to=[Response('I like green eggs and ham.')]),
+        ])
+        self.storage.count = MagicMock(return_value=2)
+
+        self.index = indexes.MinHashIndex(minhash_bands=32, minhash_rows=2)
+        self.index.build(self.storage)
+
+    def test_shingles(self):
+        self.assertEqual(indexes.shingles('What is it', 2), set(['what is', 'is it']))
+        self.assertEqual(indexes.shingles('What', 2), set(['what']))
+        self.assertEqual(indexes.shingles('?', 2), set())
+
+    def test_signature_length(self):
+        signature = self.index.get_signature('What is your quest?')
+        self.assertEqual(len(signature), 64)
+
+    def test_signature_is_deterministic(self):
+        other_index = indexes.MinHashIndex(minhash_bands=32, minhash_rows=2)
+        self.assertEqual(
+            self.index.get_signature('What is your quest?'),
+            other_index.get_signature('What is your quest?')
+        )
+
+    def test_identical_statement_is_candidate(self):
+        candidates = self.index.candidates(Statement('what is your quest'))
+        self.assertEqual(candidates[0], 'What is your quest?')
+
+    def test_similar_statement_is_candidate(self):
+        candidates = self.index.candidates(Statement('What is your favorite quest?'))
+        self.assertIn('What is your quest?', candidates)
+
+    def test_dissimilar_statement_is_not_candidate(self):
+        candidates = self.index.candidates(Statement('Purple monkey dishwasher'))
+        self.assertEqual(candidates, [])
+
+    def test_statement_removed(self):
+        self.storage.remove_from_indexes('What is your quest?')
+
+        self.assertEqual(self.index.candidates(Statement('what is your quest')), [])
+        self.assertEqual(len(self.index.buckets), 32)
+
+
+class IndexPersistenceTests(TestCase):
+
+    def setUp(self):
+        import tempfile
+        import os
+
+        self.storage = StorageAdapter()
+        self.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('Who are you?')]),
+            Statement('Who are you?', in_response_to=[Response('What is your quest?')]),
+        ])
+        self.storage.count = MagicMock(return_value=2)
+        self.storage.find = MagicMock(return_value=None)
+
+        self.index = indexes.MinHashIndex()
+        self.index.build(self.storage)
+
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'index.minhash')
+        self.index.save(self.file_path)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_load(self):
+        index = indexes.MinHashIndex()
+        loaded = index.load(self.file_path, self.storage)
+
+        self.assertTrue(loaded)
+        self.assertTrue(index.built)
+        self.assertIn(index, self.storage.indexes)
+        self.assertEqual(index.buckets, self.index.buckets)
+        self.assertEqual(index.candidates(Statement('Who are you?')), ['Who are you?'])
+
+    def test_load_missing_file(self):
+        index = indexes.MinHashIndex()
+        self.assertFalse(index.load(self.file_path + '.missing', self.storage))
+
+    def test_load_different_parameters(self):
+        index = indexes.MinHashIndex(minhash_rows=2)
+        self.assertFalse(index.load(self.file_path, self.storage))
+
+    def test_load_different_index_class(self):
+        index = indexes.TokenIndex()
+        self.assertFalse(index.load(self.file_path, self.storage))
+
+    def test_load_database_changed(self):
+        self.storage.count = MagicMock(return_value=3)
+
+        index = indexes.MinHashIndex()
+        self.assertFalse(index.load(self.file_path, self.storage))
+        self.assertFalse(index.built)
+
+
+class TfidfIndexTests(TestCase):
+
+    def setUp(self):
+        self.storage = StorageAdapter()
+        self.storage.filter = MagicMock(return_value=[
+            Statement('What is your quest?', in_response_to=[Response('What is your name?')]),
+            Statement('What is your name?', in_response_to=[Response('I like green eggs and ham.')]),
+            Statement('I like green eggs and ham.', in_response_to=[Response('What is your quest?')]),
+            Statement('Hello', in_response_to=[Response('What is your name?')]),
+        ])
+        self.storage.find = MagicMock(return_value=None)
+
+        self.index = indexes.TfidfIndex()
+        self.index.build(self.storage)
+
+    def test_exact_match_scores_one(self):
+        matches = self.index.get_top_k(Statement('What is your quest?'), 1)
+
+        self.assertEqual(len(matches), 1)
+        self.assertAlmostEqual(matches[0][0], 1.0)
+        self.assertEqual(matches[0][1], 'What is your quest?')
+
+    def test_top_k_order(self):
+        matches = self.index.get_top_k(Statement('your quest'), 3)
+        texts = [match.text for confidence, match in matches]
+
+        self.assertEqual(texts, ['What is your quest?', 'What is your name?'])
+        self.assertGreater(matches[0][0], matches[1][0])
+
+    def test_rare_words_have_greater_weight(self):
+        matches = self.index.get_top_k(Statement('what green'), 1)
+        self.assertEqual(matches[0][1], 'I like green eggs and ham.')
+
+    def test_no_shared_words(self):
+        self.assertEqual(self.index.get_top_k(Statement('Purple monkey'), 3), [])
+
+    def test_candidates(self):
+        self.index.candidate_limit = 1
+        self.assertEqual(self.index.candidates(Statement('your name')), ['What is your name?'])
+
+    def test_statement_updated_adds_row(self):
+        self.storage.update_indexes(
+            Statement('Hi', in_response_to=[Response('Purple monkey dishwasher')])
+        )
+        matches = self.index.get_top_k(Statement('Purple monkey'), 3)
+
+        self.assertEqual(len(self.index.row_texts), 4)
+        self.assertEqual(matches[0][1], 'Purple monkey dishwasher')
+
+    def test_statement_removed(self):
+        self.storage.remove_from_indexes('What is your quest?')
+        matches = self.index.get_top_k(Statement('What is your quest?'), 3)
+
+        self.assertEqual([match.text for confidence, match in matches], ['What is your name?'])
+
+    def test_removed_rows_kept_until_compaction(self):
+        self.index.compaction_fraction = 0.5
+        self.storage.remove_from_indexes('What is your quest?')
+
+        self.assertEqual(self.index.removed_rows, [0])
+        self.assertEqual(len(self.index.row_texts), 3)
+
+    def test_compaction(self):
+        self.index.compaction_fraction = 0.5
+        self.storage.remove_from_indexes('What is your quest?')
+        self.storage.remove_from_indexes('I like green eggs and ham.')
+
+        matches = self.index.get_top_k(Statement('What is your name?'), 3)
+
+        self.assertEqual(self.index.row_texts, ['What is your name?'])
+        self.assertEqual(self.index.removed_rows, [])
+        self.assertEqual([match.text for confidence, match in matches], ['What is your name?'])
+        self.assertAlmostEqual(matches[0][0], 1.0)
@@ -0,0 +1,78 @@
+from unittest import TestCase
+from mock import MagicMock
+from chatterbot.comparisons import levenshtein_distance
+from chatterbot.conversation import Statement, Response
+from chatterbot.parallel import StatementShards
+from chatterbot.storage import StorageAdapter
+
+
+class StatementShardsTestCase(TestCase):
+
+    def setUp(self):
+        self.storage = StorageAdapter()
+        self.storage.find = MagicMock(side_effect=lambda text: Statement(text))
+        self.storage.filter = MagicMock(return_value=[])
+
+        self.shards = StatementShards(levenshtein_distance, worker_count=2)
+        self.shards.build(self.storage, [
+            Statement('What is your quest?'),
+            Statement('I am Iron Man.'),
+            Statement('Who do you love?'),
+            Statement('What is the meaning of life?'),
+            Statement('What is your quest?!'),
+        ])
+
+    def tearDown(self):
+        self.shards.shutdown()
+
+    def test_statements_split_across_shards(self):
+        self.assertEqual(len(self.shards.executors), 2)
+        self.assertEqual(self.shards.shard_sizes, [3, 2])
+        self.assertEqual(len(self.shards), 5)
+
+    def test_registered_with_storage(self):
+        self.assertIn(self.shards, self.storage.indexes)
+
+    def test_get_top_k(self):
+        matches = self.shards.get_top_k(Statement('What is your quest'), 2)
+
+        self.assertEqual(
+            [statement.text for confidence, statement in matches],
+            ['What is your quest?', 'What is your quest?!']
+        )
+        self.assertGreater(matches[0][0], matches[1][0])
+
+    def test_statement_updated(self):
+        self.storage.update_indexes(
+            Statement('Hello', in_response_to=[Response('Tell me about the moon')])
+        )
+
+        matches = self.shards.get_top_k(Statement('Tell me about the moon'), 1)
+
+        self.assertEqual(self.shards.shard_sizes, [3, 3])
+        self.assertEqual(matches[0][0], 1)
+        self.assertEqual(matches[0][1], 'Tell me about the moon')
+
+    def test_statement_removed(self):
+        self.storage.remove_from_indexes('What is your quest?')
+
+        matches = self.shards.get_top_k(Statement('What is your quest?'), 1)
+
+        self.assertEqual(len(self.shards), 4)
+        self.assertEqual(matches[0][1], 'What is your quest?!')
+
+    def test_statement_without_response_removed(self):
+        self.storage.update_indexes(
+            Statement('Hello', in_response_to=[Response('Tell me about the moon')])
+        )
+        self.storage.remove_from_indexes('Hello')
+
+        self.assertEqual(len(self.shards), 5)
+        self.assertEqual(self.shards.shard_sizes, [3, 2])
+
+    def test_shutdown(self):
+        self.shards.shutdown()
+
+        self.assertFalse(self.shards.built)
+        self.assertEqual(self.shards.executors, [])
+        self.assertNotIn(self.shards, self.storage.indexes)
@@ -1,5 +1,7 @@
 from unittest import TestCase
+from mock import MagicMock
 from chatterbot import queues
+from chatterbot.conversation import Statement, Response
 
 
 class FixedSizeQueueTests(TestCase):
@@ -78,3 +80,132 @@ class ResponseQueueTests(TestCase):
 
         last_statement = self.queue.get_last_input_statement()
         self.assertEqual(last_statement, 'Test statement 2')
+
+
+class WriteBehindQueueTests(TestCase):
+
+    def setUp(self):
+        from chatterbot.storage import MemoryStorageAdapter
+
+        self.storage = MemoryStorageAdapter()
+        self.queue = queues.WriteBehindQueue(self.storage, batch_size=3, flush_interval=60)
+
+    def tearDown(self):
+        self.queue.shutdown()
+
+    def test_statement_not_saved_before_flush(self):
+        self.queue.put(Statement('Hi'))
+
+        self.assertEqual(len(self.queue), 1)
+        self.assertIsNone(self.storage.find('Hi'))
+
+    def test_flush(self):
+        self.queue.put(Statement('Hi'))
+        self.queue.flush()
+
+        self.assertEqual(len(self.queue), 0)
+        self.assertIsNotNone(self.storage.find('Hi'))
+
+    def test_updates_coalesced(self):
+        self.storage.update = MagicMock()
+
+        statement = Statement('Hi')
+        self.queue.put(statement)
+        statement.add_response(Response('Hello'))
+        self.queue.put(statement)
+        self.queue.flush()
+
+        self.assertEqual(self.storage.update.call_count, 1)
+        self.assertEqual(self.storage.update.call_args[0][0].in_response_to, ['Hello'])
+
+    def test_find_waiting_statement(self):
+        self.queue.put(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        statement = self.queue.find('Hi')
+
+        self.assertEqual(statement.in_response_to, ['Hello'])
+
+    def test_find_saved_statement(self):
+        self.storage.update(Statement('Hi'))
+
+        self.assertEqual(self.queue.find('Hi'), 'Hi')
+
+    def test_later_changes_not_saved(self):
+        statement = Statement('Hi')
+        self.queue.put(statement)
+        statement.add_response(Response('Hello'))
+        self.queue.flush()
+
+        self.assertEqual(self.storage.find('Hi').in_response_to, [])
+
+    def test_only_changes_saved(self):
+        self.storage.update(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        statement = self.storage.find('Hi')
+        statement.add_response(Response('Hey'))
+        self.queue.put(statement)
+
+        changes = self.queue.pending['Hi'].get_changes()
+
+        self.assertEqual(changes['added_responses'], ['Hey'])
+        self.assertFalse(statement.has_changes())
+
+    def test_changes_counted_once(self):
+        self.storage.update(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        statement = self.storage.find('Hi')
+        statement.add_response(Response('Hello'))
+        self.queue.put(statement)
+        self.queue.flush()
+
+        statement.add_response(Response('Hello'))
+        self.queue.put(statement)
+
+        changes = self.queue.pending['Hi'].get_changes()
+
+        self.assertEqual(changes['occurrence_changes'], [(Response('Hello'), 1)])
+
+    def test_changes_combined_while_waiting(self):
+        self.storage.update(Statement('Hi'))
+
+        statement = self.storage.find('Hi')
+        statement.add_response(Response('Hello'))
+        self.queue.put(statement)
+        statement.add_response(Response('Hey'))
+        self.queue.put(statement)
+
+        changes = self.queue.pending['Hi'].get_changes()
+
+        self.assertEqual(changes['added_responses'], ['Hello', 'Hey'])
+
+    def test_batch_saved_in_background(self):
+        import time
+
+        for text in ['A', 'B', 'C']:
+            self.queue.put(Statement(text))
+
+        for _ in range(100):
+            if self.storage.count() == 3:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.storage.count(), 3)
+
+    def test_shutdown_saves_statements(self):
+        self.queue.put(Statement('Hi'))
+        self.queue.shutdown()
+
+        self.assertFalse(self.queue.running)
+        self.assertIsNotNone(self.storage.find('Hi'))
+
+    def test_failed_statement_saved_later(self):
+        self.storage.update = MagicMock(side_effect=Exception('Unavailable'))
+        self.queue.logger = MagicMock()
+
+        self.queue.put(Statement('Hi'))
+        self.queue.flush()
+
+        self.assertEqual(list(self.queue.pending), ['Hi'])
+        self.assertTrue(self.queue.logger.exception.called)
+
+        self.queue.pending.clear()
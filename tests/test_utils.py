@@ -75,3 +75,50 @@ class CleanTests(TestCase):
         normal_text = "Kluft skrams infor pa federal electoral groe"
 
         self.assertEqual(clean_text, normal_text)
+
+
+class ChainFutureTests(TestCase):
+
+    def setUp(self):
+        import sys
+        from unittest import SkipTest
+
+        if sys.version_info < (3, 5):
+            raise SkipTest('asyncio futures require Python 3.5 or later.')
+
+        import asyncio
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def completed_future(self, value):
+        import asyncio
+
+        future = asyncio.Future(loop=self.loop)
+        future.set_result(value)
+        return future
+
+    def test_result(self):
+        future = utils.chain_future(self.completed_future(1), lambda value: value + 1)
+
+        self.assertEqual(self.loop.run_until_complete(future), 2)
+
+    def test_future_returned(self):
+        future = utils.chain_future(
+            self.completed_future(1),
+            lambda value: self.completed_future(value + 2)
+        )
+
+        self.assertEqual(self.loop.run_until_complete(future), 3)
+
+    def test_exception(self):
+        future = utils.chain_future(self.completed_future(0), lambda value: 1 / value)
+
+        with self.assertRaises(ZeroDivisionError):
+            self.loop.run_until_complete(future)
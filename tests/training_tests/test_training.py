@@ -1,5 +1,6 @@
-from tests.base_case import ChatBotTestCase
-from chatterbot.trainers import ListTrainer
+from mock import MagicMock
+from tests.base_case import ChatBotTestCase, ChatBotSQLiteTestCase
+from chatterbot.trainers import ListTrainer, ChatterBotCorpusTrainer
 
 
 class TrainingTests(ChatBotTestCase):
@@ -7,3 +8,55 @@ class TrainingTests(ChatBotTestCase):
     def test_trainer_not_set(self):
         with self.assertRaises(ListTrainer.TrainerInitializationException):
             self.chatbot.train()
+
+
+class BulkTrainingTests(ChatBotSQLiteTestCase):
+
+    def setUp(self):
+        super(BulkTrainingTests, self).setUp()
+        self.trainer = ListTrainer(self.chatbot.storage)
+
+    def test_occurrences_counted(self):
+        self.trainer.bulk_train([
+            ['Hello', 'Hi'],
+            ['Hello', 'Hi'],
+            ['Hey', 'Hi']
+        ])
+
+        statement = self.chatbot.storage.find('Hi')
+
+        self.assertEqual(statement.get_response_count(self.chatbot.storage.find('Hello')), 2)
+        self.assertEqual(statement.get_response_count(self.chatbot.storage.find('Hey')), 1)
+
+    def test_occurrences_added_to_saved_statements(self):
+        self.trainer.bulk_train([['Hello', 'Hi']])
+        self.trainer.bulk_train([['Hello', 'Hi'], ['Hey', 'Hi']])
+
+        statement = self.chatbot.storage.find('Hi')
+
+        self.assertEqual(len(statement.in_response_to), 2)
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
+
+    def test_statements_saved_with_one_bulk_update(self):
+        self.chatbot.storage.update = MagicMock()
+        self.chatbot.storage.find = MagicMock()
+
+        self.trainer.train(['Hello', 'Hi', 'How are you?'])
+
+        self.assertFalse(self.chatbot.storage.update.called)
+        self.assertFalse(self.chatbot.storage.find.called)
+        self.assertEqual(self.chatbot.storage.count(), 3)
+
+    def test_corpus_trained_with_one_bulk_update(self):
+        self.chatbot.storage.bulk_update = MagicMock(
+            side_effect=self.chatbot.storage.bulk_update
+        )
+        trainer = ChatterBotCorpusTrainer(self.chatbot.storage)
+
+        trainer.train(
+            'chatterbot.corpus.english.greetings',
+            'chatterbot.corpus.english.conversations'
+        )
+
+        self.assertEqual(self.chatbot.storage.bulk_update.call_count, 1)
+        self.assertIsNotNone(self.chatbot.storage.find('Hello'))
@@ -4,8 +4,49 @@ import tarfile
 import os
 from mock import Mock
 
-from tests.base_case import ChatBotTestCase
+from tests.base_case import ChatBotTestCase, ChatBotSQLiteTestCase
 from chatterbot.trainers import UbuntuCorpusTrainer
+from chatterbot.conversation import Statement
+
+
+def create_test_corpus(data_directory):
+    """
+    Create a small tar in a similar format to the
+    Ubuntu corpus file in memory for testing.
+    """
+    file_path = os.path.join(data_directory, 'ubuntu_dialogs.tgz')
+    tar = tarfile.TarFile(file_path, 'w')
+
+    data1 = (
+        b'2004-11-04T16:49:00.000Z	tom	jane	Hello\n' +
+        b'2004-11-04T16:49:00.000Z	tom	jane	Is anyone there?\n' +
+        b'2004-11-04T16:49:00.000Z	jane		Yes\n' +
+        b'\n'
+    )
+
+    data2 = (
+        b'2004-11-04T16:49:00.000Z	tom	jane	Hello\n' +
+        b'2004-11-04T16:49:00.000Z	tom		Is anyone there?\n' +
+        b'2004-11-04T16:49:00.000Z	jane		Yes\n' +
+        b'\n'
+    )
+
+    tsv1 = BytesIO(data1)
+    tsv2 = BytesIO(data2)
+
+    tarinfo = tarfile.TarInfo('ubuntu_dialogs/3/1.tsv')
+    tarinfo.size = len(data1)
+    tar.addfile(tarinfo, fileobj=tsv1)
+
+    tarinfo = tarfile.TarInfo('ubuntu_dialogs/3/2.tsv')
+    tarinfo.size = len(data2)
+    tar.addfile(tarinfo, fileobj=tsv2)
+
+    tsv1.close()
+    tsv2.close()
+    tar.close()
+
+    return file_path
 
 
 class UbuntuCorpusTrainerTestCase(ChatBotTestCase):
@@ -26,43 +67,7 @@ class UbuntuCorpusTrainerTestCase(ChatBotTestCase):
             shutil.rmtree(self.chatbot.trainer.data_directory)
 
     def _create_test_corpus(self):
-        """
-        Create a small tar in a similar format to the
-        Ubuntu corpus file in memory for testing.
-        """
-        file_path = os.path.join(self.chatbot.trainer.data_directory, 'ubuntu_dialogs.tgz')
-        tar = tarfile.TarFile(file_path, 'w')
-
-        data1 = (
-            b'2004-11-04T16:49:00.000Z	tom	jane	Hello\n' +
-            b'2004-11-04T16:49:00.000Z	tom	jane	Is anyone there?\n' +
-            b'2004-11-04T16:49:00.000Z	jane		Yes\n' +
-            b'\n'
-        )
-
-        data2 = (
-            b'2004-11-04T16:49:00.000Z	tom	jane	Hello\n' +
-            b'2004-11-04T16:49:00.000Z	tom		Is anyone there?\n' +
-            b'2004-11-04T16:49:00.000Z	jane		Yes\n' +
-            b'\n'
-        )
-
-        tsv1 = BytesIO(data1)
-        tsv2 = BytesIO(data2)
-
-        tarinfo = tarfile.TarInfo('ubuntu_dialogs/3/1.tsv')
-        tarinfo.size = len(data1)
-        tar.addfile(tarinfo, fileobj=tsv1)
-
-        tarinfo = tarfile.TarInfo('ubuntu_dialogs/3/2.tsv')
-        tarinfo.size = len(data2)
-        tar.addfile(tarinfo, fileobj=tsv2)
-
-        tsv1.close()
-        tsv2.close()
-        tar.close()
-
-        return file_path
+        return create_test_corpus(self.chatbot.trainer.data_directory)
 
     def _destroy_test_corpus(self):
         """
@@ -161,3 +166,92 @@ class UbuntuCorpusTrainerTestCase(ChatBotTestCase):
 
         response = self.chatbot.get_response('Is anyone there?')
         self.assertEqual(response, 'Yes')
+
+
+class UbuntuCorpusBatchTrainingTestCase(ChatBotSQLiteTestCase):
+    """
+    Test that the Ubuntu Corpus trainer saves statements in batches.
+    """
+
+    def setUp(self):
+        super(UbuntuCorpusBatchTrainingTestCase, self).setUp()
+        self.chatbot.set_trainer(
+            UbuntuCorpusTrainer,
+            ubuntu_corpus_batch_size=1,
+            ubuntu_corpus_worker_count=2
+        )
+        self.chatbot.storage.bulk_update = Mock(
+            side_effect=self.chatbot.storage.bulk_update
+        )
+
+    def tearDown(self):
+        super(UbuntuCorpusBatchTrainingTestCase, self).tearDown()
+        import shutil
+
+        if os.path.exists(self.chatbot.trainer.data_directory):
+            shutil.rmtree(self.chatbot.trainer.data_directory)
+
+    def _create_test_corpus(self):
+        return create_test_corpus(self.chatbot.trainer.data_directory)
+
+    def test_train(self):
+        self._create_test_corpus()
+        self.chatbot.train()
+
+        statement = self.chatbot.storage.find('Yes')
+
+        self.assertEqual(statement.in_response_to, ['Is anyone there?'])
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
+        self.assertEqual(statement.extra_data['speaker'], 'jane')
+
+    def test_each_batch_saved(self):
+        self._create_test_corpus()
+        self.chatbot.train()
+
+        self.assertEqual(self.chatbot.storage.bulk_update.call_count, 2)
+
+    def test_checkpoint_written(self):
+        self._create_test_corpus()
+        self.chatbot.train()
+
+        self.assertEqual(self.chatbot.trainer.read_checkpoint(), set([
+            os.path.join('3', '1.tsv'),
+            os.path.join('3', '2.tsv')
+        ]))
+
+    def test_completed_files_skipped(self):
+        self._create_test_corpus()
+        self.chatbot.storage.update(Statement('Hello'))
+        self.chatbot.trainer.write_checkpoint([os.path.join('3', '1.tsv')])
+        self.chatbot.train()
+
+        statement = self.chatbot.storage.find('Yes')
+
+        self.assertEqual(self.chatbot.storage.bulk_update.call_count, 1)
+        self.assertEqual(statement.in_response_to[0].occurrence, 1)
+
+    def test_checkpoint_not_used_for_another_database(self):
+        from chatterbot.storage import MemoryStorageAdapter
+
+        self.chatbot.trainer.write_checkpoint([os.path.join('3', '1.tsv')])
+
+        trainer = UbuntuCorpusTrainer(
+            MemoryStorageAdapter(),
+            ubuntu_corpus_data_directory=self.chatbot.trainer.data_directory
+        )
+
+        self.assertEqual(trainer.read_checkpoint(), set())
+        self.assertFalse(os.path.exists(trainer.checkpoint_path))
+
+    def test_checkpoint_cleared_for_empty_database(self):
+        self._create_test_corpus()
+        self.chatbot.trainer.write_checkpoint([
+            os.path.join('3', '1.tsv'),
+            os.path.join('3', '2.tsv')
+        ])
+        self.chatbot.train()
+
+        statement = self.chatbot.storage.find('Yes')
+
+        self.assertEqual(self.chatbot.storage.bulk_update.call_count, 2)
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
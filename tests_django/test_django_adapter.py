@@ -93,6 +93,37 @@ class DjangoStorageAdapterTestCase(DjangoAdapterTestCase):
         random_statement = self.adapter.get_random()
         self.assertEqual(random_statement.text, statement.text)
 
+    def test_get_random_empty_database(self):
+        with self.assertRaises(DjangoStorageAdapter.EmptyDatabaseException):
+            self.adapter.get_random()
+
+    def test_iter_statement_models_in_chunks(self):
+        from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
+
+        for text in ['A', 'B', 'C', 'D', 'E']:
+            self.adapter.update(Statement(text, in_response_to=[Response('Z')]))
+
+        statement_models = list(self.adapter.iter_statement_models(
+            StatementModel.objects.exclude(text='Z'), chunk_size=2
+        ))
+
+        self.assertEqual(
+            [statement_model.text for statement_model in statement_models],
+            ['A', 'B', 'C', 'D', 'E']
+        )
+
+    def test_update_removes_response(self):
+        statement = Statement('Hi', in_response_to=[Response('Hello'), Response('Hey')])
+        self.adapter.update(statement)
+
+        statement.remove_response('Hey')
+        self.adapter.update(statement)
+
+        result = self.adapter.find(statement.text)
+
+        self.assertEqual(len(result.in_response_to), 1)
+        self.assertIn('Hello', result.in_response_to)
+
     def test_find_returns_nested_responses(self):
         response_list = [
             Response("Yes"),